@@ -0,0 +1,411 @@
+"""Benchmark engine."""
+
+import gc
+import json
+import math
+import multiprocessing
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Mapping
+from typing import NamedTuple
+from typing import Sequence
+from typing import Tuple
+from typing import Union
+
+
+RESULTS_VERSION = 1
+"""Version of the JSON results format."""
+
+SUPERLINEAR_EXPONENT = 1.1
+"""Exponent of a fitted cost curve above which growth is deemed super-linear."""
+
+
+class Result(NamedTuple):
+    """Timings of one benchmark."""
+
+    name: str
+    """Name of the benchmark."""
+
+    samples: List[int]
+    """Time taken by each repeat, in nanoseconds."""
+
+    @property
+    def mean(self) -> float:
+        """Mean time in seconds."""
+        return statistics.mean(self.samples) / 1e9
+
+    @property
+    def min(self) -> float:
+        """Minimum time in seconds."""
+        return min(self.samples) / 1e9
+
+    @property
+    def median(self) -> float:
+        """Median time in seconds."""
+        return statistics.median(self.samples) / 1e9
+
+    @property
+    def p95(self) -> float:
+        """95th percentile time in seconds, using the nearest-rank method."""
+        ordered = sorted(self.samples)
+        return ordered[math.ceil(0.95 * len(ordered)) - 1] / 1e9
+
+    @property
+    def stddev(self) -> float:
+        """Sample standard deviation in seconds, or zero for a single sample."""
+        if len(self.samples) < 2:
+            return 0.0
+        return statistics.stdev(self.samples) / 1e9
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a dict, for serialization as JSON."""
+        return {
+            "samples_ns": self.samples,
+            "mean": self.mean,
+            "min": self.min,
+            "median": self.median,
+            "p95": self.p95,
+            "stddev": self.stddev,
+        }
+
+
+def measure(func: Callable[[], Any], repeats: int, warmup: int = 0) -> List[int]:
+    """Time repeated calls to a function.
+
+    Args:
+        func: function to call
+        repeats: number of timed calls
+        warmup: number of untimed calls made first
+
+    Returns:
+        Time taken by each timed call, in nanoseconds
+    """
+    for _i in range(0, warmup):
+        func()
+
+    samples = []
+    for _i in range(0, repeats):
+        start = time.perf_counter_ns()
+        func()
+        samples.append(time.perf_counter_ns() - start)
+    return samples
+
+
+def run(
+    name: str,
+    func: Callable[[], Any],
+    repeats: int,
+    warmup: int = 0,
+    isolate: bool = False,
+) -> Result:
+    """Run a benchmark.
+
+    Args:
+        name: name of the benchmark
+        func: function to call, which must be picklable if ``isolate`` is set
+        repeats: number of timed calls
+        warmup: number of untimed calls made first
+        isolate: run the benchmark in a freshly spawned process, so that it
+                 is not affected by modules imported or caches warmed by
+                 previous benchmarks
+
+    Returns:
+        Timings of the benchmark
+    """
+    if not isolate:
+        return Result(name=name, samples=measure(func, repeats, warmup))
+
+    with ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+        samples = pool.submit(measure, func, repeats, warmup).result()
+    return Result(name=name, samples=samples)
+
+
+class MemoryResult(NamedTuple):
+    """Memory used by one benchmark."""
+
+    name: str
+    """Name of the benchmark."""
+
+    peak: int
+    """Peak memory allocated while the function ran, in bytes."""
+
+    retained: int
+    """Memory still allocated after the function returned, while its result
+    is referenced, in bytes."""
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a dict, for serialization as JSON."""
+        return {"peak": self.peak, "retained": self.retained}
+
+
+def measure_memory(name: str, func: Callable[[], Any], warmup: int = 1) -> MemoryResult:
+    """Measure memory allocated by a function, using tracemalloc.
+
+    Args:
+        name: name of the benchmark
+        func: function to call
+        warmup: number of untraced calls made first, so that modules imported
+                and caches filled on first use are not counted
+
+    Returns:
+        Memory used by the function
+    """
+    for _i in range(0, warmup):
+        func()
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func()
+        gc.collect()
+        (retained, peak) = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+
+    return MemoryResult(name=name, peak=peak, retained=retained)
+
+
+class InstanceSize(NamedTuple):
+    """Sizes of the instances of one class."""
+
+    instances: int
+    """Number of distinct instances."""
+
+    size: int
+    """Total shallow size of the instances, in bytes."""
+
+    @property
+    def mean(self) -> float:
+        """Mean shallow size of an instance, in bytes."""
+        return self.size / self.instances
+
+
+_CONTAINERS = (dict, list, tuple, set, frozenset)
+
+
+def _shallow_size(obj: Any) -> int:
+    """Size of an object plus its per-instance attribute storage."""
+    size = sys.getsizeof(obj)
+    for attr in ("__dict__", "__pydantic_fields_set__"):
+        value = getattr(obj, attr, None)
+        if isinstance(value, _CONTAINERS):
+            size += sys.getsizeof(value)
+    return size
+
+
+def instance_sizes(data: Any, package: str) -> Dict[str, InstanceSize]:
+    """Measure the instances of classes from a package in an object graph.
+
+    Each instance is counted once, however many times it is referenced. The
+    shallow size of an instance comprises the object, its attribute dict if
+    any, and pydantic's set of fields; attribute values are not included.
+
+    Args:
+        data: root of the object graph
+        package: package whose classes are measured
+
+    Returns:
+        Sizes by class name relative to the package, e.g. ``types.Address``
+    """
+    sizes: Dict[str, InstanceSize] = {}
+    seen = set()
+    stack = [data]
+    prefix = f"{package}."
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+
+        cls = type(obj)
+        if cls.__module__.startswith(prefix):
+            name = f"{cls.__module__[len(prefix) :]}.{cls.__qualname__}"
+            (instances, size) = sizes.get(name, (0, 0))
+            sizes[name] = InstanceSize(
+                instances=instances + 1, size=size + _shallow_size(obj)
+            )
+        elif not isinstance(obj, _CONTAINERS):
+            continue
+
+        stack.extend(gc.get_referents(obj))
+
+    return sizes
+
+
+def write_json(
+    path: Union[str, "os.PathLike[str]"],
+    results: Sequence[Result],
+    parameters: Mapping[str, Any],
+    memory: Sequence[MemoryResult] = (),
+) -> None:
+    """Write benchmark results as JSON.
+
+    Args:
+        path: path to output file
+        results: benchmark results
+        parameters: parameters with which the benchmarks were run
+        memory: memory benchmark results
+    """
+    data = {
+        "version": RESULTS_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": dict(parameters),
+        "results": {result.name: result.to_dict() for result in results},
+        "memory": {result.name: result.to_dict() for result in memory},
+    }
+    with open(path, "w") as stream:
+        json.dump(data, stream, indent=2)
+
+
+def _read_results_file(path: Union[str, "os.PathLike[str]"]) -> Dict[str, Any]:
+    """Read a results file written by :func:`write_json`, checking its version."""
+    with open(path) as stream:
+        data = json.load(stream)
+
+    if not isinstance(data, dict) or data.get("version") != RESULTS_VERSION:
+        raise ValueError(f"{path} is not a version {RESULTS_VERSION} results file")
+
+    return data
+
+
+def read_json(path: Union[str, "os.PathLike[str]"]) -> Dict[str, Result]:
+    """Read benchmark results written by :func:`write_json`.
+
+    Args:
+        path: path to results file
+
+    Returns:
+        Results, by name
+
+    Raises:
+        ValueError: if the file is not in a supported format
+    """
+    data = _read_results_file(path)
+    return {
+        name: Result(name=name, samples=value["samples_ns"])
+        for name, value in data["results"].items()
+    }
+
+
+def read_parameters(path: Union[str, "os.PathLike[str]"]) -> Dict[str, Any]:
+    """Read the parameters of benchmark results written by :func:`write_json`.
+
+    Args:
+        path: path to results file
+
+    Returns:
+        Parameters with which the benchmarks were run
+
+    Raises:
+        ValueError: if the file is not in a supported format
+    """
+    return dict(_read_results_file(path)["parameters"])
+
+
+class Comparison(NamedTuple):
+    """Comparison of a benchmark with its baseline."""
+
+    name: str
+    """Name of the benchmark."""
+
+    baseline: float
+    """Median time of the baseline, in seconds."""
+
+    current: float
+    """Median time of the current run, in seconds."""
+
+    @property
+    def change(self) -> float:
+        """Fractional change in time, positive if the benchmark got slower."""
+        return self.current / self.baseline - 1.0
+
+
+def compare(
+    baseline: Mapping[str, Result], results: Sequence[Result]
+) -> List[Comparison]:
+    """Compare benchmark results with a baseline.
+
+    Medians are compared, as they are less sensitive to outliers than means.
+
+    Args:
+        baseline: baseline results, by name
+        results: current results; those without a baseline are skipped
+
+    Returns:
+        Comparisons, in the order of ``results``
+    """
+    return [
+        Comparison(
+            name=result.name,
+            baseline=baseline[result.name].median,
+            current=result.median,
+        )
+        for result in results
+        if result.name in baseline
+    ]
+
+
+def log_spaced(start: int, stop: int, points: int) -> List[int]:
+    """Make logarithmically spaced sizes.
+
+    Args:
+        start: first size
+        stop: last size
+        points: maximum number of sizes; fewer are returned if rounding to
+                integers makes some equal
+
+    Returns:
+        Distinct sizes in increasing order, from ``start`` to ``stop``
+
+    Raises:
+        ValueError: if the range is empty or not positive
+    """
+    if not 0 < start <= stop or points < 1:
+        raise ValueError(f"invalid range {start}..{stop} with {points} points")
+    if points == 1:
+        return [start]
+    ratio = math.log(stop / start) / (points - 1)
+    return sorted({round(start * math.exp(ratio * i)) for i in range(points)})
+
+
+def fit_power_law(
+    sizes: Sequence[float], times: Sequence[float]
+) -> Tuple[float, float]:
+    """Fit a cost curve of the form ``time = coefficient * size ** exponent``.
+
+    The fit is a least-squares line through the logarithms of the points. An
+    exponent of one means that time grows linearly with size.
+
+    Args:
+        sizes: sizes of the inputs
+        times: times taken for each size
+
+    Returns:
+        Coefficient and exponent of the curve
+
+    Raises:
+        ValueError: if there are fewer than two distinct sizes
+    """
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(value) for value in times]
+    x_mean = statistics.mean(xs)
+    y_mean = statistics.mean(ys)
+    sxx = sum((x - x_mean) ** 2 for x in xs)
+    if len(xs) != len(ys) or sxx == 0:
+        raise ValueError("at least two distinct sizes are needed to fit a curve")
+    sxy = sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys))  # noqa: B905
+    exponent = sxy / sxx
+    return (math.exp(y_mean - exponent * x_mean), exponent)
@@ -0,0 +1,279 @@
+"""Caches used when loading data."""
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import pickle  # nosec B403
+import struct
+import threading
+from collections import OrderedDict
+from typing import Any
+from typing import Hashable
+from typing import Iterable
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+DEFAULT_INCLUDE_CACHE_SIZE = 256
+"""Default maximum number of entries in an include cache."""
+
+
+class FileStamp(NamedTuple):
+    """Identifies a version of a file by its modification time and size."""
+
+    path: str
+    """Path to the file."""
+
+    mtime_ns: int
+    """Modification time in nanoseconds."""
+
+    size: int
+    """Size in bytes."""
+
+
+def file_stamp(path: Union[str, "os.PathLike[str]"]) -> FileStamp:
+    """Get the current stamp of a file.
+
+    Args:
+        path: path to the file
+
+    Returns:
+        Stamp of the file
+    """
+    stat = os.stat(path)
+    return FileStamp(path=str(path), mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+
+
+def _is_current(stamp: FileStamp) -> bool:
+    """Check whether a file stamp matches the file on disk."""
+    try:
+        return file_stamp(stamp.path) == stamp
+    except OSError:
+        return False
+
+
+class CacheEntry(NamedTuple):
+    """Data loaded from a file, plus the files from which it was loaded."""
+
+    dependencies: Tuple[FileStamp, ...]
+    """Stamps of the file and all files which it transitively includes."""
+
+    value: Any
+    """Data loaded from the file."""
+
+
+class IncludeCache:
+    """Bounded cache of data loaded from included files.
+
+    Entries are evicted in least-recently-used order once the cache is full,
+    and are invalidated when any of the files from which they were loaded is
+    modified, as detected by a change in modification time or size.
+
+    Cached values are shared between all includes of the same file, so callers
+    must not mutate them. Model objects are frozen, but plain dicts and lists
+    loaded from untagged YAML nodes are not.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_INCLUDE_CACHE_SIZE):
+        """Create include cache.
+
+        Args:
+            maxsize: maximum number of entries
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of entries in the cache."""
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        """Whether there is a current entry for a key.
+
+        Unlike :meth:`get`, this neither updates the counters nor the order of
+        eviction.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and all(
+                _is_current(stamp) for stamp in entry.dependencies
+            )
+
+    def get(self, key: Hashable) -> Optional[CacheEntry]:
+        """Look up an entry, discarding it if it is stale.
+
+        Args:
+            key: cache key
+
+        Returns:
+            Entry, or None if there is no current entry for the key
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if all(_is_current(stamp) for stamp in entry.dependencies):
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: Hashable, entry: CacheEntry) -> None:
+        """Add an entry, evicting the least recently used entry if necessary.
+
+        Args:
+            key: cache key
+            entry: cache entry
+        """
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def discard(self, key: Hashable) -> None:
+        """Remove an entry, if there is one.
+
+        Args:
+            key: cache key
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+
+INCLUDE_CACHE = IncludeCache()
+"""Include cache shared by all loads which opt in by passing it, and populated
+by :func:`~my_data_model.io.preload`. By default, each load has a cache of its
+own, as mutable data in cached values would be shared between loads."""
+
+
+_COMPILED_MAGIC = b"MDMCACHE"
+"""Magic number at the start of a compiled model cache file."""
+
+_COMPILED_VERSION = 2
+"""Version of the compiled model cache file format."""
+
+_COMPILED_HEADER = struct.Struct("<8sII")
+"""Fixed-size prefix of a compiled model cache file: magic, version and the
+size of the JSON header which follows it."""
+
+
+def _compiled_key(package: str, paths: Iterable[str]) -> str:
+    """Compute the key of a compiled model from the content of its files."""
+    digest = hashlib.sha256(package.encode())
+    for path in paths:
+        with open(path, "rb") as stream:
+            content_digest = hashlib.sha256(stream.read()).hexdigest()
+        digest.update(f"\0{path}\0{content_digest}".encode())
+    return digest.hexdigest()
+
+
+def write_compiled(
+    cache_path: Union[str, "os.PathLike[str]"],
+    package: str,
+    paths: Iterable[str],
+    data: Any,
+    validate: bool = True,
+    intern: bool = True,
+) -> None:
+    """Write a model graph to a compiled model cache file.
+
+    Args:
+        cache_path: path to the cache file
+        package: package from which the models were loaded
+        paths: paths to the root data file and all files it transitively includes
+        data: data loaded from the root data file
+        validate: whether the models were validated when loaded
+        intern: whether objects were interned when loaded
+    """
+    my_paths: List[str] = list(dict.fromkeys(paths))
+    key = _compiled_key(package, my_paths)
+    header = json.dumps(
+        {
+            "key": key,
+            "package": package,
+            "paths": my_paths,
+            "validate": validate,
+            "intern": intern,
+        }
+    ).encode()
+
+    tmp_path = f"{os.fspath(cache_path)}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as stream:
+        stream.write(
+            _COMPILED_HEADER.pack(_COMPILED_MAGIC, _COMPILED_VERSION, len(header))
+        )
+        stream.write(header)
+        pickle.dump(data, stream, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, cache_path)
+
+
+def read_compiled(
+    cache_path: Union[str, "os.PathLike[str]"],
+    package: str,
+    validate: bool = True,
+    intern: bool = True,
+) -> Tuple[bool, Any]:
+    """Revive a model graph from a compiled model cache file.
+
+    The cache file is memory-mapped, and objects are revived without running
+    validators. The cache is only used if none of the files from which it was
+    compiled have changed, and if it was compiled with the same options, so
+    that unvalidated data is never revived for a load which validates.
+
+    Args:
+        cache_path: path to the cache file
+        package: package from which models are loaded
+        validate: whether models are validated by the load
+        intern: whether objects are interned by the load
+
+    Returns:
+        Whether the cache is current, and if so the data revived from it
+    """
+    try:
+        with open(cache_path, "rb") as stream, mmap.mmap(
+            stream.fileno(), 0, access=mmap.ACCESS_READ
+        ) as buffer:
+            (magic, version, header_size) = _COMPILED_HEADER.unpack_from(buffer)
+            if magic != _COMPILED_MAGIC or version != _COMPILED_VERSION:
+                return (False, None)
+
+            offset = _COMPILED_HEADER.size
+            header = json.loads(bytes(buffer[offset : offset + header_size]))
+            if (
+                header["package"] != package
+                or header["validate"] != validate
+                or header["intern"] != intern
+                or header["key"] != _compiled_key(package, header["paths"])
+            ):
+                return (False, None)
+
+            with memoryview(buffer) as view:
+                data = pickle.loads(view[offset + header_size :])  # nosec B301
+            return (True, data)
+    except Exception as exc:
+        # A missing, corrupt or incompatible cache file is treated as stale
+        LOGGER.debug(f"read_compiled cache_path={cache_path} exc={exc!r}")
+        return (False, None)
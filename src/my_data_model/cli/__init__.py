@@ -1,11 +1,14 @@
 """Command-line interface."""
 
+from my_data_model.cli.compile import compile
 from my_data_model.cli.dump import dump
 from my_data_model.cli.main import main
 from my_data_model.cli.perf import perf
+from my_data_model.cli.validate import validate
+from my_data_model.cli.watch import watch
 
 
-for command in [dump, perf]:
+for command in [compile, dump, perf, validate, watch]:
     main.add_command(command)
 
 __all__ = ["main"]
@@ -0,0 +1,43 @@
+"""Command which compiles the model to a binary cache file."""
+
+import logging
+from typing import Any
+
+import click
+
+from my_data_model.cli.main import command
+from my_data_model.io import load
+
+
+@command
+@click.option(
+    "-m",
+    "--model",
+    "model",
+    help="Model to use",
+    type=click.Choice(["attrs", "columnar", "pydantic_bm", "pydantic_dc"]),
+    default="attrs",
+    show_default=True,
+)
+@click.option(
+    "-o",
+    "--output",
+    "output_path",
+    help="Path to compiled model cache file",
+    metavar="PATH",
+    required=True,
+)
+def compile(*args: Any, **kwargs: Any) -> None:
+    """Command which compiles the model to a binary cache file."""
+    ctx = click.get_current_context()
+
+    data_path = ctx.params["data_path"]
+    model = ctx.params["model"]
+    output_path = ctx.params["output_path"]
+
+    logging.info(f"Compiling model {model} to {output_path} ...")
+
+    package = f"my_data_model.models_{model}"
+
+    with open(data_path) as stream:
+        ctx.obj = load(stream=stream, package=package, compiled=output_path)
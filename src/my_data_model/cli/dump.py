@@ -1,13 +1,46 @@
 """Command which dumps the model to stdout."""
 
 import logging
+from pathlib import Path
 from pprint import pformat
 from typing import Any
+from typing import Optional
 
 import click
+import yaml
 
 from my_data_model.cli.main import command
+from my_data_model.cli.main import find_data_files
+from my_data_model.io import BACKENDS
+from my_data_model.io import DEFAULT_BACKEND
+from my_data_model.io import EXECUTORS
 from my_data_model.io import load
+from my_data_model.io import load_many
+from my_data_model.profile import LoadStats
+
+
+def load_profiled(path: Path, package: str, backend: str, stats: LoadStats) -> Any:
+    """Load data from a YAML file, returning rather than raising YAML errors."""
+    try:
+        with open(path) as stream:
+            return load(
+                stream=stream,
+                package=package,
+                backend=backend,
+                include_cache=None,
+                stats=stats,
+            )
+    except yaml.YAMLError as exc:
+        return exc
+
+
+def log_stats(stats: Optional[LoadStats]) -> None:
+    """Log the time spent in each phase of loading, if it was recorded."""
+    if stats is None:
+        return
+    logging.info("")
+    for line in stats.report():
+        logging.info(line)
 
 
 @command
@@ -16,22 +49,109 @@ from my_data_model.io import load
     "--model",
     "model",
     help="Model to use",
-    type=click.Choice(["attrs", "pydantic_bm", "pydantic_dc"]),
+    type=click.Choice(["attrs", "columnar", "pydantic_bm", "pydantic_dc"]),
     default="attrs",
     show_default=True,
 )
+@click.option(
+    "-b",
+    "--backend",
+    "backend",
+    help="YAML parser backend",
+    type=click.Choice(BACKENDS),
+    default=DEFAULT_BACKEND,
+    show_default=True,
+)
+@click.option(
+    "-j",
+    "--jobs",
+    "jobs",
+    help="Number of files to load in parallel, if the data path matches many",
+    type=int,
+    default=None,
+)
+@click.option(
+    "-e",
+    "--executor",
+    "executor",
+    help="Executor used to load files in parallel",
+    type=click.Choice(list(EXECUTORS)),
+    default="thread",
+    show_default=True,
+)
+@click.option(
+    "-c",
+    "--compiled",
+    "compiled",
+    help="Path to compiled model cache file, used if the data path is a file",
+    metavar="PATH",
+    default=None,
+)
+@click.option(
+    "-p",
+    "--profile",
+    "profile",
+    help="Report time spent in each phase of loading",
+    is_flag=True,
+)
 def dump(*args: Any, **kwargs: Any) -> None:
     """Command which dumps the model to stdout."""
     ctx = click.get_current_context()
 
     data_path = ctx.params["data_path"]
     model = ctx.params["model"]
+    backend = ctx.params["backend"]
 
     logging.info(f"Loading model {model} ...")
 
     package = f"my_data_model.models_{model}"
 
-    with open(data_path) as stream:
-        ctx.obj = load(stream=stream, package=package)
+    stats: Optional[LoadStats] = LoadStats() if ctx.params["profile"] else None
+
+    paths = find_data_files(data_path)
+
+    if paths == [Path(data_path)]:
+        with open(data_path) as stream:
+            ctx.obj = load(
+                stream=stream,
+                package=package,
+                backend=backend,
+                compiled=ctx.params["compiled"],
+                stats=stats,
+            )
+
+        logging.info(pformat(ctx.obj))
+        log_stats(stats)
+        return
+
+    if stats is not None:
+        # Stats are accumulated by a single thread, so files are loaded one
+        # at a time, and without the include cache so that every include is
+        # counted
+        results = [
+            load_profiled(path=path, package=package, backend=backend, stats=stats)
+            for path in paths
+        ]
+    else:
+        results = load_many(
+            paths=paths,
+            package=package,
+            backend=backend,
+            workers=ctx.params["jobs"],
+            executor=ctx.params["executor"],
+        )
+    ctx.obj = dict(zip(paths, results))  # noqa: B905
+
+    errors = 0
+    for path, data in ctx.obj.items():
+        logging.info(f"{path}:")
+        if isinstance(data, yaml.YAMLError):
+            logging.error(data)
+            errors += 1
+        else:
+            logging.info(pformat(data))
+
+    log_stats(stats)
 
-    logging.info(pformat(ctx.obj))
+    if errors:
+        raise click.ClickException(f"{errors} of {len(paths)} files failed to load")
@@ -1,11 +1,14 @@
 """Command-line interface."""
 
 import functools
+import glob
 import logging
 import os
 import sys
 from pathlib import Path
 from typing import Any
+from typing import List
+from typing import Union
 
 import click
 
@@ -13,6 +16,28 @@ import click
 DEFAULT_DATA_PATH = Path(os.path.dirname(__file__)).parent / "data" / "model.yaml"
 
 
+def find_data_files(data_path: Union[str, Path]) -> List[Path]:
+    """Find the data files identified by a path.
+
+    Args:
+        data_path: path to a file, a directory or a glob pattern
+
+    Returns:
+        The file itself, all YAML files below the directory, or all files
+        matching the pattern, respectively
+    """
+    path = Path(data_path)
+
+    if path.is_dir():
+        return sorted(path.glob("**/*.yaml"))
+
+    if any(char in str(data_path) for char in "*?["):
+        matches = glob.glob(str(data_path), recursive=True)
+        return sorted(Path(match) for match in matches)
+
+    return [path]
+
+
 def _log_init(verbose: bool) -> None:
     """Initialize logging."""
 
@@ -48,7 +73,7 @@ def command(func: Any) -> click.Command:
         "-d",
         "--data",
         "data_path",
-        help="Path to data",
+        help="Path to data: a file, a directory or a glob pattern",
         metavar="PATH",
         default=DEFAULT_DATA_PATH,
         show_default=True,
@@ -1,93 +1,467 @@
 """Command which measures performance of model loading and validation."""
 
+import functools
+import json
 import logging
-import textwrap
-import time
+import tempfile
+from collections import Counter
 from io import StringIO
+from pathlib import Path
 from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
 
 import click
 import yaml
 
+from my_data_model import benchmark
+from my_data_model.benchmark import MemoryResult
+from my_data_model.benchmark import Result
+from my_data_model.cache import IncludeCache
 from my_data_model.cli.main import command
+from my_data_model.corpus import CorpusSpec
+from my_data_model.corpus import make_source
+from my_data_model.corpus import write_corpus
+from my_data_model.io import BACKENDS
+from my_data_model.io import DEFAULT_BACKEND
 from my_data_model.io import load
+from my_data_model.io import profile_load
+from my_data_model.models_attrs.common import construct
+from my_data_model.profile import LoadStats
+from my_data_model.utils import check_iterable_no_dups
+from my_data_model.utils import import_model_class
 
 
-def make_source(commands: int, inputs: int, tag: bool) -> str:
-    """Make YAML source."""
+MODELS = ["attrs", "columnar", "pydantic_bm", "pydantic_dc"]
+"""Models which are benchmarked."""
 
-    def make_tag(name: str, tag: bool) -> str:
-        return f"!{name}" if tag else f"#{name}"
+STATISTICS = ["mean", "min", "median", "p95", "stddev"]
+"""Statistics reported for each benchmark."""
 
-    def dedent(value: str) -> str:
-        return textwrap.dedent(
-            "\n".join(line for line in value.strip().split("\n") if line.strip())
+MICRO_SIZE = 100000
+"""Number of elements in the collections used by micro-benchmarks."""
+
+NOISE_PARAMETERS = frozenset({"repeats", "warmup", "micro"})
+"""Parameters which do not change what each benchmark measures, so results run
+with different values of them are compared, with a warning."""
+
+
+def raw_load(source: str, backend: str) -> Any:
+    """Load raw data."""
+    if backend == "libyaml" and yaml.__with_libyaml__:
+        return yaml.load(source, Loader=yaml.CSafeLoader)  # nosec B506
+    return yaml.safe_load(source)
+
+
+def model_load(source: str, model: str, backend: str, validate: bool = True) -> Any:
+    """Load, validate and create models."""
+    with StringIO(source) as stream:
+        return load(
+            stream=stream,
+            package=f"my_data_model.models_{model}",
+            backend=backend,
+            validate=validate,
+        )
+
+
+def lazy_names(source: str, model: str, backend: str) -> List[str]:
+    """Load lazily, reading only the names of interfaces and their commands."""
+    with StringIO(source) as stream:
+        data = load(
+            stream=stream,
+            package=f"my_data_model.models_{model}",
+            backend=backend,
+            lazy=True,
+        )
+    interfaces = data if isinstance(data, list) else [data]
+    return [
+        name
+        for iface in interfaces
+        for name in [iface.name, *(command.name for command in iface.commands)]
+    ]
+
+
+def profiled_model_load(source: str, model: str, backend: str) -> LoadStats:
+    """Load models, recording the time spent in each phase of loading."""
+    with StringIO(source) as stream:
+        (_data, stats) = profile_load(
+            stream=stream, package=f"my_data_model.models_{model}", backend=backend
         )
+    return stats
 
-    def indent(prefix: str, value: str) -> str:
-        space = " " * len(prefix)
-        return prefix + ("\n" + space).join(value.split("\n"))
-
-    def make_input(index: int, tag: bool) -> str:
-        return dedent(
-            f"""
-{make_tag(name="commands.CommandValue", tag=tag)}
-name: Input{index}
-description: Example input {index}
-type: {make_tag(name="types.Address", tag=tag)}
-  name: Address
-  description: An address
-  width: 64
-"""
+
+def tree_load(path: Path, model: str, backend: str) -> Any:
+    """Load models from a tree of files, with a fresh include cache."""
+    with open(path) as stream:
+        return load(
+            stream=stream,
+            package=f"my_data_model.models_{model}",
+            backend=backend,
+            include_cache=IncludeCache(),
         )
 
-    def make_command(inputs: int, index: int, tag: bool) -> str:
-        return dedent(
-            f"""
-{make_tag(name="commands.Command", tag=tag)}
-name: Cmd{index}
-description: Example command {index}
-inputs:
-"""
-            + "\n".join(
-                indent(f"  X{index}: ", make_input(index=index, tag=tag))
-                for index in range(0, inputs)
+
+def compiled_load(path: Path, compiled: Path, model: str, backend: str) -> Any:
+    """Load models from a file, via a compiled model cache."""
+    with open(path) as stream:
+        return load(
+            stream=stream,
+            package=f"my_data_model.models_{model}",
+            backend=backend,
+            compiled=compiled,
+        )
+
+
+def log_header() -> None:
+    """Log the header of the results table."""
+    columns = "".join(f"{column:>12s}" for column in STATISTICS)
+    logging.info(f"{'Benchmark':40s}{columns}")
+
+
+def log_result(result: Result) -> None:
+    """Log one row of the results table."""
+    values = "".join(f"{getattr(result, column):12.6f}" for column in STATISTICS)
+    logging.info(f"{result.name:40s}{values}")
+
+
+def run_standard(
+    spec: CorpusSpec, run: Callable[[str, Callable[[], Any]], Result]
+) -> None:
+    """Run benchmarks of each way of loading a corpus."""
+    # Synthesize YAML source without tags
+    raw_source = make_source(spec=spec, tag=False)
+    logging.debug(f"raw_source:\n{raw_source}")
+
+    # Synthesize YAML source with tags
+    tagged_source = make_source(spec=spec, tag=True)
+    logging.debug(f"tagged_source:\n{tagged_source}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # Write the same data as a tree of files, one per interface, command
+        # and shared type
+        corpus = write_corpus(directory=Path(tmp_dir) / "tree", spec=spec)
+        logging.info(f"Number of files in tree              {corpus.files}")
+        logging.info(f"Number of model objects              {corpus.objects}")
+
+        logging.info("")
+        logging.info("Times in seconds")
+        log_header()
+
+        for backend in BACKENDS:
+            logging.info("")
+
+            # Measure time taken to parse YAML, without tags / constructors
+            raw = run(
+                f"raw_load/{backend}",
+                functools.partial(raw_load, source=raw_source, backend=backend),
             )
+
+            # Measure time taken to parse YAML, validate data and create models
+            for model in MODELS:
+                result = run(
+                    f"{model}/{backend}",
+                    functools.partial(
+                        model_load, source=tagged_source, model=model, backend=backend
+                    ),
+                )
+
+                # Compute overhead compared to parsing YAML without tags
+                overhead = result.mean - raw.mean
+                logging.info(
+                    f"{model + '/' + backend + ' average overhead':40s}"
+                    f"{overhead:12.6f}"
+                )
+
+                # Measure time taken to create models from trusted data, without
+                # validation
+                trusted = run(
+                    f"{model}/{backend}/trusted",
+                    functools.partial(
+                        model_load,
+                        source=tagged_source,
+                        model=model,
+                        backend=backend,
+                        validate=False,
+                    ),
+                )
+                saving = result.mean - trusted.mean
+                logging.info(
+                    f"{model + '/' + backend + ' saving without validation':40s}"
+                    f"{saving:12.6f}"
+                )
+
+                # Measure time taken to read only the names of the interfaces and
+                # commands, without constructing or validating anything else
+                run(
+                    f"{model}/{backend}/lazy_names",
+                    functools.partial(
+                        lazy_names, source=tagged_source, model=model, backend=backend
+                    ),
+                )
+
+                # Measure time taken to load the same data from a tree of files
+                run(
+                    f"{model}/{backend}/tree",
+                    functools.partial(
+                        tree_load, path=corpus.root, model=model, backend=backend
+                    ),
+                )
+
+        # Measure time taken to revive models from a compiled model cache,
+        # which is independent of the parser backend
+        logging.info("")
+        for model in MODELS:
+            compiled = Path(tmp_dir) / f"{model}.cache"
+            run(
+                f"{model}/compiled",
+                functools.partial(
+                    compiled_load,
+                    path=corpus.root,
+                    compiled=compiled,
+                    model=model,
+                    backend=DEFAULT_BACKEND,
+                ),
+            )
+
+
+def sweep_sizes(sweep_range: Tuple[int, int], sweep_points: int) -> List[int]:
+    """Get the values of a swept parameter, checking that a curve can be fit.
+
+    Raises:
+        click.BadParameter: if there are fewer than two distinct values
+    """
+    (start, stop) = sweep_range
+    try:
+        sizes = benchmark.log_spaced(start=start, stop=stop, points=sweep_points)
+    except ValueError as exc:
+        raise click.BadParameter(
+            f"{exc}", param_hint="'--sweep-range' / '--sweep-points'"
+        ) from exc
+    if len(sizes) < 2:
+        raise click.BadParameter(
+            f"at least two distinct values are needed to fit a curve, got {sizes}",
+            param_hint="'--sweep-range' / '--sweep-points'",
         )
+    return sizes
+
+
+def run_sweep(
+    spec: CorpusSpec,
+    parameter: str,
+    sizes: List[int],
+    run: Callable[[str, Callable[[], Any]], Result],
+) -> None:
+    """Run benchmarks over a range of sizes, and fit cost curves to them.
+
+    Curves are fitted for parsing without tags and for each model, using the
+    default parser backend, and growth which is faster than linear is
+    reported.
+    """
+    backend = DEFAULT_BACKEND
+    medians: Dict[str, List[float]] = {}
+
+    logging.info(f"Sweeping {parameter} over {sizes}")
+    logging.info("")
+    logging.info("Times in seconds")
+    log_header()
 
-    def make_interface(commands: int, inputs: int, tag: bool) -> str:
-        return dedent(
-            f"""
-{make_tag(name="interfaces.Interface", tag=tag)}
-name: Iface1
-commands:
-"""
-            + "\n".join(
-                indent(" - ", make_command(index=index, inputs=inputs, tag=tag))
-                for index in range(0, commands)
+    for size in sizes:
+        sized_spec = spec._replace(**{parameter: size})
+        raw_source = make_source(spec=sized_spec, tag=False)
+        tagged_source = make_source(spec=sized_spec, tag=True)
+
+        logging.info("")
+        funcs = {
+            f"raw_load/{backend}": functools.partial(
+                raw_load, source=raw_source, backend=backend
+            ),
+            **{
+                f"{model}/{backend}": functools.partial(
+                    model_load, source=tagged_source, model=model, backend=backend
+                )
+                for model in MODELS
+            },
+        }
+        for name, func in funcs.items():
+            result = run(f"{name}/{parameter}={size}", func)
+            medians.setdefault(name, []).append(result.median)
+
+    logging.info("")
+    logging.info(f"Cost curves: median time = coefficient * {parameter} ^ exponent")
+    logging.info(f"{'Benchmark':40s}{'coefficient':>12s}{'exponent':>12s}")
+    for name, times in medians.items():
+        (coefficient, exponent) = benchmark.fit_power_law(sizes=sizes, times=times)
+        logging.info(f"{name:40s}{coefficient:12.3e}{exponent:12.3f}")
+        if exponent > benchmark.SUPERLINEAR_EXPONENT:
+            logging.warning(
+                f"{name} time grows super-linearly with {parameter} "
+                f"(exponent {exponent:.2f})"
+            )
+
+
+def run_memory(spec: CorpusSpec) -> List[MemoryResult]:
+    """Measure memory used to load a corpus with each model.
+
+    Uses the default parser backend, since the models are the same whichever
+    backend creates them.
+    """
+    backend = DEFAULT_BACKEND
+    raw_source = make_source(spec=spec, tag=False)
+    tagged_source = make_source(spec=spec, tag=True)
+
+    funcs = {
+        f"raw_load/{backend}": functools.partial(
+            raw_load, source=raw_source, backend=backend
+        ),
+        **{
+            f"{model}/{backend}": functools.partial(
+                model_load, source=tagged_source, model=model, backend=backend
             )
+            for model in MODELS
+        },
+    }
+
+    logging.info("")
+    logging.info("Memory in KiB")
+    logging.info(f"{'Benchmark':40s}{'peak':>12s}{'retained':>12s}")
+    memory = []
+    for name, func in funcs.items():
+        result = benchmark.measure_memory(name=name, func=func)
+        logging.info(
+            f"{name:40s}{result.peak / 1024:12.1f}{result.retained / 1024:12.1f}"
         )
+        memory.append(result)
 
-    return make_interface(commands=commands, inputs=inputs, tag=tag)
+    logging.info("")
+    logging.info("Instance sizes in bytes, excluding attribute values")
+    logging.info(f"{'Class':40s}{'instances':>12s}{'mean':>12s}{'total':>12s}")
+    for model in MODELS:
+        data = model_load(source=tagged_source, model=model, backend=backend)
+        sizes = benchmark.instance_sizes(
+            data=data, package=f"my_data_model.models_{model}"
+        )
+        for name, size in sorted(sizes.items()):
+            logging.info(
+                f"{model + '/' + name:40s}{size.instances:12d}"
+                f"{size.mean:12.1f}{size.size:12d}"
+            )
 
+    return memory
 
-def raw_load(source: str) -> Any:
-    """Load raw data."""
-    return yaml.safe_load(source)
 
+def counter_no_dups(name: str, data: Iterable[Any]) -> None:
+    """Check uniqueness by counting every element of a list.
+
+    This was the implementation of :func:`~my_data_model.utils.check_iterable_no_dups`
+    before it exited early, and is kept as the baseline of its micro-benchmark.
+    """
+    dups = [item for item, count in Counter(list(data)).items() if count > 1]
+    if dups:
+        raise ValueError(f"{name} contains duplicate values: " + ", ".join(dups))
 
-def model_load(source: str, model: str) -> Any:
-    """Load, validate and create models."""
-    with StringIO(source) as stream:
-        return load(stream=stream, package=f"my_data_model.models_{model}")
+
+def check_names(
+    check: Callable[[str, Iterable[Any]], None], commands: List[Any]
+) -> Optional[str]:
+    """Check that command names are unique, as Interface validation does."""
+    try:
+        check("command names", (cmd.name for cmd in commands))
+    except ValueError as exc:
+        return str(exc)
+    return None
+
+
+def run_micro(run: Callable[[str, Callable[[], Any]], Result]) -> None:
+    """Run micro-benchmarks of helpers used by model validation."""
+    Command = import_model_class("attrs", "commands", "Command")  # noqa: N806
+    unique = [
+        construct(Command, description="Command", inputs={}, name=f"Cmd{index}")
+        for index in range(MICRO_SIZE)
+    ]
+    # Every name is repeated, which is the worst case for reporting
+    repeated = unique + unique
+
+    logging.info(f"Micro-benchmarks with {MICRO_SIZE} commands")
+    for case, commands in [("unique", unique), ("repeated", repeated)]:
+        for check in [counter_no_dups, check_iterable_no_dups]:
+            run(
+                f"no_dups/{check.__name__}/{case}",
+                functools.partial(check_names, check=check, commands=commands),
+            )
+
+
+def compare(
+    baseline_path: str,
+    results: List[Result],
+    threshold: float,
+    parameters: Dict[str, Any],
+) -> None:
+    """Compare results with a baseline, and fail if any have regressed.
+
+    Results are only compared with a baseline which was run with the same
+    parameters, other than :const:`NOISE_PARAMETERS`.
+    """
+    try:
+        baseline = benchmark.read_json(baseline_path)
+        baseline_parameters = benchmark.read_parameters(baseline_path)
+    except (OSError, ValueError) as exc:
+        raise click.ClickException(f"cannot read baseline: {exc}") from exc
+
+    # Round-trip the current parameters through JSON, as the baseline's were
+    current_parameters = json.loads(json.dumps(parameters))
+    differences = {
+        name: (baseline_parameters.get(name), current_parameters.get(name))
+        for name in sorted(baseline_parameters.keys() | current_parameters.keys())
+        if baseline_parameters.get(name) != current_parameters.get(name)
+    }
+    for name, (old, new) in differences.items():
+        logging.warning(f"Baseline has {name}={old!r}, current run has {name}={new!r}")
+    mismatched = sorted(differences.keys() - NOISE_PARAMETERS)
+    if mismatched:
+        raise click.ClickException(
+            f"baseline was run with different parameters: {', '.join(mismatched)}"
+        )
+
+    comparisons = benchmark.compare(baseline=baseline, results=results)
+
+    logging.info("")
+    logging.info(f"Comparison of median times with {baseline_path}")
+    logging.info(f"{'Benchmark':40s}{'baseline':>12s}{'current':>12s}{'change':>12s}")
+    regressions = 0
+    for comparison in comparisons:
+        regressed = comparison.change > threshold
+        regressions += regressed
+        logging.info(
+            f"{comparison.name:40s}{comparison.baseline:12.6f}"
+            f"{comparison.current:12.6f}{comparison.change:12.1%}"
+            + ("  REGRESSED" if regressed else "")
+        )
+
+    if regressions:
+        raise click.ClickException(
+            f"{regressions} of {len(comparisons)} benchmarks regressed by more "
+            f"than {threshold:.0%}"
+        )
 
 
 @command
+@click.option(
+    "--interfaces",
+    "interfaces",
+    help="Number of interfaces",
+    type=int,
+    default=1,
+    show_default=True,
+)
 @click.option(
     "-c",
     "--commands",
     "commands",
-    help="Number of commands",
+    help="Number of commands per interface",
     type=int,
     default=50,
     show_default=True,
@@ -101,59 +475,206 @@ def model_load(source: str, model: str) -> Any:
     default=10,
     show_default=True,
 )
+@click.option(
+    "--depth",
+    "depth",
+    help="Nesting depth of array types",
+    type=int,
+    default=1,
+    show_default=True,
+)
+@click.option(
+    "--duplication",
+    "duplication",
+    help="Fraction of input value types which are shared",
+    type=click.FloatRange(0.0, 1.0),
+    default=0.0,
+    show_default=True,
+)
 @click.option(
     "-r",
     "--repeats",
     "repeats",
-    help="Number of repeats",
-    type=int,
+    help="Number of timed repeats",
+    type=click.IntRange(min=1),
     default=100,
     show_default=True,
 )
+@click.option(
+    "-w",
+    "--warmup",
+    "warmup",
+    help="Number of untimed warmup rounds before the timed repeats",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+)
+@click.option(
+    "--isolate",
+    "isolate",
+    help="Run each benchmark in a freshly spawned process",
+    is_flag=True,
+)
+@click.option(
+    "-j",
+    "--json",
+    "json_path",
+    help="Write results to a JSON file",
+    metavar="PATH",
+    default=None,
+)
+@click.option(
+    "-p",
+    "--profile",
+    "profile",
+    help="Report time spent in each phase of loading, for each model and backend",
+    is_flag=True,
+)
+@click.option(
+    "-M",
+    "--memory",
+    "memory",
+    help="Report peak and retained memory, and instance sizes, for each model",
+    is_flag=True,
+)
+@click.option(
+    "--sweep",
+    "sweep",
+    help="Benchmark over a range of values of a parameter, and fit cost curves",
+    type=click.Choice(["commands", "inputs"]),
+    default=None,
+)
+@click.option(
+    "--sweep-range",
+    "sweep_range",
+    help="First and last values of the swept parameter",
+    type=(int, int),
+    metavar="START STOP",
+    default=(10, 10000),
+    show_default=True,
+)
+@click.option(
+    "--sweep-points",
+    "sweep_points",
+    help="Number of logarithmically spaced values of the swept parameter",
+    type=click.IntRange(min=0),
+    default=7,
+    show_default=True,
+)
+@click.option(
+    "--compare",
+    "compare_path",
+    help="Compare with baseline results written by --json, failing on regression",
+    metavar="PATH",
+    default=None,
+)
+@click.option(
+    "--threshold",
+    "threshold",
+    help="Fractional increase in median time above which --compare fails",
+    type=click.FloatRange(min=0.0),
+    default=0.1,
+    show_default=True,
+)
+@click.option(
+    "--micro",
+    "micro",
+    help=f"Also run micro-benchmarks of validation helpers on {MICRO_SIZE} objects",
+    is_flag=True,
+)
 def perf(*args: Any, **kwargs: Any) -> None:
     """Command which measures performance of model loading and validation."""
     ctx = click.get_current_context()
 
-    commands = ctx.params["commands"]
-    inputs = ctx.params["inputs"]
+    spec = CorpusSpec(
+        interfaces=ctx.params["interfaces"],
+        commands=ctx.params["commands"],
+        inputs=ctx.params["inputs"],
+        depth=ctx.params["depth"],
+        duplication=ctx.params["duplication"],
+    )
     repeats = ctx.params["repeats"]
+    warmup = ctx.params["warmup"]
+    isolate = ctx.params["isolate"]
+    json_path = ctx.params["json_path"]
+    profile = ctx.params["profile"]
+    memory = ctx.params["memory"]
+    sweep: Optional[str] = ctx.params["sweep"]
+    sweep_range = ctx.params["sweep_range"]
+    sweep_points = ctx.params["sweep_points"]
+    compare_path = ctx.params["compare_path"]
+    threshold = ctx.params["threshold"]
+    micro = ctx.params["micro"]
 
     logging.info(f"Number of repeats                    {repeats}")
-    logging.info(f"Number of commands                   {commands}")
-    logging.info(f"Number of input values per command   {inputs}")
+    logging.info(f"Number of warmup rounds              {warmup}")
+    logging.info(f"Number of interfaces                 {spec.interfaces}")
+    logging.info(f"Number of commands per interface     {spec.commands}")
+    logging.info(f"Number of input values per command   {spec.inputs}")
+    logging.info(f"Nesting depth of array types         {spec.depth}")
+    logging.info(f"Fraction of shared types             {spec.duplication}")
 
-    # Synthesize YAML source without tags
-    raw_source = make_source(commands=commands, inputs=inputs, tag=False)
-    logging.debug(f"raw_source:\n{raw_source}")
+    def run(name: str, func: Callable[[], Any]) -> Result:
+        result = benchmark.run(
+            name=name, func=func, repeats=repeats, warmup=warmup, isolate=isolate
+        )
+        log_result(result)
+        results.append(result)
+        return result
 
-    # Synthesize YAML source with tags
-    tagged_source = make_source(commands=commands, inputs=inputs, tag=True)
-    logging.debug(f"tagged_source:\n{tagged_source}")
+    results: List[Result] = []
+
+    sizes: List[int] = []
+    if sweep:
+        sizes = sweep_sizes(sweep_range=sweep_range, sweep_points=sweep_points)
+        run_sweep(spec=spec, parameter=sweep, sizes=sizes, run=run)
+    else:
+        run_standard(spec=spec, run=run)
 
-    # Measure time taken to parse YAML, without tags / constructors
-    start = time.time()
-    for _i in range(0, repeats):
-        data = raw_load(source=raw_source)
-        logging.debug(data)
-    end = time.time()
-    elapsed = end - start
-    logging.info(f"Total raw_load                {elapsed:.6f} s")
-    average_raw = elapsed / repeats
-    logging.info(f"Average raw_load              {average_raw:.6f} s")
-
-    # Measure time taken to parse YAML, validate data and create model objects
-    for model in ["attrs", "pydantic_bm", "pydantic_dc"]:
+    if micro:
         logging.info("")
-        start = time.time()
-        for _i in range(0, repeats):
-            data = model_load(source=tagged_source, model=model)
-            logging.debug(data)
-        end = time.time()
-        elapsed = end - start
-        logging.info(f"{model + ' total':30s}{elapsed:.6f} s")
-        average_model = elapsed / repeats
-        logging.info(f"{model + ' average':30s}{average_model:.6f} s")
-
-        # Compute overhead compared to parsing YAML without tags / constructors
-        average_overhead = average_model - average_raw
-        logging.info(f"{model + ' average overhead':30s}{average_overhead:.6f} s")
+        run_micro(run=run)
+
+    if profile:
+        # Profiling adds overhead to every phase, so a separate, untimed load
+        # is made for each model and backend
+        tagged_source = make_source(spec=spec, tag=True)
+        for backend in BACKENDS:
+            for model in MODELS:
+                stats = profiled_model_load(
+                    source=tagged_source, model=model, backend=backend
+                )
+                logging.info("")
+                logging.info(f"Phase breakdown for {model}/{backend}")
+                for line in stats.report():
+                    logging.info(line)
+
+    memory_results = run_memory(spec=spec) if memory else []
+
+    parameters = {
+        **spec._asdict(),
+        "repeats": repeats,
+        "warmup": warmup,
+        "isolate": isolate,
+        "sweep": sweep,
+        "sweep_sizes": sizes,
+        "micro": micro,
+    }
+
+    if json_path:
+        benchmark.write_json(
+            path=json_path,
+            results=results,
+            memory=memory_results,
+            parameters=parameters,
+        )
+        logging.info("")
+        logging.info(f"Results written to {json_path}")
+
+    if compare_path:
+        compare(
+            baseline_path=compare_path,
+            results=results,
+            threshold=threshold,
+            parameters=parameters,
+        )
@@ -0,0 +1,87 @@
+"""Command which validates model files in parallel."""
+
+import logging
+from typing import Any
+
+import click
+
+from my_data_model.cli.main import command
+from my_data_model.cli.main import find_data_files
+from my_data_model.io import BACKENDS
+from my_data_model.io import DEFAULT_BACKEND
+from my_data_model.validate import validate as validate_files
+
+
+@command
+@click.option(
+    "-m",
+    "--model",
+    "model",
+    help="Model to use",
+    type=click.Choice(["attrs", "columnar", "pydantic_bm", "pydantic_dc"]),
+    default="attrs",
+    show_default=True,
+)
+@click.option(
+    "-b",
+    "--backend",
+    "backend",
+    help="YAML parser backend",
+    type=click.Choice(BACKENDS),
+    default=DEFAULT_BACKEND,
+    show_default=True,
+)
+@click.option(
+    "-j",
+    "--jobs",
+    "jobs",
+    help="Number of worker processes  [default: number of CPUs]",
+    type=int,
+    default=None,
+)
+@click.option(
+    "-w",
+    "--warm",
+    "warm",
+    help="Path to commonly included files with which to pre-warm each worker",
+    metavar="PATH",
+    multiple=True,
+)
+@click.option(
+    "--batch",
+    "batch",
+    help="Check tags, widths, sizes and names in batch, reporting every error",
+    is_flag=True,
+    default=False,
+)
+def validate(*args: Any, **kwargs: Any) -> None:
+    """Command which validates model files in parallel."""
+    ctx = click.get_current_context()
+
+    model = ctx.params["model"]
+    paths = find_data_files(ctx.params["data_path"])
+    warm = [path for pattern in ctx.params["warm"] for path in find_data_files(pattern)]
+
+    logging.info(f"Validating {len(paths)} files with model {model} ...")
+
+    ctx.obj = validate_files(
+        paths=paths,
+        package=f"my_data_model.models_{model}",
+        backend=ctx.params["backend"],
+        jobs=ctx.params["jobs"],
+        warm=warm,
+        batch=ctx.params["batch"],
+    )
+
+    for issue in ctx.obj.issues:
+        logging.error(issue)
+
+    logging.info(
+        f"Validated {len(ctx.obj.files)} files ({ctx.obj.nodes} nodes)"
+        f" in {ctx.obj.elapsed:.6f} s"
+    )
+    logging.info(f"Throughput {ctx.obj.files_per_second:.1f} files/s")
+    logging.info(f"Throughput {ctx.obj.nodes_per_second:.1f} nodes/s")
+
+    if ctx.obj.issues:
+        raise click.ClickException(f"{len(ctx.obj.issues)} issues found")
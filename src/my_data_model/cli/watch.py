@@ -0,0 +1,105 @@
+"""Command which watches the data for changes and incrementally reloads it."""
+
+import logging
+import time
+from pathlib import Path
+from typing import Any
+
+import click
+
+from my_data_model.cli.main import command
+from my_data_model.incremental import IncrementalLoader
+from my_data_model.io import BACKENDS
+from my_data_model.io import DEFAULT_BACKEND
+from my_data_model.watch import DEFAULT_INTERVAL
+from my_data_model.watch import make_watcher
+
+
+@command
+@click.option(
+    "-m",
+    "--model",
+    "model",
+    help="Model to use",
+    type=click.Choice(["attrs", "columnar", "pydantic_bm", "pydantic_dc"]),
+    default="attrs",
+    show_default=True,
+)
+@click.option(
+    "-b",
+    "--backend",
+    "backend",
+    help="YAML parser backend",
+    type=click.Choice(BACKENDS),
+    default=DEFAULT_BACKEND,
+    show_default=True,
+)
+@click.option(
+    "-w",
+    "--watch-dir",
+    "watch_dir",
+    help="Directory to watch  [default: directory containing the data]",
+    metavar="PATH",
+    default=None,
+)
+@click.option(
+    "-i",
+    "--interval",
+    "interval",
+    help="Polling interval in seconds, if inotify is not available",
+    type=float,
+    default=DEFAULT_INTERVAL,
+    show_default=True,
+)
+@click.option(
+    "-n",
+    "--max-reloads",
+    "max_reloads",
+    help="Exit after this many reloads  [default: run until interrupted]",
+    type=int,
+    default=None,
+)
+def watch(*args: Any, **kwargs: Any) -> None:
+    """Command which watches the data for changes and incrementally reloads it."""
+    ctx = click.get_current_context()
+
+    data_path = Path(ctx.params["data_path"])
+    model = ctx.params["model"]
+    watch_dir = ctx.params["watch_dir"] or data_path.parent
+    max_reloads = ctx.params["max_reloads"]
+
+    loader = IncrementalLoader(
+        path=data_path,
+        package=f"my_data_model.models_{model}",
+        backend=ctx.params["backend"],
+    )
+
+    with make_watcher(directory=watch_dir, interval=ctx.params["interval"]) as watcher:
+        logging.info(f"Loading model {model} ...")
+        start = time.perf_counter()
+        ctx.obj = loader.load()
+        elapsed = time.perf_counter() - start
+        logging.info(f"Loaded {len(loader.reloaded)} files in {elapsed:.6f} s")
+        logging.info(f"Watching {watcher.directory} ...")
+
+        reloads = 0
+        try:
+            while max_reloads is None or reloads < max_reloads:
+                changed = watcher.wait()
+                logging.debug(f"Changed: {sorted(changed)}")
+
+                start = time.perf_counter()
+                try:
+                    ctx.obj = loader.reload(changed)
+                except Exception as exc:
+                    logging.error(exc)
+                    continue
+                finally:
+                    reloads += 1
+                elapsed = time.perf_counter() - start
+
+                logging.info(
+                    f"Reloaded {len(loader.reloaded)} files in {elapsed:.6f} s"
+                )
+        except KeyboardInterrupt:  # pragma: no cover
+            pass
@@ -0,0 +1,320 @@
+"""Generation of synthetic data, for benchmarking."""
+
+import functools
+import os
+import random
+from io import StringIO
+from pathlib import Path
+from typing import Callable
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Set
+from typing import TextIO
+from typing import Tuple
+from typing import Union
+
+
+class CorpusSpec(NamedTuple):
+    """Shape of a synthetic corpus."""
+
+    interfaces: int = 1
+    """Number of interfaces."""
+
+    commands: int = 50
+    """Number of commands per interface."""
+
+    inputs: int = 10
+    """Number of input values per command."""
+
+    depth: int = 1
+    """Nesting depth of array types: zero for no arrays, otherwise each array
+    type is nested this many levels deep around an address or bits type."""
+
+    duplication: float = 0.0
+    """Fraction of input value types which are shared, rather than defined
+    where they are used. Shared types are included from a file, or referred
+    to by a YAML alias if the corpus is a single document."""
+
+    shared_types: int = 8
+    """Number of distinct shared types."""
+
+    seed: int = 0
+    """Seed of the random choices of types, so that corpora are reproducible."""
+
+
+class Corpus(NamedTuple):
+    """A corpus written to a directory tree."""
+
+    root: Path
+    """Path to the root data file."""
+
+    files: int
+    """Number of files written."""
+
+    objects: int
+    """Number of model objects defined."""
+
+
+_TypeDesc = Tuple[str, str, int, Optional["_TypeDesc"]]
+"""Description of a type: (tag, name, width or size, element type)."""
+
+_LEAF_TYPES = ["types.Address", "types.Bits"]
+_WIDTHS = [8, 16, 32, 64]
+_SIZES = [2, 4, 8, 16]
+
+
+def _random_leaf_type(rng: random.Random) -> _TypeDesc:
+    """Choose an address or bits type at random."""
+    tag = rng.choice(_LEAF_TYPES)
+    width = rng.choice(_WIDTHS)
+    return (tag, f"{tag[len('types.') :]}{width}", width, None)
+
+
+def _random_type(rng: random.Random, depth: int) -> _TypeDesc:
+    """Choose a type at random, nesting arrays to the given depth."""
+    kinds = _LEAF_TYPES + ["types.Array"] if depth else _LEAF_TYPES
+    if rng.choice(kinds) != "types.Array":
+        return _random_leaf_type(rng)
+
+    desc = _random_leaf_type(rng)
+    for _level in range(depth):
+        size = rng.choice(_SIZES)
+        desc = ("types.Array", f"Array{size}_{desc[1]}", size, desc)
+    return desc
+
+
+class _Writer:
+    """Writes YAML text for part of a corpus directly to a stream."""
+
+    def __init__(
+        self,
+        stream: TextIO,
+        spec: CorpusSpec,
+        rng: random.Random,
+        shared: List[_TypeDesc],
+        tag: bool = True,
+        types_dir: Optional[str] = None,
+    ):
+        """Create writer.
+
+        Args:
+            stream: stream to write to
+            spec: shape of the corpus
+            rng: source of random choices, shared by the writers of a corpus
+            shared: shared types
+            tag: whether objects are tagged; if not, tags are written as
+                 comments, so that the same text can be parsed as plain YAML
+            types_dir: path to the directory of shared type files, relative
+                 to command files, or None to define shared types inline
+        """
+        self.write = stream.write
+        self.spec = spec
+        self.rng = rng
+        self.shared = shared
+        self.tag = tag
+        self.types_dir = types_dir
+        self.anchored: Set[int] = set()
+        self.objects = 0
+
+    def header(self, name: str) -> str:
+        """Format the tag of an object."""
+        return f"!{name}" if self.tag else f"#{name}"
+
+    def type_def(self, desc: _TypeDesc, indent: int) -> None:
+        """Write a type, after the key or anchor which precedes it."""
+        (tag, name, value, element) = desc
+        pad = " " * indent
+        self.objects += 1
+        self.write(
+            f"{self.header(tag)}\n"
+            f"{pad}name: {name}\n"
+            f"{pad}description: Type {name}\n"
+        )
+        if element is None:
+            self.write(f"{pad}width: {value}\n")
+        else:
+            self.write(f"{pad}size: {value}\n{pad}type: ")
+            self.type_def(element, indent + 2)
+
+    def type_ref(self, indent: int) -> None:
+        """Write the type of an input value, after its key."""
+        if self.rng.random() >= self.spec.duplication:
+            self.type_def(_random_type(self.rng, self.spec.depth), indent)
+            return
+
+        index = self.rng.randrange(self.spec.shared_types)
+        if self.types_dir is not None:
+            self.write(f"!include {self.types_dir}/T{index}.yaml\n")
+        elif index in self.anchored:
+            self.write(f"*T{index}\n")
+        else:
+            self.anchored.add(index)
+            self.write(f"&T{index} ")
+            self.type_def(self.shared[index], indent)
+
+    def command(self, index: int, indent: int) -> None:
+        """Write a command, after the key or sequence entry which precedes it."""
+        pad = " " * indent
+        self.objects += 1
+        self.write(
+            f"{self.header('commands.Command')}\n"
+            f"{pad}name: Cmd{index}\n"
+            f"{pad}description: Example command {index}\n"
+            f"{pad}inputs:\n"
+        )
+        value_pad = pad + "    "
+        for input_index in range(self.spec.inputs):
+            self.objects += 1
+            self.write(
+                f"{pad}  X{input_index}: {self.header('commands.CommandValue')}\n"
+                f"{value_pad}name: in{input_index}\n"
+                f"{value_pad}description: Input {input_index}\n"
+                f"{value_pad}type: "
+            )
+            self.type_ref(indent + 6)
+
+    def interface(
+        self, index: int, indent: int, commands_dir: Optional[str] = None
+    ) -> None:
+        """Write an interface, after the sequence entry which precedes it.
+
+        Args:
+            index: index of the interface
+            indent: indentation of the interface's attributes
+            commands_dir: path to the directory of command files, relative to
+                 the interface file, or None to define commands inline
+        """
+        pad = " " * indent
+        self.objects += 1
+        self.write(
+            f"{self.header('interfaces.Interface')}\n"
+            f"{pad}name: Iface{index}\n"
+            f"{pad}commands:\n"
+        )
+        for command_index in range(self.spec.commands):
+            if commands_dir is None:
+                self.write(f"{pad}- ")
+                self.command(index=command_index, indent=indent + 2)
+            else:
+                self.write(f"{pad}- !include {commands_dir}/Cmd{command_index}.yaml\n")
+
+
+def _shared_types(rng: random.Random, spec: CorpusSpec) -> List[_TypeDesc]:
+    """Choose the shared types of a corpus."""
+    return [_random_type(rng, spec.depth) for _index in range(spec.shared_types)]
+
+
+def write_source(stream: TextIO, spec: CorpusSpec, tag: bool = True) -> int:
+    """Write a corpus as a single YAML document.
+
+    The document is an interface, or a sequence of interfaces if there are
+    several of them.
+
+    Args:
+        stream: stream to write to
+        spec: shape of the corpus
+        tag: whether objects are tagged; if not, tags are written as comments,
+             so that the same text can be parsed as plain YAML
+
+    Returns:
+        Number of model objects defined
+    """
+    rng = random.Random(spec.seed)
+    writer = _Writer(
+        stream=stream, spec=spec, rng=rng, shared=_shared_types(rng, spec), tag=tag
+    )
+
+    if spec.interfaces == 1:
+        writer.interface(index=0, indent=0)
+    else:
+        for index in range(spec.interfaces):
+            writer.write("- ")
+            writer.interface(index=index, indent=2)
+
+    return writer.objects
+
+
+def make_source(spec: CorpusSpec, tag: bool = True) -> str:
+    """Make a corpus as a single YAML document.
+
+    Args:
+        spec: shape of the corpus
+        tag: whether objects are tagged
+
+    Returns:
+        YAML source
+    """
+    with StringIO() as stream:
+        write_source(stream=stream, spec=spec, tag=tag)
+        return stream.getvalue()
+
+
+def write_corpus(directory: Union[str, "os.PathLike[str]"], spec: CorpusSpec) -> Corpus:
+    """Write a corpus as a tree of YAML files.
+
+    The tree contains one file per interface, per command and per shared
+    type, which are included by the root file, the interface files and the
+    command files respectively. Data loaded from the tree is equal to data
+    loaded from :func:`write_source` with the same spec.
+
+    Args:
+        directory: directory in which the tree is created
+        spec: shape of the corpus
+
+    Returns:
+        Description of the corpus
+    """
+    root_dir = Path(directory)
+    rng = random.Random(spec.seed)
+    shared = _shared_types(rng, spec)
+    files = 0
+    objects = 0
+
+    def write_file(path: Path, func: Callable[[_Writer], None]) -> None:
+        nonlocal files, objects
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as stream:
+            writer = _Writer(
+                stream=stream,
+                spec=spec,
+                rng=rng,
+                shared=shared,
+                types_dir="../../types",
+            )
+            func(writer)
+        files += 1
+        objects += writer.objects
+
+    for index, desc in enumerate(shared):
+        write_file(
+            root_dir / "types" / f"T{index}.yaml",
+            functools.partial(_Writer.type_def, desc=desc, indent=0),
+        )
+
+    for index in range(spec.interfaces):
+        write_file(
+            root_dir / "interfaces" / f"Iface{index}.yaml",
+            functools.partial(
+                _Writer.interface,
+                index=index,
+                indent=0,
+                commands_dir=f"../commands/Iface{index}",
+            ),
+        )
+        for command_index in range(spec.commands):
+            write_file(
+                root_dir / "commands" / f"Iface{index}" / f"Cmd{command_index}.yaml",
+                functools.partial(_Writer.command, index=command_index, indent=0),
+            )
+
+    root = root_dir / "model.yaml"
+    with open(root, "w") as stream:
+        if spec.interfaces == 1:
+            stream.write("!include interfaces/Iface0.yaml\n")
+        else:
+            for index in range(spec.interfaces):
+                stream.write(f"- !include interfaces/Iface{index}.yaml\n")
+    files += 1
+
+    return Corpus(root=root, files=files, objects=objects)
@@ -0,0 +1,72 @@
+"""Dependency graph of included files."""
+
+import threading
+from typing import Dict
+from typing import Iterable
+from typing import Set
+
+
+class IncludeGraph:
+    """Records which files include which other files.
+
+    Paths are stored as strings, and should be resolved before being added so
+    that each file has a single identity.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty include graph."""
+        self.includes: Dict[str, Set[str]] = {}
+        """Files directly included by each file."""
+
+        self.included_by: Dict[str, Set[str]] = {}
+        """Files which directly include each file."""
+
+        self._lock = threading.Lock()
+
+    def __contains__(self, path: object) -> bool:
+        """Whether a file is part of the graph."""
+        return path in self.includes or path in self.included_by
+
+    def add(self, parent: str, child: str) -> None:
+        """Record that one file includes another.
+
+        Args:
+            parent: path to the including file
+            child: path to the included file
+        """
+        with self._lock:
+            self.includes.setdefault(parent, set()).add(child)
+            self.included_by.setdefault(child, set()).add(parent)
+
+    def discard(self, path: str) -> None:
+        """Forget the files included by a file, before it is re-parsed.
+
+        Edges from files which include this one are kept.
+
+        Args:
+            path: path to the file
+        """
+        with self._lock:
+            for child in self.includes.pop(path, set()):
+                parents = self.included_by[child]
+                parents.discard(path)
+                if not parents:
+                    del self.included_by[child]
+
+    def ancestors(self, paths: Iterable[str]) -> Set[str]:
+        """Find the files which directly or indirectly include any of some files.
+
+        Args:
+            paths: paths to the files
+
+        Returns:
+            The files themselves, plus all files which include them
+        """
+        result = set()
+        stack = list(paths)
+        while stack:
+            path = stack.pop()
+            if path not in result:
+                result.add(path)
+                stack.extend(self.included_by.get(path, ()))
+        return result
@@ -0,0 +1,112 @@
+"""Incremental reloading of models."""
+
+import logging
+import os
+import sys
+from pathlib import Path
+from typing import Any
+from typing import Iterable
+from typing import Optional
+from typing import Set
+from typing import Union
+
+from my_data_model.cache import IncludeCache
+from my_data_model.graph import IncludeGraph
+from my_data_model.intern import InternTable
+from my_data_model.io import get_loader_class
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+class IncrementalLoader:
+    """Loads a model from a root file, and reloads it when files change.
+
+    While loading, the loader records which files include which others. When
+    some files change, only those files and the files which directly or
+    indirectly include them are re-parsed: the data loaded from every other
+    file is reused.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        package: Optional[str] = None,
+        backend: Optional[str] = None,
+    ):
+        """Create incremental loader.
+
+        Args:
+            path: path to the root data file
+            package: package from which models are loaded, defaults to
+                     :const:`~my_data_model.io.DEFAULT_PACKAGE`
+            backend: YAML parser backend, one of
+                     :const:`~my_data_model.io.BACKENDS`, defaults to
+                     :const:`~my_data_model.io.DEFAULT_BACKEND`
+        """
+        self.path = Path(path).resolve()
+        self.loader_cls = get_loader_class(package=package, backend=backend)
+        self.graph = IncludeGraph()
+        self.data: Any = None
+        """Data loaded from the root file."""
+
+        self.reloaded: Set[str] = set()
+        """Files re-parsed by the most recent load or reload."""
+
+        self._cache = IncludeCache(maxsize=sys.maxsize)
+
+    def _key(self, path: str) -> Any:
+        """Key of the data loaded from a file in the cache."""
+        return self.loader_cls.cache_key(abs_path=Path(path), interned=True)
+
+    def files(self) -> Set[str]:
+        """All files from which the model is loaded."""
+        return {str(self.path), *self.graph.included_by}
+
+    def load(self) -> Any:
+        """Load the model from scratch.
+
+        Returns:
+            Data loaded from the root file
+        """
+        self._cache.clear()
+        self.graph = IncludeGraph()
+        return self._load(unchanged=set())
+
+    def reload(self, changed_paths: Iterable[Union[str, "os.PathLike[str]"]]) -> Any:
+        """Reload the model after some files have changed.
+
+        Args:
+            changed_paths: paths to the files which have changed; paths which
+                           are not part of the model are ignored
+
+        Returns:
+            Data loaded from the root file
+        """
+        changed = {str(Path(path).resolve()) for path in changed_paths}
+        files = self.files()
+        affected = self.graph.ancestors(changed) & files
+
+        for path in affected:
+            self._cache.discard(self._key(path))
+            self.graph.discard(path)
+
+        LOGGER.debug(f"IncrementalLoader.reload affected={sorted(affected)}")
+
+        return self._load(unchanged=files - affected)
+
+    def _load(self, unchanged: Set[str]) -> Any:
+        """Load the root file, reusing data from unaffected files."""
+        # Files which have changed without being reported are also re-parsed
+        before = {path for path in unchanged if self._key(path) in self._cache}
+
+        entry = self.loader_cls.load_file(
+            abs_path=self.path,
+            include_cache=self._cache,
+            graph=self.graph,
+            interns=InternTable(),
+        )
+        self.data = entry.value
+        self.reloaded = self.files() - before
+
+        return self.data
@@ -0,0 +1,116 @@
+"""Interning of immutable model objects."""
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Hashable
+from typing import Mapping
+from typing import Optional
+
+
+def _identity(value: Any) -> Hashable:
+    """Get the part of an intern key which identifies an attribute value."""
+    if getattr(type(value), "internable", False):
+        return id(value)
+    return value  # type: ignore [no-any-return]
+
+
+class InternTable:
+    """Deduplicates equal immutable objects created while loading.
+
+    Model classes opt in by setting the class attribute ``internable`` to
+    True, which promises that their instances are immutable and that equal
+    instances may be shared. Strings are always internable.
+
+    A table is not thread-safe, so each load should use its own.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty intern table."""
+        self.objects: Dict[Hashable, Any] = {}
+        """Interned objects, by class and attributes."""
+
+        self.strings: Dict[str, str] = {}
+        """Interned strings."""
+
+        self.hits = 0
+        """Number of objects which were reused rather than created."""
+
+        self.misses = 0
+        """Number of internable objects which were created."""
+
+    def __len__(self) -> int:
+        """Number of interned objects, excluding strings."""
+        return len(self.objects)
+
+    @staticmethod
+    def key(cls: Any, mapping: Mapping[Any, Any]) -> Optional[Hashable]:
+        """Get the key identifying an object, if it may be interned.
+
+        The type of each attribute value is part of the key, so that values
+        which compare equal but differ in type, such as ``1`` and ``True``,
+        are not conflated. Values which are themselves internable objects are
+        identified by their id, which is cheaper than hashing them: equal
+        objects interned by the same table are identical, and each is kept
+        alive by the interned object which refers to it.
+
+        Args:
+            cls: class of the object
+            mapping: attributes of the object
+
+        Returns:
+            Key, or None if the class is not internable or any attribute is
+            not hashable
+        """
+        if not getattr(cls, "internable", False):
+            return None
+        try:
+            key = (
+                cls,
+                tuple(
+                    (name, type(value), _identity(value))
+                    for name, value in sorted(mapping.items())
+                ),
+            )
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def intern(
+        self, cls: Any, mapping: Mapping[Any, Any], create: Callable[[], Any]
+    ) -> Any:
+        """Get an object equal to the one which would be created.
+
+        Args:
+            cls: class of the object
+            mapping: attributes of the object
+            create: function which creates the object
+
+        Returns:
+            An interned object if there is one, otherwise the created object,
+            which is interned if possible
+        """
+        key = self.key(cls, mapping)
+        if key is None:
+            return create()
+
+        try:
+            obj = self.objects[key]
+        except KeyError:
+            obj = self.objects[key] = create()
+            self.misses += 1
+        else:
+            self.hits += 1
+        return obj
+
+    def string(self, value: str) -> str:
+        """Get a string equal to a string.
+
+        Args:
+            value: the string
+
+        Returns:
+            The interned string
+        """
+        return self.strings.setdefault(value, value)
@@ -1,33 +1,142 @@
 """YAML loader."""
 
+import asyncio
+import contextlib
+import functools
 import importlib
 import logging
 import os
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
 from io import IOBase
+from io import StringIO
 from pathlib import Path
 from typing import Any
+from typing import Callable
+from typing import ContextManager
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
 from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import Type
+from typing import Union
 
 import yaml
 
+from my_data_model.cache import INCLUDE_CACHE
+from my_data_model.cache import CacheEntry
+from my_data_model.cache import FileStamp
+from my_data_model.cache import IncludeCache
+from my_data_model.cache import file_stamp
+from my_data_model.cache import read_compiled
+from my_data_model.cache import write_compiled
+from my_data_model.graph import IncludeGraph
+from my_data_model.intern import InternTable
+from my_data_model.lazy import LazyInclude
+from my_data_model.lazy import LazyModel
+from my_data_model.lazy import force
+from my_data_model.profile import LoadStats
+from my_data_model.tags import TAG_PREFIX
+from my_data_model.tags import TagRegistry
+from my_data_model.tags import get_tag_registry
 
-LOGGER = logging.getLogger(__name__)
 
+LOGGER = logging.getLogger(__name__)
 
-_TAG_PREFIX = "!"
-"""Prefix for YAML tags."""
 
 DEFAULT_PACKAGE = "my_data_model.models_attrs"
 """Default package from which models are loaded."""
 
+BACKENDS = ["libyaml", "python"]
+"""YAML parser backends, in order of preference."""
+
+DEFAULT_BACKEND = "libyaml" if yaml.__with_libyaml__ else "python"
+"""Default YAML parser backend: libyaml if available, otherwise pure Python."""
+
+
+EXECUTORS: Dict[str, Callable[..., Executor]] = {
+    "thread": ThreadPoolExecutor,
+    "process": ProcessPoolExecutor,
+}
+"""Executors which may be used to load many files concurrently."""
+
+NEW_INCLUDE_CACHE: Any = object()
+"""Default include cache of loads, for which each load creates a new cache, so
+that a file is loaded once however often it is included, but loads do not
+share objects. Pass None to disable the include cache."""
+
+DEFAULT_ALOAD_CONCURRENCY = 8
+"""Default maximum number of files which :func:`aload` reads, parses or
+constructs at once."""
+
+
+class NamedStringIO(StringIO):
+    """Text stream with a name, like a file, for error marks and includes."""
 
-class _YamlLoader(yaml.Loader):
-    """Override YAML loader."""
+    def __init__(self, value: str, name: str):
+        """Create a stream.
+
+        Args:
+            value: text of the stream
+            name: path to the file from which the text was read
+        """
+        super().__init__(value)
+        self.name = name
+
+
+def _stream_name(stream: Any) -> str:
+    """Get the name of a stream, following the convention of yaml.reader.Reader."""
+    if isinstance(stream, str):
+        return "<unicode string>"
+    if isinstance(stream, bytes):
+        return "<byte string>"
+    return getattr(stream, "name", "<file>")
+
+
+class _YamlLoaderMixin:
+    """Behaviour shared by the YAML loaders for each parser backend.
+
+    Loaders are not used directly: :func:`_get_loader_class` derives a class
+    for each model package, with the package and constructors bound to it.
+    """
 
-    def __init__(self, stream: IOBase, package: str):
+    name: str
+
+    package: str
+    """Package from which models are loaded."""
+
+    tags: TagRegistry
+    """Registry of tags for the package."""
+
+    construct_scope: Callable[[], ContextManager[Any]]
+    """Function which returns the context in which the model objects of one
+    document are created."""
+
+    def __init__(
+        self,
+        stream: IOBase,
+        include_cache: Optional[IncludeCache] = None,
+        graph: Optional[IncludeGraph] = None,
+        stats: Optional[LoadStats] = None,
+        interns: Optional[InternTable] = None,
+    ):
         """Create YAML loader."""
-        super().__init__(stream=stream)
-        self.package = package
+        super().__init__(stream=stream)  # type: ignore [call-arg]
+        self.include_cache = include_cache
+        self.graph = graph
+        self.stats = stats
+        self.interns = interns
+        self.dependencies: List[FileStamp] = []
+        """Stamps of all files included, directly or indirectly, by this loader."""
+
+    def construct_document(self, node: yaml.Node) -> Any:
+        """Convert a node to an object, in the package's construction scope."""
+        with self.construct_scope():
+            return super().construct_document(node)  # type: ignore [misc]
 
     def construct_mapping(self, node: yaml.Node, deep: bool = True) -> Any:
         """Convert mapping node to dict or object.
@@ -41,7 +150,10 @@ class _YamlLoader(yaml.Loader):
 
         3. Construct objects based on the tag.
         """
-        LOGGER.debug(f"_YamlLoader.construct_mapping node={node}")
+        # Formatting a node formats all of its descendants, so only do so if
+        # the message will be logged
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(f"_YamlLoader.construct_mapping node={node}")
 
         if not isinstance(node, yaml.MappingNode):
             raise yaml.constructor.ConstructorError(
@@ -78,36 +190,65 @@ class _YamlLoader(yaml.Loader):
                 )
 
             value = self.construct_object(value_node, deep=deep)  # type: ignore
+            if self.interns is not None and type(value) is str:
+                value = self.interns.string(value)
             mapping[key] = value
 
         cls = self._get_class(node.tag)
         if cls:
-            try:
-                return cls(**mapping)
-            except Exception as exc:
-                raise yaml.constructor.ConstructorError(
-                    context=None,
-                    context_mark=None,
-                    problem=f"failed to create {cls.__module__}.{cls.__name__}:\n{exc}",
-                    problem_mark=node.start_mark,
-                    note=None,
-                ) from exc
+            return self._construct_model(cls, mapping, node)
 
         return mapping
 
     def _get_class(self, tag: str) -> Any:
         """Look up class identified by a YAML tag."""
-        if tag.startswith("!"):
-            type_name = f"{self.package}.{tag[len(_TAG_PREFIX):]}"
-            (module_name, cls_name) = type_name.rsplit(".", maxsplit=1)
-            module = importlib.import_module(module_name)
-            return getattr(module, cls_name)
+        return self.tags.resolve(tag)
 
-        return None
+    def _construct_model(
+        self, cls: Any, mapping: Dict[Any, Any], node: yaml.Node
+    ) -> Any:
+        """Create a model object, or reuse an equal one if it is internable."""
+        if self.interns is None:
+            return self._create_model(cls, mapping, node)
+        return self.interns.intern(
+            cls=cls,
+            mapping=mapping,
+            create=functools.partial(self._create_model, cls, mapping, node),
+        )
+
+    def _create_model(
+        self, cls: Any, mapping: Dict[Any, Any], node: yaml.Node
+    ) -> Any:
+        """Create a model object from its attributes."""
+        try:
+            return cls(**mapping)
+        except Exception as exc:
+            raise yaml.constructor.ConstructorError(
+                context=None,
+                context_mark=None,
+                problem=f"failed to create {cls.__module__}.{cls.__name__}:\n{exc}",
+                problem_mark=node.start_mark,
+                note=None,
+            ) from exc
 
     def include(self, node: yaml.ScalarNode) -> Any:
         """Process an include directive."""
-        path = str(self.construct_scalar(node))
+        abs_path = self._include_path(node)
+
+        entry = self.load_file(
+            abs_path=abs_path,
+            include_cache=self.include_cache,
+            graph=self.graph,
+            stats=self.stats,
+            interns=self.interns,
+        )
+
+        self.dependencies.extend(entry.dependencies)
+        return entry.value
+
+    def _include_path(self, node: yaml.ScalarNode) -> Path:
+        """Resolve the path of an included file, recording it in the graph."""
+        path = str(self.construct_scalar(node))  # type: ignore [attr-defined]
 
         LOGGER.debug(f"_YamlLoader.include self.name={self.name} path={path}")
 
@@ -122,18 +263,474 @@ class _YamlLoader(yaml.Loader):
 
         abs_path = (Path(os.path.dirname(self.name)) / path).resolve()
 
-        def make_loader(stream: IOBase) -> yaml.Loader:
-            return _YamlLoader(stream=stream, package=self.package)
+        if self.graph is not None:
+            self.graph.add(parent=str(Path(self.name).resolve()), child=str(abs_path))
+
+        return abs_path
+
+    @classmethod
+    def cache_key(cls, abs_path: Path, interned: bool) -> Any:
+        """Key of the data loaded from a file in the include cache."""
+        return (str(abs_path), cls, interned)
+
+    @classmethod
+    def load_file(
+        cls,
+        abs_path: Path,
+        include_cache: Optional[IncludeCache],
+        graph: Optional[IncludeGraph] = None,
+        stats: Optional[LoadStats] = None,
+        interns: Optional[InternTable] = None,
+    ) -> CacheEntry:
+        """Load a file, via the include cache if one is given.
+
+        If an include graph is given, includes are recorded in it. Includes in
+        files whose data is found in the cache are not recorded again, nor is
+        their load time counted in the stats.
+
+        Data loaded with and without interning is cached separately, so that
+        callers which opt out of interning never receive shared objects.
+        """
+        key = cls.cache_key(abs_path=abs_path, interned=interns is not None)
+
+        entry = None
+        if include_cache is not None:
+            entry = include_cache.get(key)
+        if entry is None:
+            entry = cls._load_file(
+                abs_path=abs_path,
+                include_cache=include_cache,
+                graph=graph,
+                stats=stats,
+                interns=interns,
+            )
+            if include_cache is not None:
+                include_cache.put(key, entry)
+
+        return entry
+
+    @classmethod
+    def _load_file(
+        cls,
+        abs_path: Path,
+        include_cache: Optional[IncludeCache],
+        graph: Optional[IncludeGraph],
+        stats: Optional[LoadStats],
+        interns: Optional[InternTable],
+    ) -> CacheEntry:
+        """Load a file, bypassing the include cache."""
+        stamp = file_stamp(abs_path)
+        if graph is not None:
+            # Replace the includes recorded when the file was last parsed
+            graph.discard(str(abs_path))
 
         with open(abs_path) as stream:
-            return yaml.load(
-                stream=stream, Loader=make_loader  # type: ignore # nosec B506
+            loader = cls(
+                stream=stream,
+                include_cache=include_cache,
+                graph=graph,
+                stats=stats,
+                interns=interns,
             )
+            try:
+                value = loader.get_single_data()  # type: ignore [attr-defined]
+            finally:
+                loader.dispose()  # type: ignore [attr-defined]
+
+        return CacheEntry(dependencies=(stamp, *loader.dependencies), value=value)
+
+
+class _YamlLoader(_YamlLoaderMixin, yaml.Loader):
+    """YAML loader using the pure Python parser."""
+
+
+if yaml.__with_libyaml__:
+
+    class _YamlCLoader(_YamlLoaderMixin, yaml.CLoader):
+        """YAML loader using the libyaml parser."""
+
+        def __init__(self, stream: IOBase, **kwargs: Any):
+            """Create YAML loader."""
+            super().__init__(stream=stream, **kwargs)
+            # Unlike yaml.reader.Reader, yaml.CParser does not expose the stream
+            # name, which is needed to resolve include paths.
+            self.name = _stream_name(stream)
+
+
+class _TrustedMixin(_YamlLoaderMixin):
+    """Loader behaviour which creates model objects without validating them."""
+
+    construct_trusted: Callable[..., Any]
+    """Function which creates a model object from its class and attributes,
+    without validation."""
+
+    def _create_model(
+        self, cls: Any, mapping: Dict[Any, Any], node: yaml.Node
+    ) -> Any:
+        """Create a model object from its attributes, without validation."""
+        return self.construct_trusted(cls, **mapping)
+
+
+def _construct_validated(cls: Any, **kwargs: Any) -> Any:
+    """Create a model object by calling its class."""
+    return cls(**kwargs)
+
+
+def _get_construct_trusted(package: str) -> Callable[..., Any]:
+    """Get the function which creates model objects without validation.
+
+    This is the ``construct`` function of the package's ``common`` module.
+    Packages which do not provide one fall back to calling the class.
+    """
+    try:
+        module = importlib.import_module(f"{package}.common")
+        return module.construct  # type: ignore [no-any-return]
+    except (ImportError, AttributeError):
+        LOGGER.debug(f"{package} cannot construct without validation")
+        return _construct_validated
+
+
+def _get_construct_scope(package: str) -> Callable[[], ContextManager[Any]]:
+    """Get the function which returns the scope in which a document is created.
+
+    This is the ``construct_scope`` function of the package's ``common``
+    module. Packages which do not provide one need no scope.
+    """
+    try:
+        module = importlib.import_module(f"{package}.common")
+        return module.construct_scope  # type: ignore [no-any-return]
+    except (ImportError, AttributeError):
+        return contextlib.nullcontext
+
+
+class _LazyMixin(_YamlLoaderMixin):
+    """Loader behaviour which constructs model objects on demand, via proxies.
+
+    The loader is kept alive by the proxies which it creates, and constructs
+    their nodes when they are read or forced. Included files are not loaded
+    until they are accessed.
+    """
+
+    def __init__(self, stream: IOBase, **kwargs: Any):
+        """Create YAML loader."""
+        super().__init__(stream=stream, **kwargs)
+        self.forced: Dict[int, Any] = {}
+        """Model objects constructed so far, by the id of their node."""
+
+        self.included: Dict[int, Any] = {}
+        """Data loaded lazily from included files, by the id of the
+        ``!include`` node."""
+
+    def construct_object(self, node: yaml.Node, deep: bool = False) -> Any:
+        """Convert a node to an object, reusing model objects already forced."""
+        try:
+            return self.forced[id(node)]
+        except KeyError:
+            pass
+
+        data = super().construct_object(node, deep=deep)  # type: ignore [misc]
+        if isinstance(node, yaml.MappingNode) and type(data) is not dict:
+            self.forced[id(node)] = data
+        return data
+
+    def construct_document(self, node: yaml.Node) -> Any:
+        """Convert a node to an object, leaving the loader usable on failure."""
+        try:
+            return super().construct_document(node)
+        except Exception:
+            # Unlike a load, a lazy loader constructs more nodes after a
+            # failure, so must not be left mid-construction
+            self.constructed_objects: Dict[yaml.Node, Any] = {}
+            self.recursive_objects: Dict[yaml.Node, Any] = {}
+            self.state_generators: List[Any] = []
+            self.deep_construct = False
+            raise
+
+    def include(self, node: yaml.ScalarNode) -> Any:
+        """Process an include directive, reusing data loaded lazily."""
+        try:
+            value = self.included[id(node)]
+        except KeyError:
+            return super().include(node)
+        return force(value)
+
+    def lazy_include(self, node: yaml.ScalarNode) -> Any:
+        """Load an included file lazily, or get the data already loaded.
+
+        Args:
+            node: the ``!include`` node
+
+        Returns:
+            Data lazily loaded from the file
+        """
+        try:
+            return self.included[id(node)]
+        except KeyError:
+            pass
+
+        with open(self._include_path(node)) as stream:
+            loader = type(self)(
+                stream=stream,
+                include_cache=self.include_cache,
+                graph=self.graph,
+                stats=self.stats,
+                interns=self.interns,
+            )
+            try:
+                root = loader.get_single_node()  # type: ignore [attr-defined]
+            finally:
+                loader.dispose()  # type: ignore [attr-defined]
+
+        value = self.included[id(node)] = None if root is None else loader.lazy(root)
+        return value
+
+    def lazy(self, node: yaml.Node) -> Any:
+        """Convert a node to an object, deferring construction of model objects.
+
+        Args:
+            node: the node
+
+        Returns:
+            A :class:`~my_data_model.lazy.LazyModel` for a model object, a
+            :class:`~my_data_model.lazy.LazyInclude` for an include directive,
+            a list or dict of lazily converted values for a sequence or
+            untagged mapping, otherwise the constructed value
+        """
+        if isinstance(node, yaml.MappingNode):
+            if self._get_class(node.tag):
+                return LazyModel(loader=self, node=node)
+            return {
+                self.construct_document(key_node): self.lazy(value_node)
+                for key_node, value_node in node.value
+            }
+
+        if isinstance(node, yaml.SequenceNode):
+            return [self.lazy(item) for item in node.value]
+
+        if isinstance(node, yaml.ScalarNode) and node.tag == "!include":
+            return LazyInclude(loader=self, node=node)
+
+        value = self.construct_document(node)
+        if self.interns is not None and type(value) is str:
+            value = self.interns.string(value)
+        return value
+
+
+class _PreloadedMixin(_YamlLoaderMixin):
+    """Loader behaviour which takes the data of included files from a mapping.
+
+    Used by :func:`aload`, which loads included files before the files which
+    include them, so that the loader does no file I/O.
+    """
+
+    preloaded: Dict[str, Any]
+    """Data loaded from each included file, by resolved path."""
+
+    def include(self, node: yaml.ScalarNode) -> Any:
+        """Process an include directive, using data already loaded."""
+        return self.preloaded[str(self._include_path(node))]
+
+
+class _ProfilingMixin(_YamlLoaderMixin):
+    """Loader behaviour which records the time spent in each phase of loading.
+
+    libyaml composes a node graph in a single call, so when it is used, time
+    spent scanning and parsing is counted as composition.
+    """
+
+    stats: LoadStats
+
+    def __init__(
+        self, stream: IOBase, stats: Optional[LoadStats] = None, **kwargs: Any
+    ):
+        """Create YAML loader."""
+        if stats is None:
+            stats = LoadStats()
+        super().__init__(stream=stream, stats=stats, **kwargs)
+
+    def get_single_node(self) -> Any:
+        """Compose the single document in the stream."""
+        with self.stats.phase("compose"):
+            return super().get_single_node()  # type: ignore [misc]
+
+    def get_node(self) -> Any:
+        """Compose the next document in the stream."""
+        with self.stats.phase("compose"):
+            return super().get_node()  # type: ignore [misc]
+
+    def construct_object(self, node: yaml.Node, deep: bool = False) -> Any:
+        """Convert a node to an object."""
+        with self.stats.phase("construct"):
+            return super().construct_object(node, deep=deep)  # type: ignore [misc]
+
+    def _get_class(self, tag: str) -> Any:
+        """Look up class identified by a YAML tag."""
+        with self.stats.phase("resolve"):
+            return super()._get_class(tag)
+
+    def _create_model(
+        self, cls: Any, mapping: Dict[Any, Any], node: yaml.Node
+    ) -> Any:
+        """Create a model object from its attributes."""
+        with self.stats.model_class(node.tag[len(TAG_PREFIX) :]):
+            return super()._create_model(cls, mapping, node)
+
+
+class _ProfilingParserMixin:
+    """Loader behaviour which records the time spent scanning and parsing.
+
+    Only applicable to the pure Python parser.
+    """
+
+    stats: LoadStats
+
+    def fetch_more_tokens(self) -> None:
+        """Scan the next tokens."""
+        with self.stats.phase("scan"):
+            super().fetch_more_tokens()  # type: ignore [misc]
+
+    def check_event(self, *choices: Any) -> bool:
+        """Check the type of the next event."""
+        with self.stats.phase("parse"):
+            return super().check_event(*choices)  # type: ignore [misc, no-any-return]
+
+    def peek_event(self) -> Any:
+        """Get the next event without consuming it."""
+        with self.stats.phase("parse"):
+            return super().peek_event()  # type: ignore [misc]
+
+    def get_event(self) -> Any:
+        """Get and consume the next event."""
+        with self.stats.phase("parse"):
+            return super().get_event()  # type: ignore [misc]
+
+
+def _resolve_backend(backend: Optional[str]) -> str:
+    """Select the parser backend to use.
+
+    Falls back to the pure Python parser if libyaml is not available.
+    """
+    my_backend = backend or DEFAULT_BACKEND
+
+    if my_backend not in BACKENDS:
+        raise ValueError(f"unknown YAML backend {my_backend!r}")
+
+    if my_backend == "libyaml" and not yaml.__with_libyaml__:
+        LOGGER.debug("libyaml not available, falling back to python backend")
+        return "python"
+
+    return my_backend
+
+
+def _construct_tagged(
+    loader: _YamlLoaderMixin, _tag_suffix: str, node: yaml.Node
+) -> Any:
+    """Multi-constructor for tagged nodes."""
+    return loader.construct_mapping(node, deep=True)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_loader_class(
+    package: str,
+    backend: str,
+    profile: bool = False,
+    validate: bool = True,
+    lazy: bool = False,
+    preloaded: bool = False,
+) -> Type[_YamlLoaderMixin]:
+    """Get the loader class for a model package.
+
+    The class is created, and its constructors registered, on first use.
+    Subsequent calls with the same arguments return the same class, so loads
+    do no setup work, and loads for different packages do not share state.
+
+    Args:
+        package: package from which models are loaded
+        backend: YAML parser backend, as selected by :func:`_resolve_backend`
+        profile: whether the loader records :class:`~my_data_model.profile.LoadStats`
+        validate: whether the loader validates model objects
+        lazy: whether the loader constructs model objects on demand
+        preloaded: whether the loader takes the data of included files from
+                 its ``preloaded`` attribute
+
+    Returns:
+        Loader class
+    """
+    base = _YamlCLoader if backend == "libyaml" else _YamlLoader
+
+    bases: Tuple[type, ...] = (base,)
+    attrs: Dict[str, Any] = {
+        "package": package,
+        "tags": get_tag_registry(package),
+        "construct_scope": staticmethod(_get_construct_scope(package)),
+    }
+    if not validate:
+        bases = (_TrustedMixin, *bases)
+        attrs["construct_trusted"] = staticmethod(_get_construct_trusted(package))
+    if lazy:
+        bases = (_LazyMixin, *bases)
+    if preloaded:
+        bases = (_PreloadedMixin, *bases)
+    if profile:
+        bases = (_ProfilingMixin, *bases)
+        if backend == "python":
+            bases = (_ProfilingParserMixin, *bases)
+
+    loader = type(f"{base.__name__}[{package}]", bases, attrs)
+
+    loader.add_constructor("!include", loader.include)  # type: ignore
+    loader.add_multi_constructor(  # type: ignore
+        tag_prefix=TAG_PREFIX, multi_constructor=_construct_tagged
+    )
+
+    return loader
+
+
+def get_loader_class(
+    package: Optional[str] = None,
+    backend: Optional[str] = None,
+    profile: bool = False,
+    validate: bool = True,
+    lazy: bool = False,
+) -> Type[_YamlLoaderMixin]:
+    """Get the YAML loader class for a model package and parser backend.
+
+    Args:
+        package: package from which models are loaded, defaults to
+                 :const:`~my_data_model.io.DEFAULT_PACKAGE`
+        backend: YAML parser backend, one of :const:`~my_data_model.io.BACKENDS`,
+                 defaults to :const:`~my_data_model.io.DEFAULT_BACKEND`
+        profile: get a loader which records the time spent in each phase of
+                 loading in its ``stats`` attribute
+        validate: get a loader which validates model objects; if False, the
+                 data is trusted, and objects are created by the ``construct``
+                 function of the package's ``common`` module
+        lazy: get a loader which constructs model objects on demand, whose
+                 ``lazy`` method converts a composed node
+
+    Returns:
+        Loader class, whose constructor takes the stream and an optional
+        include cache
+    """
+    return _get_loader_class(
+        package=package or DEFAULT_PACKAGE,
+        backend=_resolve_backend(backend),
+        profile=profile,
+        validate=validate,
+        lazy=lazy,
+    )
 
 
 def load(
     stream: IOBase,
     package: Optional[str] = None,
+    backend: Optional[str] = None,
+    include_cache: Optional[IncludeCache] = NEW_INCLUDE_CACHE,
+    compiled: Optional[Union[str, "os.PathLike[str]"]] = None,
+    stats: Optional[LoadStats] = None,
+    intern: bool = True,
+    validate: bool = True,
+    lazy: bool = False,
 ) -> Any:
     """Load data from YAML.
 
@@ -141,24 +738,500 @@ def load(
         stream: data source
         package: package from which models are loaded, defaults to
                  :const:`~my_data_model.io.DEFAULT_PACKAGE`
+        backend: YAML parser backend, one of :const:`~my_data_model.io.BACKENDS`,
+                 defaults to :const:`~my_data_model.io.DEFAULT_BACKEND`
+        include_cache: cache of data loaded from included files, such as
+                 :const:`~my_data_model.cache.INCLUDE_CACHE` to reuse data
+                 across loads, or None to disable; defaults to
+                 :const:`NEW_INCLUDE_CACHE`, a new cache for this load
+        compiled: path to a compiled model cache file; if the cache is current,
+                 and was compiled by a load with the same ``validate`` and
+                 ``intern`` options, data is revived from it without parsing
+                 or validation, otherwise data is loaded from YAML and the
+                 cache is rewritten
+        stats: if given, the time spent in each phase of loading is added to it
+        intern: share a single instance between equal objects of internable
+                 classes, such as types, and between equal strings; disable if
+                 distinct objects are needed for each node
+        validate: validate model objects; disable only for trusted data, such
+                 as data which has previously been loaded with validation
+        lazy: parse the YAML, but construct and validate model objects only
+                 when they are read, returning a
+                 :class:`~my_data_model.lazy.LazyModel` in place of the root
+                 object of each file, and load included files only when they
+                 are accessed, returning a
+                 :class:`~my_data_model.lazy.LazyInclude` in place of each;
+                 use :func:`~my_data_model.lazy.force` to construct and
+                 validate them all
 
     Returns:
         Data loaded from YAML
+
+    Raises:
+        ValueError: if a compiled model cache is requested for a stream which
+                    is not a named file, or for a lazy load
     """
     my_package = package or DEFAULT_PACKAGE
 
-    loader = _YamlLoader
+    if compiled is not None and lazy:
+        raise ValueError("compiled model cache not supported for lazy loads")
 
-    loader.add_constructor("!include", loader.include)
+    if compiled is not None:
+        name = _stream_name(stream)
+        if not os.path.isfile(name):
+            raise ValueError(f"compiled model cache not supported for {name}")
+        (current, data) = read_compiled(
+            cache_path=compiled, package=my_package, validate=validate, intern=intern
+        )
+        if current:
+            return data
 
-    loader.add_multi_constructor(
-        tag_prefix=_TAG_PREFIX,
-        multi_constructor=lambda loader, _tag, node: loader.construct_mapping(
-            node, deep=True
+    loader_cls = get_loader_class(
+        package=my_package,
+        backend=backend,
+        profile=stats is not None,
+        validate=validate,
+        lazy=lazy,
+    )
+    loader = loader_cls(
+        stream=stream,
+        include_cache=(
+            IncludeCache() if include_cache is NEW_INCLUDE_CACHE else include_cache
         ),
-    )  # type: ignore
+        stats=stats,
+        interns=InternTable() if intern else None,
+    )
+    try:
+        if lazy:
+            node = loader.get_single_node()  # type: ignore [attr-defined]
+            data = None if node is None else loader.lazy(node)  # type: ignore [attr-defined]
+        else:
+            data = loader.get_single_data()  # type: ignore [attr-defined]
+    finally:
+        loader.dispose()  # type: ignore [attr-defined]
+
+    if compiled is not None:
+        write_compiled(
+            cache_path=compiled,
+            package=my_package,
+            paths=[
+                str(Path(name).resolve()),
+                *(stamp.path for stamp in loader.dependencies),
+            ],
+            data=data,
+            validate=validate,
+            intern=intern,
+        )
+
+    return data
+
+
+def profile_load(
+    stream: IOBase,
+    package: Optional[str] = None,
+    backend: Optional[str] = None,
+    include_cache: Optional[IncludeCache] = NEW_INCLUDE_CACHE,
+    intern: bool = True,
+    validate: bool = True,
+) -> Tuple[Any, LoadStats]:
+    """Load data from YAML, recording the time spent in each phase of loading.
+
+    Args:
+        stream: data source
+        package: package from which models are loaded, defaults to
+                 :const:`~my_data_model.io.DEFAULT_PACKAGE`
+        backend: YAML parser backend, one of :const:`~my_data_model.io.BACKENDS`,
+                 defaults to :const:`~my_data_model.io.DEFAULT_BACKEND`
+        include_cache: cache of data loaded from included files, defaults to
+                 :const:`NEW_INCLUDE_CACHE`, so that the cost of loading each
+                 included file is counted once, or None to count it for each
+                 include
+        intern: share a single instance between equal objects of internable
+                 classes, such as types, and between equal strings; disable if
+                 distinct objects are needed for each node
+        validate: validate model objects; disable only for trusted data, such
+                 as data which has previously been loaded with validation
+
+    Returns:
+        Data loaded from YAML, and the time spent in each phase
+    """
+    stats = LoadStats()
+    data = load(
+        stream=stream,
+        package=package,
+        backend=backend,
+        include_cache=include_cache,
+        stats=stats,
+        intern=intern,
+        validate=validate,
+    )
+    return (data, stats)
 
-    def make_loader(stream: IOBase) -> yaml.Loader:
-        return _YamlLoader(stream=stream, package=my_package)
 
-    return yaml.load(stream=stream, Loader=make_loader)  # type: ignore # nosec B506
+def iter_load(
+    stream: IOBase,
+    package: Optional[str] = None,
+    backend: Optional[str] = None,
+    include_cache: Optional[IncludeCache] = NEW_INCLUDE_CACHE,
+    intern: bool = True,
+    validate: bool = True,
+) -> Iterator[Any]:
+    """Load data from a YAML stream containing many documents.
+
+    Each document is yielded as soon as it has been constructed, and its node
+    graph is released before the next document is parsed, so that memory use
+    is bounded by the size of the largest document rather than of the stream.
+
+    Args:
+        stream: data source
+        package: package from which models are loaded, defaults to
+                 :const:`~my_data_model.io.DEFAULT_PACKAGE`
+        backend: YAML parser backend, one of :const:`~my_data_model.io.BACKENDS`,
+                 defaults to :const:`~my_data_model.io.DEFAULT_BACKEND`
+        include_cache: cache of data loaded from included files, such as
+                 :const:`~my_data_model.cache.INCLUDE_CACHE` to reuse data
+                 across loads, or None to disable; defaults to
+                 :const:`NEW_INCLUDE_CACHE`, a new cache for each document
+        intern: share a single instance between equal objects of internable
+                 classes, such as types, and between equal strings, within
+                 each document; disable if distinct objects are needed for
+                 each node
+        validate: validate model objects; disable only for trusted data, such
+                 as data which has previously been loaded with validation
+
+    Yields:
+        Data loaded from each document
+    """
+    loader_cls = get_loader_class(package=package, backend=backend, validate=validate)
+    loader = loader_cls(stream=stream, include_cache=include_cache)
+    try:
+        while loader.check_node():  # type: ignore [attr-defined]
+            # Each document has its own intern table, dependencies and, unless
+            # one is given, include cache, so that per-document state is
+            # released along with the document
+            loader.interns = InternTable() if intern else None
+            loader.dependencies = []
+            if include_cache is NEW_INCLUDE_CACHE:
+                loader.include_cache = IncludeCache()
+            node = loader.get_node()  # type: ignore [attr-defined]
+            data = loader.construct_document(node)
+            # Drop the reference to the node graph before yielding
+            del node
+            yield data
+    finally:
+        loader.dispose()  # type: ignore [attr-defined]
+
+
+def preload(
+    paths: Iterable[Union[str, "os.PathLike[str]"]],
+    package: Optional[str] = None,
+    backend: Optional[str] = None,
+    include_cache: IncludeCache = INCLUDE_CACHE,
+    intern: bool = True,
+) -> None:
+    """Load files into an include cache, so that later includes of them hit.
+
+    Args:
+        paths: paths to data files
+        package: package from which models are loaded, defaults to
+                 :const:`~my_data_model.io.DEFAULT_PACKAGE`
+        backend: YAML parser backend, one of :const:`~my_data_model.io.BACKENDS`,
+                 defaults to :const:`~my_data_model.io.DEFAULT_BACKEND`
+        include_cache: cache to populate, defaults to
+                 :const:`~my_data_model.cache.INCLUDE_CACHE`
+        intern: whether data is loaded for loads which intern objects
+    """
+    loader = get_loader_class(package=package, backend=backend)
+    for path in paths:
+        loader.load_file(
+            abs_path=Path(path).resolve(),
+            include_cache=include_cache,
+            interns=InternTable() if intern else None,
+        )
+
+
+def _load_path(
+    path: Union[str, "os.PathLike[str]"],
+    package: Optional[str],
+    backend: Optional[str],
+) -> Any:
+    """Load data from a YAML file, returning rather than raising YAML errors."""
+    try:
+        with open(path) as stream:
+            return load(stream=stream, package=package, backend=backend)
+    except yaml.YAMLError as exc:
+        return exc
+
+
+def load_many(
+    paths: Iterable[Union[str, "os.PathLike[str]"]],
+    package: Optional[str] = None,
+    backend: Optional[str] = None,
+    workers: Optional[int] = None,
+    executor: str = "thread",
+) -> List[Any]:
+    """Load data from many YAML files concurrently.
+
+    Errors in the YAML, including :class:`yaml.constructor.ConstructorError`
+    raised when creating model objects, do not abort the whole operation:
+    instead, the exception is returned in place of the data for that file.
+
+    Args:
+        paths: paths to data files
+        package: package from which models are loaded, defaults to
+                 :const:`~my_data_model.io.DEFAULT_PACKAGE`
+        backend: YAML parser backend, one of :const:`~my_data_model.io.BACKENDS`,
+                 defaults to :const:`~my_data_model.io.DEFAULT_BACKEND`
+        workers: maximum number of concurrent loads, defaults to the
+                 executor's default
+        executor: kind of executor, one of :const:`~my_data_model.io.EXECUTORS`
+
+    Returns:
+        Data loaded from each file, or the error raised while loading it, in
+        the same order as ``paths``
+
+    Raises:
+        ValueError: if the executor is not known
+    """
+    try:
+        executor_cls = EXECUTORS[executor]
+    except KeyError:
+        raise ValueError(f"unknown executor {executor!r}") from None
+
+    func = functools.partial(_load_path, package=package, backend=backend)
+
+    with executor_cls(max_workers=workers) as pool:
+        return list(pool.map(func, paths))
+
+
+def _read_text(path: str) -> str:
+    """Read a text file."""
+    with open(path) as stream:
+        return stream.read()
+
+
+def _compose(
+    package: str, backend: str, text: str, name: str
+) -> Tuple[Optional[yaml.Node], List[str]]:
+    """Compose the node graph of a file, and find the files which it includes.
+
+    Args:
+        package: package from which models are loaded
+        backend: YAML parser backend
+        text: content of the file
+        name: path to the file
+
+    Returns:
+        Root node, and the resolved paths of the included files
+    """
+    with NamedStringIO(text, name=name) as stream:
+        loader = _get_loader_class(package=package, backend=backend)(stream=stream)
+        try:
+            root = loader.get_single_node()  # type: ignore [attr-defined]
+        finally:
+            loader.dispose()  # type: ignore [attr-defined]
+
+    includes: Dict[str, None] = {}
+    seen: Set[int] = set()
+    pending = [] if root is None else [root]
+    while pending:
+        node = pending.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        if isinstance(node, yaml.SequenceNode):
+            pending.extend(node.value)
+        elif isinstance(node, yaml.MappingNode):
+            for key_node, value_node in node.value:
+                pending.extend([key_node, value_node])
+        elif node.tag == "!include":
+            includes[str((Path(name).parent / node.value).resolve())] = None
+    return (root, list(includes))
+
+
+def _construct(
+    package: str,
+    backend: str,
+    validate: bool,
+    intern: bool,
+    node: Optional[yaml.Node],
+    name: str,
+    preloaded: Dict[str, Any],
+) -> Any:
+    """Construct the data of a file from its node graph.
+
+    Args:
+        package: package from which models are loaded
+        backend: YAML parser backend
+        validate: whether model objects are validated
+        intern: whether objects are interned
+        node: root node of the file
+        name: path to the file
+        preloaded: data of the files which it includes, by resolved path
+
+    Returns:
+        Data loaded from the file
+    """
+    if node is None:
+        return None
+    loader = _get_loader_class(
+        package=package, backend=backend, validate=validate, preloaded=True
+    )(
+        stream=NamedStringIO("", name=name),
+        interns=InternTable() if intern else None,
+    )
+    loader.preloaded = preloaded  # type: ignore [attr-defined]
+    try:
+        return loader.construct_document(node)
+    finally:
+        loader.dispose()  # type: ignore [attr-defined]
+
+
+class _AsyncLoad:
+    """State of one call to :func:`aload`.
+
+    Each file is loaded by a task, which is shared by all files which include
+    it. The include graph is recorded as files are parsed, so that include
+    cycles are reported rather than leaving tasks waiting for each other.
+    """
+
+    def __init__(
+        self,
+        package: str,
+        backend: str,
+        executor: Optional[Executor],
+        concurrency: int,
+        intern: bool,
+        validate: bool,
+    ):
+        """Create state."""
+        self.package = package
+        self.backend = backend
+        self.executor = executor
+        self.intern = intern
+        self.validate = validate
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.tasks: Dict[str, "asyncio.Future[Any]"] = {}
+        self.includes: Dict[str, List[str]] = {}
+
+    def file(self, path: str) -> "asyncio.Future[Any]":
+        """Get the task which loads a file, starting it if necessary."""
+        task = self.tasks.get(path)
+        if task is None:
+            task = self.tasks[path] = asyncio.ensure_future(self._load_file(path))
+        return task
+
+    def _in_cycle(self, path: str) -> bool:
+        """Whether a file is included, directly or indirectly, by itself."""
+        seen: Set[str] = set()
+        pending = list(self.includes[path])
+        while pending:
+            child = pending.pop()
+            if child == path:
+                return True
+            if child not in seen:
+                seen.add(child)
+                pending.extend(self.includes.get(child, []))
+        return False
+
+    async def _load_file(self, path: str) -> Any:
+        """Load a file, after loading the files which it includes."""
+        loop = asyncio.get_running_loop()
+
+        async with self.semaphore:
+            # File I/O runs on the event loop's default executor
+            text = await loop.run_in_executor(None, _read_text, path)
+            (node, includes) = await loop.run_in_executor(
+                self.executor, _compose, self.package, self.backend, text, path
+            )
+
+        self.includes[path] = includes
+        if self._in_cycle(path):
+            raise yaml.constructor.ConstructorError(
+                context=None,
+                context_mark=None,
+                problem=f"{path} includes itself",
+                problem_mark=None if node is None else node.start_mark,
+                note=None,
+            )
+        values = await asyncio.gather(*(self.file(child) for child in includes))
+
+        LOGGER.debug(f"aload path={path} includes={includes}")
+
+        async with self.semaphore:
+            return await loop.run_in_executor(
+                self.executor,
+                _construct,
+                self.package,
+                self.backend,
+                self.validate,
+                self.intern,
+                node,
+                path,
+                dict(zip(includes, values)),  # noqa: B905
+            )
+
+
+async def aload(
+    path: Union[str, "os.PathLike[str]"],
+    package: Optional[str] = None,
+    backend: Optional[str] = None,
+    executor: Optional[Executor] = None,
+    concurrency: int = DEFAULT_ALOAD_CONCURRENCY,
+    intern: bool = True,
+    validate: bool = True,
+) -> Any:
+    """Load data from a YAML file without blocking the event loop.
+
+    Files are read on the event loop's default executor, and parsed and
+    constructed on the given executor. Included files are loaded
+    concurrently, each before the files which include it, and each file is
+    loaded once however many files include it. Data is not taken from, or
+    added to, an include cache.
+
+    If the load is cancelled, or fails, no further work is started and the
+    loads of other files are cancelled; work which is already running in an
+    executor is left to finish, and its result is discarded.
+
+    Args:
+        path: path to the data file
+        package: package from which models are loaded, defaults to
+                 :const:`~my_data_model.io.DEFAULT_PACKAGE`
+        backend: YAML parser backend, one of :const:`~my_data_model.io.BACKENDS`,
+                 defaults to :const:`~my_data_model.io.DEFAULT_BACKEND`
+        executor: executor on which files are parsed and constructed, defaults
+                 to the event loop's default executor; a process pool may be
+                 used, at the cost of copying node graphs and data between
+                 processes
+        concurrency: maximum number of files which are read, parsed or
+                 constructed at once
+        intern: share a single instance between equal objects of internable
+                 classes, such as types, and between equal strings, within
+                 each file
+        validate: validate model objects; disable only for trusted data, such
+                 as data which has previously been loaded with validation
+
+    Returns:
+        Data loaded from YAML
+
+    Raises:
+        yaml.constructor.ConstructorError: if a file includes itself, directly
+                 or indirectly
+    """
+    state = _AsyncLoad(
+        package=package or DEFAULT_PACKAGE,
+        backend=_resolve_backend(backend),
+        executor=executor,
+        concurrency=concurrency,
+        intern=intern,
+        validate=validate,
+    )
+    try:
+        return await state.file(str(Path(path).resolve()))
+    finally:
+        tasks = list(state.tasks.values())
+        for task in tasks:
+            task.cancel()
+        # Retrieve the outcome of every task, so that none is reported as
+        # never retrieved
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,199 @@
+"""Lazily constructed model objects."""
+
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+
+import yaml
+
+
+class LazyModel:
+    """Proxy for a model object which has been composed but not constructed.
+
+    Reading an attribute of a proxy constructs only that attribute, from its
+    YAML node: scalars are constructed as usual, and model objects, and
+    sequences and mappings of them, are constructed and validated when they
+    are first read, so that only the objects which are read are built.
+    Included files are still only loaded when they are accessed. The proxy
+    itself, which stands for the root object of a file, is not validated
+    until :meth:`force` is called; after that, attributes are read from the
+    model object.
+
+    Attributes which are not in the YAML node, such as properties computed
+    by the model class, force the proxy.
+
+    Proxies are created by :func:`~my_data_model.io.load` when ``lazy`` is
+    set. A proxy refers to the loader which composed it, so it is not
+    thread-safe, and keeps the node graph of its document alive.
+    """
+
+    __slots__ = ("_loader", "_node")
+
+    def __init__(self, loader: Any, node: yaml.MappingNode):
+        """Create proxy.
+
+        Args:
+            loader: loader which composed the node
+            node: node of the model object
+        """
+        self._loader = loader
+        self._node = node
+
+    @property
+    def tag(self) -> str:
+        """YAML tag of the model object."""
+        return self._node.tag
+
+    @property
+    def forced(self) -> bool:
+        """Whether the model object has been constructed."""
+        return id(self._node) in self._loader.forced
+
+    def force(self) -> Any:
+        """Construct and validate the model object, and all objects within it.
+
+        Objects which have already been forced are reused, and the result is
+        reused by proxies of the objects which contain this one.
+
+        Returns:
+            Model object
+
+        Raises:
+            yaml.constructor.ConstructorError: if the object is not valid
+        """
+        return self._loader.construct_document(self._node)
+
+    def __getattr__(self, name: str) -> Any:
+        """Read an attribute, constructing and validating the models in it.
+
+        Raises:
+            yaml.constructor.ConstructorError: if a model object in the
+                attribute is not valid
+        """
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        forced = self._loader.forced.get(id(self._node))
+        if forced is None:
+            for key_node, value_node in self._node.value:
+                if key_node.value == name:
+                    return _force_models(self._loader.lazy(value_node))
+            forced = self.force()
+
+        return getattr(forced, name)
+
+    def __repr__(self) -> str:
+        """Represent as a string, without constructing anything."""
+        mark = self._node.start_mark
+        return f"LazyModel({self.tag} at {mark.name}:{mark.line + 1})"
+
+
+class LazyInclude:
+    """Placeholder for the data of an included file, loaded when accessed.
+
+    The file is opened and parsed the first time that the placeholder is
+    accessed, and its data is itself loaded lazily. Attribute access, item
+    access and iteration are passed on to the data. The data is cached by the
+    loader, so every placeholder for the same ``!include`` node shares it, and
+    forcing an object which includes the file reuses it.
+
+    Placeholders are created in place of ``!include`` nodes by
+    :func:`~my_data_model.io.load` when ``lazy`` is set.
+    """
+
+    __slots__ = ("_loader", "_node")
+
+    def __init__(self, loader: Any, node: yaml.ScalarNode):
+        """Create placeholder.
+
+        Args:
+            loader: loader which composed the node
+            node: the ``!include`` node
+        """
+        self._loader = loader
+        self._node = node
+
+    @property
+    def path(self) -> str:
+        """Path to the included file, as written in the including file."""
+        return self._node.value  # type: ignore [no-any-return]
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the included file has been loaded."""
+        return id(self._node) in self._loader.included
+
+    @property
+    def value(self) -> Any:
+        """Data loaded lazily from the included file."""
+        return self._loader.lazy_include(self._node)
+
+    def force(self) -> Any:
+        """Construct and validate the data of the included file."""
+        return force(self.value)
+
+    def __getattr__(self, name: str) -> Any:
+        """Read an attribute of the data."""
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self.value, name)
+
+    def __getitem__(self, key: Any) -> Any:
+        """Get an item of the data."""
+        return self.value[key]
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the data."""
+        return iter(self.value)
+
+    def __len__(self) -> int:
+        """Length of the data."""
+        return len(self.value)
+
+    def __repr__(self) -> str:
+        """Represent as a string, without loading anything."""
+        return f"LazyInclude({self.path})"
+
+
+def _force_models(data: Any) -> Any:
+    """Construct and validate the lazily loaded model objects within data.
+
+    Unlike :func:`force`, included files which have not yet been accessed are
+    left to be loaded when they are.
+    """
+    if isinstance(data, LazyModel):
+        return data.force()
+    if isinstance(data, list):
+        items: List[Any] = [_force_models(item) for item in data]
+        return items
+    if isinstance(data, dict):
+        mapping: Dict[Any, Any] = {
+            key: _force_models(value) for key, value in data.items()
+        }
+        return mapping
+    return data
+
+
+def force(data: Any) -> Any:
+    """Construct and validate all lazily loaded model objects within data.
+
+    Args:
+        data: data returned by a lazy load
+
+    Returns:
+        The same data, with every :class:`LazyModel` replaced by its model
+        object, and every :class:`LazyInclude` by the data of its file
+
+    Raises:
+        yaml.constructor.ConstructorError: if any object is not valid
+    """
+    if isinstance(data, (LazyModel, LazyInclude)):
+        return data.force()
+    if isinstance(data, list):
+        items: List[Any] = [force(item) for item in data]
+        return items
+    if isinstance(data, dict):
+        mapping: Dict[Any, Any] = {key: force(value) for key, value in data.items()}
+        return mapping
+    return data
@@ -43,7 +43,7 @@ class Command:
             ),
             # Check that input value names are unique
             lambda instance, attr, value: check_iterable_no_dups(
-                name="input value names", data=[entry.name for entry in value.values()]
+                name="input value names", data=(entry.name for entry in value.values())
             ),
         ]
     )
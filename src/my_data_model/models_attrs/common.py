@@ -10,3 +10,16 @@ def model(cls: type[Any]) -> type[Any]:
     return define(
         maybe_cls=cls, auto_attribs=True, frozen=True, kw_only=True, slots=True
     )
+
+
+def construct(cls: type[Any], **kwargs: Any) -> Any:
+    """Create a model object from trusted data, without validation.
+
+    Bypasses ``__init__``, and with it the attribute validators, by setting
+    the slots of a new instance directly. The caller is responsible for
+    providing every attribute, with valid values.
+    """
+    obj = object.__new__(cls)
+    for name, value in kwargs.items():
+        object.__setattr__(obj, name, value)
+    return obj
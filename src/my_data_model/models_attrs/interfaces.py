@@ -1,6 +1,9 @@
 """Interfaces."""
 
+from types import MappingProxyType
+from typing import Dict
 from typing import List
+from typing import Mapping
 
 from attrs import field
 from attrs.validators import deep_iterable
@@ -11,8 +14,20 @@ from my_data_model.models_attrs.common import model
 from my_data_model.utils import check_iterable_no_dups
 
 
+class _CommandIndex:
+    """Slot for the commands of an interface by name.
+
+    The slot is declared by a base class, so that it is not an attrs field,
+    and is neither compared nor serialized.
+    """
+
+    __slots__ = ("_commands_by_name",)
+
+    _commands_by_name: Dict[str, Command]
+
+
 @model
-class Interface:
+class Interface(_CommandIndex):
     """An interface."""
 
     commands: List[Command] = field(
@@ -21,7 +36,7 @@ class Interface:
             deep_iterable(member_validator=instance_of(Command)),
             # Check that command names are unique
             lambda instance, attr, value: check_iterable_no_dups(
-                name="command names", data=[cmd.name for cmd in value]
+                name="command names", data=(cmd.name for cmd in value)
             ),
         ]
     )
@@ -29,3 +44,31 @@ class Interface:
 
     name: str = field(validator=[instance_of(str)])
     """Name of the interface."""
+
+    def _index(self) -> Dict[str, Command]:
+        """Get the commands by name, indexing them on first use."""
+        try:
+            return self._commands_by_name
+        except AttributeError:
+            index = {cmd.name: cmd for cmd in self.commands}
+            object.__setattr__(self, "_commands_by_name", index)
+            return index
+
+    @property
+    def commands_by_name(self) -> Mapping[str, Command]:
+        """Commands in the interface, by name."""
+        return MappingProxyType(self._index())
+
+    def command(self, name: str) -> Command:
+        """Get a command by name.
+
+        Args:
+            name: name of the command
+
+        Returns:
+            The command
+
+        Raises:
+            KeyError: if the interface has no such command
+        """
+        return self._index()[name]
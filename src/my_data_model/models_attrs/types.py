@@ -1,6 +1,7 @@
 """Types."""
 
 from typing import Any
+from typing import ClassVar
 from typing import Union
 
 from attrs import field
@@ -13,6 +14,9 @@ from my_data_model.models_attrs.common import model
 class Type:
     """Base class for types."""
 
+    internable: ClassVar[bool] = True
+    """Types are immutable values, so equal instances may be shared."""
+
 
 @model
 class _WidthTemplatedType(Type):
@@ -0,0 +1 @@
+"""Data model, stored as columns of arrays and accessed through views."""
@@ -0,0 +1,136 @@
+"""Commands."""
+
+from typing import Any
+from typing import Iterator
+from typing import Mapping
+from typing import get_args
+
+from my_data_model.models_columnar.common import View
+from my_data_model.models_columnar.common import check_members
+from my_data_model.models_columnar.common import check_type
+from my_data_model.models_columnar.store import Store
+from my_data_model.models_columnar.types import GeneralType
+from my_data_model.models_columnar.types import type_view
+from my_data_model.utils import check_iterable_no_dups
+
+
+class CommandValue(View):
+    """Command input or output value."""
+
+    __slots__ = ()
+
+    _fields = ("description", "name", "type")
+
+    def __init__(self, *, description: str, name: str, type: GeneralType) -> None:
+        """Create a command value, appending it to the current store."""
+        check_type(name="description", value=description, types=str)
+        check_type(name="name", value=name, types=str)
+        check_type(name="type", value=type, types=get_args(GeneralType))
+        self._init(description=description, name=name, type=type)
+
+    @classmethod
+    def _add(cls, store: Store, **kwargs: Any) -> int:
+        """Append a row to the command values table."""
+        value_type = kwargs["type"]
+        return store.add_value(
+            name=kwargs["name"],
+            description=kwargs["description"],
+            type_row=store.import_type(value_type._store, value_type._row),
+        )
+
+    @property
+    def description(self) -> str:
+        """Description of the command value."""
+        return self._store.strings[self._store.value_description[self._row]]
+
+    @property
+    def name(self) -> str:
+        """Name of the command value."""
+        return self._store.strings[self._store.value_name[self._row]]
+
+    @property
+    def type(self) -> GeneralType:
+        """Type of the command value."""
+        return type_view(self._store, self._store.value_type[self._row])  # type: ignore [return-value]
+
+
+class _Inputs(Mapping[str, CommandValue]):
+    """Read-only mapping view of the inputs of a command."""
+
+    __slots__ = ("_store", "_indexes")
+
+    def __init__(self, store: Store, indexes: range) -> None:
+        self._store = store
+        self._indexes = indexes
+
+    def __getitem__(self, key: str) -> CommandValue:
+        for index in self._indexes:
+            if self._store.strings[self._store.input_key[index]] == key:
+                return CommandValue._view(  # type: ignore [no-any-return]
+                    self._store, self._store.input_value[index]
+                )
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return (
+            self._store.strings[self._store.input_key[index]]
+            for index in self._indexes
+        )
+
+    def __len__(self) -> int:
+        return len(self._indexes)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class Command(View):
+    """A command."""
+
+    __slots__ = ()
+
+    _fields = ("description", "inputs", "name")
+
+    def __init__(
+        self, *, description: str, inputs: Mapping[str, CommandValue], name: str
+    ) -> None:
+        """Create a command, appending it to the current store."""
+        check_type(name="description", value=description, types=str)
+        check_type(name="inputs", value=inputs, types=Mapping)
+        # Check that keys are strings
+        check_members(name="inputs", values=inputs.keys(), types=str)
+        # Check that values are CommandValue instances
+        check_members(name="inputs", values=inputs.values(), types=CommandValue)
+        # Check that input value names are unique
+        check_iterable_no_dups(
+            name="input value names", data=(entry.name for entry in inputs.values())
+        )
+        check_type(name="name", value=name, types=str)
+        self._init(description=description, inputs=inputs, name=name)
+
+    @classmethod
+    def _add(cls, store: Store, **kwargs: Any) -> int:
+        """Append a row to the commands table, and rows for its inputs."""
+        return store.add_command(
+            name=kwargs["name"],
+            description=kwargs["description"],
+            inputs=[
+                (key, store.import_value(value._store, value._row))
+                for key, value in kwargs["inputs"].items()
+            ],
+        )
+
+    @property
+    def description(self) -> str:
+        """Description of the command."""
+        return self._store.strings[self._store.command_description[self._row]]
+
+    @property
+    def inputs(self) -> Mapping[str, CommandValue]:
+        """Input values."""
+        return _Inputs(self._store, self._store.inputs(self._row))
+
+    @property
+    def name(self) -> str:
+        """Name of the command."""
+        return self._store.strings[self._store.command_name[self._row]]
@@ -0,0 +1,140 @@
+"""Common code shared across columnar models."""
+
+import abc
+from typing import Any
+from typing import ClassVar
+from typing import ContextManager
+from typing import Iterable
+from typing import Tuple
+
+from my_data_model.models_columnar.store import Store
+from my_data_model.models_columnar.store import current_store
+from my_data_model.models_columnar.store import store_scope
+
+
+class View(abc.ABC):
+    """Base class for models, each instance of which is a view of one row.
+
+    Views are immutable, and compare equal if their attributes are equal,
+    whichever store they refer to. Attribute values are read from the store
+    on access, so that only the store's columns are retained in memory.
+    """
+
+    __slots__ = ("_store", "_row")
+
+    _fields: ClassVar[Tuple[str, ...]] = ()
+    """Names of the attributes, in the order in which they are shown."""
+
+    _store: Store
+    _row: int
+
+    @classmethod
+    def _view(cls, store: Store, row: int) -> Any:
+        """Create a view of a row."""
+        obj = object.__new__(cls)
+        object.__setattr__(obj, "_store", store)
+        object.__setattr__(obj, "_row", row)
+        return obj
+
+    @classmethod
+    @abc.abstractmethod
+    def _add(cls, store: Store, **kwargs: Any) -> int:
+        """Append a row for an object, returning its row number.
+
+        The attributes must already have been validated.
+        """
+
+    def _init(self, **kwargs: Any) -> None:
+        """Initialize a new view with a new row in the current store."""
+        store = current_store()
+        object.__setattr__(self, "_store", store)
+        object.__setattr__(self, "_row", type(self)._add(store, **kwargs))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Prevent modification."""
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        """Prevent modification."""
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self) -> Any:
+        """Pickle as a reference to the store and row."""
+        return (type(self)._view, (self._store, self._row))
+
+    def _values(self) -> Tuple[Any, ...]:
+        """Get the values of the attributes."""
+        return tuple(getattr(self, name) for name in self._fields)
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare attribute values."""
+        if type(other) is not type(self):
+            return NotImplemented
+        if self._store is other._store and self._row == other._row:
+            return True
+        return self._values() == other._values()
+
+    def __hash__(self) -> int:
+        """Hash attribute values."""
+        return hash((type(self), self._values()))
+
+    def __repr__(self) -> str:
+        """Represent as a string."""
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{type(self).__name__}({values})"
+
+
+def check_type(name: str, value: Any, types: Any) -> None:
+    """Check the type of an attribute value.
+
+    Args:
+        name: name of the attribute
+        value: value of the attribute
+        types: type, or tuple of types, of which the value must be an instance
+
+    Raises:
+        TypeError: if the value is of the wrong type
+    """
+    if not isinstance(value, types):
+        raise TypeError(
+            f"{name!r} must be {types!r} (got {value!r} that is a "
+            f"{value.__class__!r})."
+        )
+
+
+def check_members(name: str, values: Iterable[Any], types: Any) -> None:
+    """Check the type of each member of an attribute value.
+
+    Args:
+        name: name of the attribute
+        values: members of the attribute value
+        types: type, or tuple of types, of which each member must be an
+               instance
+
+    Raises:
+        TypeError: if a member is of the wrong type
+    """
+    for value in values:
+        check_type(name=name, value=value, types=types)
+
+
+def construct(cls: type[Any], **kwargs: Any) -> Any:
+    """Create a model object from trusted data, without validation.
+
+    Appends a row to the current store directly, bypassing ``__init__`` and
+    with it the type and value checks. The caller is responsible for
+    providing every attribute, with valid values.
+    """
+    store = current_store()
+    return cls._view(store, cls._add(store, **kwargs))
+
+
+def construct_scope() -> ContextManager[None]:
+    """Scope in which the model objects of one YAML document are created.
+
+    Loaders enter a scope for each document, so that the objects of each
+    document have their own store, and neither the rows of a failed load nor
+    those of a document whose root is not an interface are left in the
+    current store.
+    """
+    return store_scope()
@@ -0,0 +1,154 @@
+"""Interfaces."""
+
+from typing import Any
+from typing import Iterator
+from typing import List
+from typing import Mapping
+from typing import Sequence
+from typing import Union
+from typing import overload
+
+from my_data_model.models_columnar.commands import Command
+from my_data_model.models_columnar.common import View
+from my_data_model.models_columnar.common import check_members
+from my_data_model.models_columnar.common import check_type
+from my_data_model.models_columnar.store import Store
+from my_data_model.models_columnar.store import seal_store
+from my_data_model.utils import index_no_dups
+
+
+class _Commands(Sequence[Command]):
+    """Read-only sequence view of the commands of an interface."""
+
+    __slots__ = ("_store", "_indexes")
+
+    def __init__(self, store: Store, indexes: range) -> None:
+        self._store = store
+        self._indexes = indexes
+
+    @overload
+    def __getitem__(self, index: int) -> Command:
+        ...  # pragma: no cover
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Command]:
+        ...  # pragma: no cover
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(len(self))[index]]
+        return Command._view(
+            self._store, self._store.interface_command[self._indexes[index]]
+        )
+
+    def __len__(self) -> int:
+        return len(self._indexes)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class _CommandsByName(Mapping[str, Command]):
+    """Read-only mapping view of the commands of an interface, by name."""
+
+    __slots__ = ("_store", "_index")
+
+    def __init__(self, store: Store, index: Mapping[str, int]) -> None:
+        self._store = store
+        self._index = index
+
+    def __getitem__(self, key: str) -> Command:
+        return Command._view(self._store, self._index[key])  # type: ignore [no-any-return]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class Interface(View):
+    """An interface.
+
+    Creating an interface seals the current store, so that each interface
+    owns the store holding its commands, values and types.
+    """
+
+    __slots__ = ()
+
+    _fields = ("commands", "name")
+
+    def __init__(self, *, commands: List[Command], name: str) -> None:
+        """Create an interface, appending it to the current store."""
+        # Check that members are Command instances
+        check_members(name="commands", values=commands, types=Command)
+        # Index commands by position, checking that command names are unique
+        positions = index_no_dups(
+            name="command names",
+            data=((cmd.name, position) for position, cmd in enumerate(commands)),
+        )
+        check_type(name="name", value=name, types=str)
+        self._init(commands=commands, name=name, positions=positions)
+
+    @classmethod
+    def _add(cls, store: Store, **kwargs: Any) -> int:
+        """Append a row to the interfaces table, and seal the store.
+
+        The commands are indexed by name if their positions by name are
+        given, and otherwise when the index is first needed.
+        """
+        command_rows = [
+            store.import_command(command._store, command._row)
+            for command in kwargs["commands"]
+        ]
+        positions = kwargs.get("positions")
+        row = store.add_interface(
+            name=kwargs["name"],
+            command_rows=command_rows,
+            index=(
+                None
+                if positions is None
+                else {name: command_rows[pos] for name, pos in positions.items()}
+            ),
+        )
+        seal_store()
+        return row
+
+    @property
+    def commands(self) -> Sequence[Command]:
+        """Commands in the interface."""
+        return _Commands(self._store, self._store.commands(self._row))
+
+    @property
+    def name(self) -> str:
+        """Name of the interface."""
+        return self._store.strings[self._store.interface_name[self._row]]
+
+    @property
+    def commands_by_name(self) -> Mapping[str, Command]:
+        """Commands in the interface, by name."""
+        return _CommandsByName(self._store, self._store.command_index(self._row))
+
+    def command(self, name: str) -> Command:
+        """Get a command by name.
+
+        Args:
+            name: name of the command
+
+        Returns:
+            The command
+
+        Raises:
+            KeyError: if the interface has no such command
+        """
+        return Command._view(  # type: ignore [no-any-return]
+            self._store, self._store.command_index(self._row)[name]
+        )
@@ -0,0 +1,318 @@
+"""Columnar storage of model objects.
+
+Each kind of model object is stored as a table, which is a set of parallel
+``array`` columns with one row per object. Strings are stored once in a
+string table and referred to by index, and references between objects are
+row numbers. A model object is a view of one row.
+"""
+
+import contextlib
+import sys
+import threading
+from array import array
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+
+NO_ROW = -1
+"""Row number which refers to no row."""
+
+
+class StringTable:
+    """Table of distinct strings, each identified by its index."""
+
+    def __init__(self) -> None:
+        """Create an empty string table."""
+        self.strings: List[str] = []
+        """Strings, by index."""
+
+        self._indexes: Optional[Dict[str, int]] = {}
+
+    def __len__(self) -> int:
+        """Number of strings."""
+        return len(self.strings)
+
+    def __getitem__(self, index: int) -> str:
+        """Get a string by index."""
+        return self.strings[index]
+
+    def __getstate__(self) -> List[str]:
+        """Get state for pickling, which omits the index of each string."""
+        return self.strings
+
+    def __setstate__(self, state: List[str]) -> None:
+        """Restore state when unpickling."""
+        self.strings = state
+        self._indexes = None
+
+    def release_index(self) -> None:
+        """Release the index used to find strings which are already present.
+
+        The index is rebuilt if another string is added.
+        """
+        self._indexes = None
+
+    def add(self, value: str) -> int:
+        """Add a string, unless it is already present.
+
+        Args:
+            value: the string
+
+        Returns:
+            Index of the string
+        """
+        if self._indexes is None:
+            self._indexes = {value: index for index, value in enumerate(self.strings)}
+        index = self._indexes.get(value)
+        if index is None:
+            index = self._indexes[value] = len(self.strings)
+            self.strings.append(value)
+        return index
+
+
+class Store:
+    """Tables of model objects.
+
+    Rows are only ever appended, so a view of a row remains valid for the
+    lifetime of the store.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty store."""
+        self.strings = StringTable()
+        """Strings referred to by the tables."""
+
+        self.type_kind = array("B")
+        """Kind of each type, which is an index into :data:`.types.TYPE_KINDS`."""
+        self.type_name = array("I")
+        self.type_description = array("I")
+        self.type_value = array("q")
+        """Width of each width-templated type, or size of each array type."""
+        self.type_element = array("q")
+        """Row of the element type of each array type, otherwise NO_ROW."""
+
+        self.value_name = array("I")
+        self.value_description = array("I")
+        self.value_type = array("I")
+
+        self.command_name = array("I")
+        self.command_description = array("I")
+        self.command_inputs = array("I")
+        """Index of the first input of each command in the input columns; the
+        inputs of a command end where those of the next command start."""
+
+        self.input_key = array("I")
+        self.input_value = array("I")
+
+        self.interface_name = array("I")
+        self.interface_commands = array("I")
+        """Index of the first command of each interface in
+        ``interface_command``."""
+        self.interface_command = array("I")
+        """Rows of the commands of the interfaces."""
+        self.interface_index: Dict[int, Dict[str, int]] = {}
+        """Rows of the commands of each interface, by name, built when first
+        needed unless the interface was created with them."""
+
+    def _columns(self) -> Iterable["array[int]"]:
+        """All columns of all tables."""
+        return (
+            value for value in vars(self).values() if isinstance(value, array)
+        )
+
+    def __sizeof__(self) -> int:
+        """Size of the store, including its columns and string table."""
+        return (
+            object.__sizeof__(self)
+            + sum(sys.getsizeof(column) for column in self._columns())
+            + sys.getsizeof(self.strings.strings)
+            + sum(sys.getsizeof(value) for value in self.strings.strings)
+        )
+
+    def add_type(
+        self, kind: int, name: str, description: str, value: int, element: int
+    ) -> int:
+        """Append a row to the types table, returning its row number."""
+        self.type_kind.append(kind)
+        self.type_name.append(self.strings.add(name))
+        self.type_description.append(self.strings.add(description))
+        self.type_value.append(value)
+        self.type_element.append(element)
+        return len(self.type_kind) - 1
+
+    def add_value(self, name: str, description: str, type_row: int) -> int:
+        """Append a row to the command values table, returning its row number."""
+        self.value_name.append(self.strings.add(name))
+        self.value_description.append(self.strings.add(description))
+        self.value_type.append(type_row)
+        return len(self.value_name) - 1
+
+    def add_command(
+        self, name: str, description: str, inputs: Iterable[Tuple[str, int]]
+    ) -> int:
+        """Append a row to the commands table, returning its row number.
+
+        Args:
+            name: name of the command
+            description: description of the command
+            inputs: key and command value row of each input
+        """
+        self.command_name.append(self.strings.add(name))
+        self.command_description.append(self.strings.add(description))
+        self.command_inputs.append(len(self.input_key))
+        for key, value_row in inputs:
+            self.input_key.append(self.strings.add(key))
+            self.input_value.append(value_row)
+        return len(self.command_name) - 1
+
+    def add_interface(
+        self,
+        name: str,
+        command_rows: Iterable[int],
+        index: Optional[Dict[str, int]] = None,
+    ) -> int:
+        """Append a row to the interfaces table, returning its row number.
+
+        Args:
+            name: name of the interface
+            command_rows: rows of the commands of the interface
+            index: rows of the commands by name, if already known
+        """
+        self.interface_name.append(self.strings.add(name))
+        self.interface_commands.append(len(self.interface_command))
+        self.interface_command.extend(command_rows)
+        row = len(self.interface_name) - 1
+        if index is not None:
+            self.interface_index[row] = index
+        return row
+
+    def inputs(self, row: int) -> range:
+        """Get the indexes of the inputs of a command in the input columns."""
+        stop = (
+            self.command_inputs[row + 1]
+            if row + 1 < len(self.command_inputs)
+            else len(self.input_key)
+        )
+        return range(self.command_inputs[row], stop)
+
+    def commands(self, row: int) -> range:
+        """Get the indexes of the commands of an interface.
+
+        The indexes are positions in ``interface_command``.
+        """
+        stop = (
+            self.interface_commands[row + 1]
+            if row + 1 < len(self.interface_commands)
+            else len(self.interface_command)
+        )
+        return range(self.interface_commands[row], stop)
+
+    def command_index(self, row: int) -> Dict[str, int]:
+        """Get the rows of the commands of an interface, by name."""
+        index = self.interface_index.get(row)
+        if index is None:
+            index = self.interface_index[row] = {
+                self.strings[self.command_name[command_row]]: command_row
+                for command_row in (
+                    self.interface_command[position]
+                    for position in self.commands(row)
+                )
+            }
+        return index
+
+    def import_type(self, store: "Store", row: int) -> int:
+        """Copy a type, and its element types, from another store.
+
+        Args:
+            store: store containing the type
+            row: row of the type in that store
+
+        Returns:
+            Row of the type in this store
+        """
+        if store is self:
+            return row
+        element = store.type_element[row]
+        return self.add_type(
+            kind=store.type_kind[row],
+            name=store.strings[store.type_name[row]],
+            description=store.strings[store.type_description[row]],
+            value=store.type_value[row],
+            element=NO_ROW if element == NO_ROW else self.import_type(store, element),
+        )
+
+    def import_value(self, store: "Store", row: int) -> int:
+        """Copy a command value, and its type, from another store."""
+        if store is self:
+            return row
+        return self.add_value(
+            name=store.strings[store.value_name[row]],
+            description=store.strings[store.value_description[row]],
+            type_row=self.import_type(store, store.value_type[row]),
+        )
+
+    def import_command(self, store: "Store", row: int) -> int:
+        """Copy a command, and its inputs, from another store."""
+        if store is self:
+            return row
+        return self.add_command(
+            name=store.strings[store.command_name[row]],
+            description=store.strings[store.command_description[row]],
+            inputs=[
+                (
+                    store.strings[store.input_key[index]],
+                    self.import_value(store, store.input_value[index]),
+                )
+                for index in store.inputs(row)
+            ],
+        )
+
+
+_local = threading.local()
+
+
+def current_store() -> Store:
+    """Get the store to which objects created by this thread are added."""
+    try:
+        return _local.store  # type: ignore [no-any-return]
+    except AttributeError:
+        store = _local.store = Store()
+        return store
+
+
+def seal_store() -> None:
+    """Start a new store for objects subsequently created by this thread.
+
+    Called when an interface is created, so that each interface, which is
+    the root of a model, owns a store containing only what it refers to.
+    Objects from a sealed store which are used to create further objects
+    are copied into the new store.
+    """
+    current_store().strings.release_index()
+    _local.store = Store()
+
+
+@contextlib.contextmanager
+def store_scope() -> Iterator[None]:
+    """Create objects in a fresh store, which is sealed on exit.
+
+    The fresh store is only created if an object is created in the scope. The
+    store which was current on entry, if any, is current again on exit,
+    whether or not the body raised, so that rows of objects created in the
+    scope never accumulate in it.
+    """
+    previous = _local.__dict__.pop("store", None)
+    try:
+        yield
+    finally:
+        # Seal whichever store is current, which differs from the first one
+        # created in the scope if an interface has sealed that already
+        store = _local.__dict__.pop("store", None)
+        if store is not None:
+            store.strings.release_index()
+        if previous is not None:
+            _local.store = previous
@@ -0,0 +1,150 @@
+"""Types."""
+
+from typing import Any
+from typing import ClassVar
+from typing import Tuple
+from typing import Union
+
+from my_data_model.models_columnar.common import View
+from my_data_model.models_columnar.common import check_type
+from my_data_model.models_columnar.store import NO_ROW
+from my_data_model.models_columnar.store import Store
+
+
+class Type(View):
+    """Base class for types."""
+
+    __slots__ = ()
+
+    internable: ClassVar[bool] = True
+    """Types are immutable values, so equal instances may be shared."""
+
+    _kind: ClassVar[int]
+    """Index of the class in :data:`TYPE_KINDS`."""
+
+    @property
+    def description(self) -> str:
+        """Description of the type."""
+        return self._store.strings[self._store.type_description[self._row]]
+
+    @property
+    def name(self) -> str:
+        """Name of the type."""
+        return self._store.strings[self._store.type_name[self._row]]
+
+
+class _WidthTemplatedType(Type):
+    """Base class for types which are instantiated at different widths."""
+
+    __slots__ = ()
+
+    _fields = ("description", "name", "width")
+
+    def __init__(self, *, description: str, name: str, width: int) -> None:
+        """Create a type, appending it to the current store."""
+        check_type(name="description", value=description, types=str)
+        check_type(name="name", value=name, types=str)
+        check_type(name="width", value=width, types=int)
+        if width <= 0:
+            raise ValueError("width is not positive")
+        self._init(description=description, name=name, width=width)
+
+    @classmethod
+    def _add(cls, store: Store, **kwargs: Any) -> int:
+        """Append a row to the types table."""
+        return store.add_type(
+            kind=cls._kind,
+            name=kwargs["name"],
+            description=kwargs["description"],
+            value=kwargs["width"],
+            element=NO_ROW,
+        )
+
+    @property
+    def width(self) -> int:
+        """Width of the type in bits."""
+        return self._store.type_value[self._row]
+
+
+class Address(_WidthTemplatedType):
+    """An address type."""
+
+    __slots__ = ()
+
+    _kind = 0
+
+
+class Bits(_WidthTemplatedType):
+    """A bitfield type."""
+
+    __slots__ = ()
+
+    _kind = 1
+
+
+class Array(Type):
+    """Array type."""
+
+    __slots__ = ()
+
+    _kind = 2
+
+    _fields = ("description", "name", "size", "type")
+
+    def __init__(self, *, description: str, name: str, size: int, type: Type) -> None:
+        """Create a type, appending it to the current store."""
+        check_type(name="description", value=description, types=str)
+        check_type(name="name", value=name, types=str)
+        check_type(name="size", value=size, types=int)
+        if size < 0:
+            raise ValueError("size is negative")
+        check_type(name="type", value=type, types=Type)
+        self._init(description=description, name=name, size=size, type=type)
+
+    @classmethod
+    def _add(cls, store: Store, **kwargs: Any) -> int:
+        """Append a row to the types table."""
+        element = kwargs["type"]
+        return store.add_type(
+            kind=cls._kind,
+            name=kwargs["name"],
+            description=kwargs["description"],
+            value=kwargs["size"],
+            element=store.import_type(element._store, element._row),
+        )
+
+    @property
+    def size(self) -> int:
+        """Number of elements in the array."""
+        return self._store.type_value[self._row]
+
+    @property
+    def type(self) -> Type:
+        """Type of elements in the array."""
+        return type_view(self._store, self._store.type_element[self._row])
+
+    @property
+    def width(self) -> int:
+        """Width of the array in bits."""
+        return self.size * self.type.width  # type: ignore [attr-defined,no-any-return]
+
+
+TYPE_KINDS: Tuple[type[Type], ...] = (Address, Bits, Array)
+"""Classes of type, in the order of their kind numbers."""
+
+
+def type_view(store: Store, row: int) -> Type:
+    """Create a view of a row of the types table, of the class of its kind.
+
+    Args:
+        store: store containing the type
+        row: row of the type
+
+    Returns:
+        View of the type
+    """
+    return TYPE_KINDS[store.type_kind[row]]._view(store, row)  # type: ignore [no-any-return]
+
+
+GeneralType = Union[Address, Array, Bits]
+"""Union of general types."""
@@ -40,6 +40,6 @@ class Command(Model):
     ) -> Mapping[str, CommandValue]:
         """Validate inputs."""
         check_iterable_no_dups(
-            name="input value names", data=[entry.name for entry in value.values()]
+            name="input value names", data=(entry.name for entry in value.values())
         )
         return value
@@ -1,5 +1,7 @@
 """Common code shared across pydantic models."""
 
+from typing import Any
+
 from pydantic import BaseModel
 
 
@@ -11,3 +13,12 @@ class Model(BaseModel):
         "frozen": True,
         "validate_default": True,
     }
+
+
+def construct(cls: type[Model], **kwargs: Any) -> Model:
+    """Create a model object from trusted data, without validation.
+
+    Uses pydantic's ``model_construct``. The caller is responsible for
+    providing every attribute, with valid values.
+    """
+    return cls.model_construct(**kwargs)
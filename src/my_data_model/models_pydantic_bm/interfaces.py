@@ -1,7 +1,12 @@
 """Interfaces."""
 
+from types import MappingProxyType
+from typing import Any
+from typing import Dict
 from typing import List
+from typing import Mapping
 
+from pydantic import PrivateAttr
 from pydantic import field_validator
 
 from my_data_model.models_pydantic_bm.commands import Command
@@ -18,10 +23,38 @@ class Interface(Model):
     name: str
     """Name of the interface."""
 
+    _commands_by_name: Dict[str, Command] = PrivateAttr()
+
     @field_validator("commands")
     def _command_names_unique(
         cls, value: List[Command]  # noqa: B902,N805
     ) -> List[Command]:
         """Check that command names are unique."""
-        check_iterable_no_dups(name="command names", data=[cmd.name for cmd in value])
+        check_iterable_no_dups(name="command names", data=(cmd.name for cmd in value))
         return value
+
+    def model_post_init(self, context: Any) -> None:
+        """Index commands by name.
+
+        Also run by ``model_construct``.
+        """
+        self._commands_by_name = {cmd.name: cmd for cmd in self.commands}
+
+    @property
+    def commands_by_name(self) -> Mapping[str, Command]:
+        """Commands in the interface, by name."""
+        return MappingProxyType(self._commands_by_name)
+
+    def command(self, name: str) -> Command:
+        """Get a command by name.
+
+        Args:
+            name: name of the command
+
+        Returns:
+            The command
+
+        Raises:
+            KeyError: if the interface has no such command
+        """
+        return self._commands_by_name[name]
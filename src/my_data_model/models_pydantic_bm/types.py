@@ -1,5 +1,6 @@
 """Types."""
 
+from typing import ClassVar
 from typing import Union
 
 from pydantic import field_validator
@@ -10,6 +11,9 @@ from my_data_model.models_pydantic_bm.common import Model
 class Type(Model):
     """Base class for types."""
 
+    internable: ClassVar[bool] = True
+    """Types are immutable values, so equal instances may be shared."""
+
 
 class _WidthTemplatedType(Type):
     """Base class for types which are instantiated at different widths."""
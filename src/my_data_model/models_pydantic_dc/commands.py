@@ -42,6 +42,6 @@ class Command:
     ) -> Mapping[str, CommandValue]:
         """Validate inputs."""
         check_iterable_no_dups(
-            name="input value names", data=[entry.name for entry in value.values()]
+            name="input value names", data=(entry.name for entry in value.values())
         )
         return value
@@ -16,3 +16,17 @@ def model(cls: type[Any]) -> type[Any]:
             validate_default=True,
         ),
     )
+
+
+def construct(cls: type[Any], **kwargs: Any) -> Any:
+    """Create a model object from trusted data, without validation.
+
+    pydantic dataclasses have no equivalent of ``model_construct``, so this
+    bypasses ``__init__`` and sets the fields of a new instance directly, as
+    the frozen dataclass ``__init__`` itself does. The caller is responsible
+    for providing every attribute, with valid values.
+    """
+    obj = object.__new__(cls)
+    for name, value in kwargs.items():
+        object.__setattr__(obj, name, value)
+    return obj
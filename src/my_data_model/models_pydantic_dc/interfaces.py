@@ -1,6 +1,10 @@
 """Interfaces."""
 
+from functools import cached_property
+from types import MappingProxyType
+from typing import Dict
 from typing import List
+from typing import Mapping
 
 from pydantic import field_validator
 
@@ -24,5 +28,33 @@ class Interface:
         cls, value: List[Command]  # noqa: B902,N805
     ) -> List[Command]:
         """Check that command names are unique."""
-        check_iterable_no_dups(name="command names", data=[cmd.name for cmd in value])
+        check_iterable_no_dups(name="command names", data=(cmd.name for cmd in value))
         return value
+
+    @cached_property
+    def _commands_by_name(self) -> Dict[str, Command]:
+        """Commands in the interface by name, indexed on first use.
+
+        A cached property is not a dataclass field, so it is neither compared
+        nor serialized.
+        """
+        return {cmd.name: cmd for cmd in self.commands}
+
+    @property
+    def commands_by_name(self) -> Mapping[str, Command]:
+        """Commands in the interface, by name."""
+        return MappingProxyType(self._commands_by_name)
+
+    def command(self, name: str) -> Command:
+        """Get a command by name.
+
+        Args:
+            name: name of the command
+
+        Returns:
+            The command
+
+        Raises:
+            KeyError: if the interface has no such command
+        """
+        return self._commands_by_name[name]
@@ -1,5 +1,6 @@
 """Types."""
 
+from typing import ClassVar
 from typing import Union
 
 from pydantic import field_validator
@@ -11,6 +12,9 @@ from my_data_model.models_pydantic_dc.common import model
 class Type:
     """Base class for types."""
 
+    internable: ClassVar[bool] = True
+    """Types are immutable values, so equal instances may be shared."""
+
 
 @model
 class _WidthTemplatedType(Type):
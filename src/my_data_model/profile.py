@@ -0,0 +1,138 @@
+"""Instrumentation of model loading."""
+
+import time
+from contextlib import contextmanager
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Tuple
+
+
+PHASES = ["scan", "parse", "compose", "resolve", "construct", "validate"]
+"""Phases of loading, in the order in which data flows through them.
+
+scan
+    Converting characters to tokens. Only measured separately by the pure
+    Python parser backend; included in ``compose`` for libyaml.
+parse
+    Converting tokens to events. Only measured separately by the pure Python
+    parser backend; included in ``compose`` for libyaml.
+compose
+    Converting events to a graph of YAML nodes.
+resolve
+    Looking up the class identified by a YAML tag.
+construct
+    Converting YAML nodes to Python objects, excluding the other phases.
+validate
+    Creating model objects from their attributes, including validation.
+"""
+
+
+class PhaseStats:
+    """Accumulated time and number of calls."""
+
+    __slots__ = ("calls", "time_ns")
+
+    def __init__(self) -> None:
+        """Create empty stats."""
+        self.calls = 0
+        self.time_ns = 0
+
+    @property
+    def time(self) -> float:
+        """Accumulated time in seconds."""
+        return self.time_ns / 1e9
+
+    def __repr__(self) -> str:
+        """Represent as a string."""
+        return f"PhaseStats(calls={self.calls}, time_ns={self.time_ns})"
+
+
+class LoadStats:
+    """Time and call counts accumulated while loading.
+
+    Time is attributed exclusively: time spent in a nested phase, for example
+    scanning performed on demand by the parser, is not also counted against
+    the enclosing phase.
+    """
+
+    def __init__(self) -> None:
+        """Create empty stats."""
+        self.phases: Dict[str, PhaseStats] = {phase: PhaseStats() for phase in PHASES}
+        """Stats for each phase."""
+
+        self.classes: Dict[str, PhaseStats] = {}
+        """Stats for the validate phase, for each model class, identified by its
+        tag without the prefix, e.g. ``commands.CommandValue``."""
+
+        self._stack: List[Tuple[str, int]] = []
+        self._last = 0
+
+    @property
+    def total_ns(self) -> int:
+        """Total time in all phases, in nanoseconds."""
+        return sum(stats.time_ns for stats in self.phases.values())
+
+    def _charge(self, now: int) -> None:
+        """Charge time since the last transition to the current phase."""
+        if self._stack:
+            self.phases[self._stack[-1][0]].time_ns += now - self._last
+        self._last = now
+
+    @contextmanager
+    def phase(self, phase: str) -> Iterator[None]:
+        """Context manager which attributes time spent within it to a phase.
+
+        Args:
+            phase: name of the phase, one of :const:`PHASES`
+
+        Yields:
+            None
+        """
+        now = time.perf_counter_ns()
+        self._charge(now)
+        self._stack.append((phase, now))
+        try:
+            yield
+        finally:
+            now = time.perf_counter_ns()
+            self._charge(now)
+            self._stack.pop()
+            self.phases[phase].calls += 1
+
+    @contextmanager
+    def model_class(self, name: str) -> Iterator[None]:
+        """Context manager which attributes validation time to a model class.
+
+        Args:
+            name: name of the class, e.g. ``commands.CommandValue``
+
+        Yields:
+            None
+        """
+        start = time.perf_counter_ns()
+        with self.phase("validate"):
+            yield
+        stats = self.classes.setdefault(name, PhaseStats())
+        stats.calls += 1
+        stats.time_ns += time.perf_counter_ns() - start
+
+    def report(self) -> List[str]:
+        """Format the stats as a table.
+
+        Returns:
+            Lines of the table
+        """
+        total = self.total_ns or 1
+        lines = [f"{'Phase':30s}{'calls':>10s}{'time (s)':>12s}{'share':>8s}"]
+        for name, stats in self.phases.items():
+            lines.append(
+                f"{name:30s}{stats.calls:10d}{stats.time:12.6f}"
+                f"{stats.time_ns / total:8.1%}"
+            )
+        lines.append(f"{'total':30s}{'':10s}{self.total_ns / 1e9:12.6f}")
+        lines.append("")
+        lines.append(f"{'Validate, by class':30s}{'calls':>10s}{'time (s)':>12s}")
+        for name, stats in sorted(self.classes.items()):
+            lines.append(f"{name:30s}{stats.calls:10d}{stats.time:12.6f}")
+        return lines
@@ -0,0 +1,123 @@
+"""Queries across the interfaces of a model.
+
+The indexes are built from model objects of any model package, so that
+queries need not scan every command of every interface.
+"""
+
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import NamedTuple
+from typing import Tuple
+
+from my_data_model.utils import index_no_dups
+
+
+class CommandRef(NamedTuple):
+    """A command, and the interface which contains it."""
+
+    interface: Any
+    """The interface."""
+
+    command: Any
+    """The command."""
+
+
+def type_names(data_type: Any) -> Iterator[str]:
+    """Get the names of a type and of the types which it is built from.
+
+    Args:
+        data_type: the type, which is an array type if it has a ``type``
+
+    Yields:
+        Name of the type, then of its element type, recursively
+    """
+    while data_type is not None:
+        yield data_type.name
+        data_type = getattr(data_type, "type", None)
+
+
+class ModelIndex:
+    """Indexes of the commands of a set of interfaces.
+
+    The indexes are built once, when the index is created, and are not
+    updated; interfaces are immutable, so they remain valid for as long as
+    the same interfaces are queried.
+    """
+
+    def __init__(self, interfaces: Iterable[Any]) -> None:
+        """Index interfaces.
+
+        Args:
+            interfaces: the interfaces
+
+        Raises:
+            ValueError: if interface names are not unique
+        """
+        self.interfaces: Dict[str, Any] = index_no_dups(
+            name="interface names",
+            data=((interface.name, interface) for interface in interfaces),
+        )
+        """Interfaces, by name."""
+
+        by_name: Dict[str, List[CommandRef]] = {}
+        by_type: Dict[str, List[CommandRef]] = {}
+        for interface in self.interfaces.values():
+            for command in interface.commands:
+                ref = CommandRef(interface=interface, command=command)
+                by_name.setdefault(command.name, []).append(ref)
+                used = {
+                    name
+                    for value in command.inputs.values()
+                    for name in type_names(value.type)
+                }
+                for name in sorted(used):
+                    by_type.setdefault(name, []).append(ref)
+
+        self._by_name = {name: tuple(refs) for name, refs in by_name.items()}
+        self._by_type = {name: tuple(refs) for name, refs in by_type.items()}
+
+    def command(self, interface: str, name: str) -> Any:
+        """Get a command of an interface.
+
+        Args:
+            interface: name of the interface
+            name: name of the command
+
+        Returns:
+            The command
+
+        Raises:
+            KeyError: if there is no such interface, or it has no such command
+        """
+        return self.interfaces[interface].command(name)
+
+    def commands_named(self, name: str) -> Tuple[CommandRef, ...]:
+        """Find the commands with a name, in any interface.
+
+        Args:
+            name: name of the commands
+
+        Returns:
+            The commands, in order of interface then of command
+        """
+        return self._by_name.get(name, ())
+
+    def commands_using_type(self, name: str) -> Tuple[CommandRef, ...]:
+        """Find the commands with an input of a type.
+
+        An input of an array type also uses the element type of the array.
+
+        Args:
+            name: name of the type
+
+        Returns:
+            The commands, in order of interface then of command
+        """
+        return self._by_type.get(name, ())
+
+    def type_names(self) -> List[str]:
+        """Get the names of all types used by commands, in sorted order."""
+        return sorted(self._by_type)
@@ -0,0 +1,371 @@
+"""Repository of model files, with an index of the objects defined in them."""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Set
+from typing import Union
+
+import yaml
+
+from my_data_model.cache import FileStamp
+from my_data_model.cache import IncludeCache
+from my_data_model.cache import file_stamp
+from my_data_model.io import DEFAULT_PACKAGE
+from my_data_model.io import NEW_INCLUDE_CACHE
+from my_data_model.io import NamedStringIO
+from my_data_model.io import get_loader_class
+from my_data_model.io import load
+from my_data_model.tags import TAG_PREFIX
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+DEFAULT_INDEX_NAME = ".model-index.json"
+"""Name of the index file which is created in the repository directory, unless
+another path is given."""
+
+_INDEX_VERSION = 1
+"""Version of the index file format."""
+
+
+class IndexEntry(NamedTuple):
+    """Location of a named model object in the repository."""
+
+    tag: str
+    """YAML tag of the object, which identifies its class."""
+
+    name: str
+    """Name of the object."""
+
+    path: str
+    """Path to the file in which the object is defined, relative to the
+    repository directory."""
+
+    start: int
+    """Byte offset of the start of the object's node in the file."""
+
+    end: int
+    """Byte offset of the end of the object's node in the file."""
+
+
+def _byte_offsets(text: str, indexes: List[int]) -> List[int]:
+    """Convert character indexes in a text to byte offsets in its UTF-8 encoding."""
+    if text.isascii():
+        return indexes
+    return [len(text[:index].encode()) for index in indexes]
+
+
+class ModelRepository:
+    """Directory tree of model files, with an index of the objects in them.
+
+    Every named model object in every ``.yaml`` file in the tree, such as an
+    interface, a command or a type, is recorded in the index, with the
+    location of its node in the file. An object is loaded by parsing only the
+    text of its node, and the files which that includes, so that one object
+    can be found and loaded without loading the whole model.
+
+    The index is stored in a JSON file. When the repository is refreshed,
+    only files which have been added or modified since the index was written
+    are scanned again.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, "os.PathLike[str]"],
+        package: Optional[str] = None,
+        backend: Optional[str] = None,
+        index_path: Optional[Union[str, "os.PathLike[str]"]] = None,
+        include_cache: Optional[IncludeCache] = NEW_INCLUDE_CACHE,
+    ):
+        """Open a repository, scanning files which are not already indexed.
+
+        Args:
+            directory: root of the directory tree
+            package: package from which models are loaded, defaults to
+                     :const:`~my_data_model.io.DEFAULT_PACKAGE`
+            backend: YAML parser backend, one of
+                     :const:`~my_data_model.io.BACKENDS`, defaults to
+                     :const:`~my_data_model.io.DEFAULT_BACKEND`
+            index_path: path to the index file, defaults to
+                     :const:`DEFAULT_INDEX_NAME` in the directory
+            include_cache: cache of data loaded from included files, such as
+                     :const:`~my_data_model.cache.INCLUDE_CACHE` to reuse data
+                     across loads, or None to disable; defaults to
+                     :const:`~my_data_model.io.NEW_INCLUDE_CACHE`, a new cache
+                     for each load
+        """
+        self.directory = Path(directory).resolve()
+        self.package = package or DEFAULT_PACKAGE
+        self.backend = backend
+        self.index_path = (
+            Path(index_path)
+            if index_path is not None
+            else self.directory / DEFAULT_INDEX_NAME
+        )
+        self.include_cache = include_cache
+
+        self._stamps: Dict[str, FileStamp] = {}
+        self._entries: Dict[str, List[IndexEntry]] = {}
+        self._by_name: Dict[str, List[IndexEntry]] = {}
+
+        self._read_index()
+        self.refresh()
+
+    def __len__(self) -> int:
+        """Number of objects in the index."""
+        return sum(len(entries) for entries in self._entries.values())
+
+    def __iter__(self) -> Iterator[IndexEntry]:
+        """Iterate over the objects in the index, in order of file and offset."""
+        for path in sorted(self._entries):
+            yield from self._entries[path]
+
+    def _read_index(self) -> None:
+        """Read the index file, unless it is missing or for another package."""
+        try:
+            with open(self.index_path) as stream:
+                index = json.load(stream)
+            if index["version"] != _INDEX_VERSION or index["package"] != self.package:
+                return
+            for path, (mtime_ns, size, entries) in index["files"].items():
+                self._stamps[path] = FileStamp(path=path, mtime_ns=mtime_ns, size=size)
+                self._entries[path] = [IndexEntry(*entry) for entry in entries]
+        except Exception as exc:
+            # A missing or corrupt index file is rebuilt
+            LOGGER.debug(f"ModelRepository index_path={self.index_path} exc={exc!r}")
+            self._stamps.clear()
+            self._entries.clear()
+
+    def _write_index(self) -> None:
+        """Write the index file."""
+        index = {
+            "version": _INDEX_VERSION,
+            "package": self.package,
+            "files": {
+                path: [
+                    stamp.mtime_ns,
+                    stamp.size,
+                    [list(entry) for entry in self._entries[path]],
+                ]
+                for path, stamp in sorted(self._stamps.items())
+            },
+        }
+        tmp_path = f"{os.fspath(self.index_path)}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as stream:
+            json.dump(index, stream)
+        os.replace(tmp_path, self.index_path)
+
+    def refresh(self) -> Set[str]:
+        """Bring the index up to date with the files in the directory tree.
+
+        Files which have been added or modified are scanned, and the objects
+        in files which have been removed are forgotten. The index file is
+        rewritten if anything has changed.
+
+        Returns:
+            Paths, relative to the directory, of the files which were scanned
+
+        Raises:
+            yaml.YAMLError: if a file cannot be parsed
+        """
+        stamps = {
+            path.relative_to(self.directory).as_posix(): file_stamp(path)
+            for path in self.directory.glob("**/*.yaml")
+        }
+        scanned = set()
+        for path, stamp in stamps.items():
+            old = self._stamps.get(path)
+            if old is None or (old.mtime_ns, old.size) != (stamp.mtime_ns, stamp.size):
+                self._entries[path] = self._scan(path)
+                self._stamps[path] = stamp._replace(path=path)
+                scanned.add(path)
+        removed = self._stamps.keys() - stamps.keys()
+        for path in removed:
+            del self._stamps[path]
+            del self._entries[path]
+
+        LOGGER.debug(
+            f"ModelRepository.refresh scanned={sorted(scanned)} "
+            f"removed={sorted(removed)}"
+        )
+
+        self._by_name = {}
+        for entry in self:
+            self._by_name.setdefault(entry.name, []).append(entry)
+        if scanned or removed or not self.index_path.exists():
+            self._write_index()
+
+        return scanned
+
+    def _scan(self, path: str) -> List[IndexEntry]:
+        """Find the named model objects in a file, without constructing them.
+
+        Model objects are recognized by the prefix of their tags, without
+        resolving their classes, so that a file with a misspelt tag is still
+        indexed; the error is raised when that object is loaded.
+        """
+        loader_cls = get_loader_class(package=self.package, backend=self.backend)
+        abs_path = self.directory / path
+        with open(abs_path, encoding="utf-8") as stream:
+            text = stream.read()
+
+        with NamedStringIO(text, name=str(abs_path)) as stream:
+            loader = loader_cls(stream=stream)
+            try:
+                root = loader.get_single_node()  # type: ignore [attr-defined]
+            finally:
+                loader.dispose()  # type: ignore [attr-defined]
+
+        nodes: List[yaml.MappingNode] = []
+        seen: Set[int] = set()
+        pending = [] if root is None else [root]
+        while pending:
+            node = pending.pop()
+            # Aliased nodes are only indexed where they are defined
+            if id(node) in seen:
+                continue
+            seen.add(id(node))
+            if isinstance(node, yaml.SequenceNode):
+                pending.extend(reversed(node.value))
+            elif isinstance(node, yaml.MappingNode):
+                if node.tag.startswith(TAG_PREFIX):
+                    nodes.append(node)
+                pending.extend(value for _, value in reversed(node.value))
+
+        entries = []
+        for node in nodes:
+            name = _node_name(node)
+            if name is None:
+                continue
+            (start, end) = _byte_offsets(
+                text, [node.start_mark.index, node.end_mark.index]
+            )
+            entries.append(
+                IndexEntry(tag=node.tag, name=name, path=path, start=start, end=end)
+            )
+        return sorted(entries, key=lambda entry: entry.start)
+
+    def find(self, name: str, tag: Optional[str] = None) -> List[IndexEntry]:
+        """Find the objects with a name.
+
+        Args:
+            name: name of the objects
+            tag: if given, only objects with this YAML tag are found, for
+                 example ``!commands.Command``
+
+        Returns:
+            Index entries of the objects, in order of file and offset
+        """
+        entries = self._by_name.get(name, [])
+        if tag is None:
+            return list(entries)
+        return [entry for entry in entries if entry.tag == tag]
+
+    def get(self, name: str, tag: Optional[str] = None) -> Any:
+        """Load the object with a name.
+
+        Args:
+            name: name of the object
+            tag: if given, only objects with this YAML tag are considered
+
+        Returns:
+            The model object
+
+        Raises:
+            KeyError: if there is no such object
+            ValueError: if there are several such objects
+        """
+        entries = self.find(name=name, tag=tag)
+        if not entries:
+            raise KeyError(name)
+        if len(entries) > 1:
+            locations = ", ".join(f"{entry.path}@{entry.start}" for entry in entries)
+            raise ValueError(f"{name!r} is ambiguous: {locations}")
+        return self.load(entries[0])
+
+    def load(self, entry: IndexEntry) -> Any:
+        """Load an object from its location.
+
+        Only the text of the object's node is parsed, unless it refers to an
+        anchor defined elsewhere in the file, in which case the whole file is
+        parsed and only the object's node is constructed.
+
+        Args:
+            entry: index entry of the object
+
+        Returns:
+            The model object
+
+        Raises:
+            yaml.YAMLError: if the object cannot be loaded
+            AttributeError: if its tag names no class of the package
+            ImportError: if its tag names no module of the package
+        """
+        abs_path = self.directory / entry.path
+        with open(abs_path, "rb") as stream:
+            stream.seek(entry.start)
+            text = stream.read(entry.end - entry.start).decode()
+
+        with NamedStringIO(text, name=str(abs_path)) as stream:
+            try:
+                return load(
+                    stream=stream,
+                    package=self.package,
+                    backend=self.backend,
+                    include_cache=self.include_cache,
+                )
+            except yaml.composer.ComposerError as exc:
+                LOGGER.debug(f"ModelRepository.load entry={entry} exc={exc}")
+
+        return self._load_in_file(entry)
+
+    def _load_in_file(self, entry: IndexEntry) -> Any:
+        """Load an object by parsing its whole file."""
+        abs_path = self.directory / entry.path
+        with open(abs_path, "rb") as stream:
+            data = stream.read()
+        text = data.decode()
+        index = len(data[: entry.start].decode())
+
+        loader_cls = get_loader_class(package=self.package, backend=self.backend)
+        with NamedStringIO(text, name=str(abs_path)) as stream:
+            loader = loader_cls(
+                stream=stream,
+                include_cache=(
+                    IncludeCache()
+                    if self.include_cache is NEW_INCLUDE_CACHE
+                    else self.include_cache
+                ),
+            )
+            try:
+                root = loader.get_single_node()  # type: ignore [attr-defined]
+                pending = [root]
+                while pending:
+                    node = pending.pop()
+                    if isinstance(node, yaml.MappingNode):
+                        if node.start_mark.index == index and node.tag == entry.tag:
+                            return loader.construct_document(node)
+                        pending.extend(value for _, value in node.value)
+                    elif isinstance(node, yaml.SequenceNode):
+                        pending.extend(node.value)
+            finally:
+                loader.dispose()  # type: ignore [attr-defined]
+
+        raise KeyError(f"{entry.name} not found in {entry.path}; refresh the index")
+
+
+def _node_name(node: yaml.MappingNode) -> Optional[str]:
+    """Get the name of the object of a mapping node, if it has one."""
+    for key_node, value_node in node.value:
+        if key_node.value == "name" and isinstance(value_node, yaml.ScalarNode):
+            return value_node.value  # type: ignore [no-any-return]
+    return None
@@ -0,0 +1,125 @@
+"""Registry of YAML tags."""
+
+import importlib
+import inspect
+import threading
+from typing import Any
+from typing import Dict
+from typing import Optional
+
+
+TAG_PREFIX = "!"
+"""Prefix for YAML tags."""
+
+
+class TagRegistry:
+    """Maps YAML tags such as ``!commands.Command`` to classes in a model package.
+
+    Tags are resolved on first use, by importing the module named by the tag,
+    and the result is stored so that subsequent lookups are a single dict
+    access. A registry is shared by all loaders for the same package: use
+    :func:`~my_data_model.tags.get_tag_registry` to obtain it.
+
+    Classes may also be registered up front, and the registry may be frozen,
+    after which no further tags are resolved or registered.
+    """
+
+    def __init__(self, package: str):
+        """Create tag registry.
+
+        Args:
+            package: package from which models are loaded
+        """
+        self.package = package
+        self._classes: Dict[str, Any] = {}
+        self._frozen = False
+        self._lock = threading.Lock()
+
+    @property
+    def frozen(self) -> bool:
+        """Whether the registry has been frozen."""
+        return self._frozen
+
+    def freeze(self) -> None:
+        """Freeze the registry, so that only already-known tags are resolved."""
+        self._frozen = True
+
+    def register(self, tag: str, cls: Any) -> None:
+        """Register the class for a tag.
+
+        Args:
+            tag: YAML tag, including the prefix
+            cls: class to be constructed for the tag
+
+        Raises:
+            RuntimeError: if the registry is frozen
+        """
+        with self._lock:
+            if self._frozen:
+                raise RuntimeError(f"tag registry for {self.package} is frozen")
+            self._classes[tag] = cls
+
+    def register_module(self, module_name: str) -> None:
+        """Register all classes defined in a module of the package.
+
+        Args:
+            module_name: name of module within package, e.g. ``commands``
+        """
+        module = importlib.import_module(f"{self.package}.{module_name}")
+        for cls_name, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ == module.__name__:
+                self.register(f"{TAG_PREFIX}{module_name}.{cls_name}", cls)
+
+    def resolve(self, tag: str) -> Optional[Any]:
+        """Look up the class identified by a YAML tag.
+
+        Args:
+            tag: YAML tag, including the prefix
+
+        Returns:
+            class, or None if the tag does not have the prefix
+
+        Raises:
+            ValueError: if the registry is frozen and the tag is not registered
+        """
+        try:
+            return self._classes[tag]
+        except KeyError:
+            pass
+
+        if not tag.startswith(TAG_PREFIX):
+            return None
+
+        if self._frozen:
+            raise ValueError(f"tag {tag!r} is not registered for {self.package}")
+
+        type_name = f"{self.package}.{tag[len(TAG_PREFIX):]}"
+        (module_name, cls_name) = type_name.rsplit(".", maxsplit=1)
+        module = importlib.import_module(module_name)
+        cls = getattr(module, cls_name)
+
+        self.register(tag, cls)
+        return cls
+
+
+_REGISTRIES: Dict[str, TagRegistry] = {}
+"""Tag registries, keyed by package."""
+
+_REGISTRIES_LOCK = threading.Lock()
+"""Lock protecting :data:`_REGISTRIES`."""
+
+
+def get_tag_registry(package: str) -> TagRegistry:
+    """Get the tag registry for a package, creating it if necessary.
+
+    Args:
+        package: package from which models are loaded
+
+    Returns:
+        Tag registry shared by all loaders for the package
+    """
+    try:
+        return _REGISTRIES[package]
+    except KeyError:
+        with _REGISTRIES_LOCK:
+            return _REGISTRIES.setdefault(package, TagRegistry(package))
@@ -3,22 +3,95 @@
 import importlib
 from collections import Counter
 from typing import Any
+from typing import Dict
+from typing import Hashable
 from typing import Iterable
+from typing import Iterator
+from typing import NoReturn
+from typing import Tuple
+from typing import TypeVar
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
 
 
 def check_iterable_no_dups(name: str, data: Iterable[Any]) -> None:
     """Check that all elements of a collection are unique.
 
+    Elements are only remembered, without building an intermediate list,
+    until a duplicate is found. Only then are they counted, so that every
+    duplicate is reported.
+
     Args:
         name: name of collection
-        data: the collection
+        data: the collection, which may be a generator
 
     Raises:
         ValueError: if collection contains duplicate elements
     """
-    dups = [item for item, count in Counter(data).items() if count > 1]
-    if dups:
-        raise ValueError(f"{name} contains duplicate values: " + ", ".join(dups))
+    seen: Dict[Any, None] = {}
+    iterator = iter(data)
+    for item in iterator:
+        if item in seen:
+            break
+        seen[item] = None
+    else:
+        return
+
+    _raise_dups(name=name, seen=seen.keys(), item=item, rest=iterator)
+
+
+def index_no_dups(name: str, data: Iterable[Tuple[K, V]]) -> Dict[K, V]:
+    """Index values by keys, checking that all keys are unique.
+
+    This is :func:`check_iterable_no_dups` for keys which each have a value,
+    building the index in the same pass as the check.
+
+    Args:
+        name: name of collection of keys
+        data: key and value of each element, which may be a generator
+
+    Returns:
+        Values by key
+
+    Raises:
+        ValueError: if collection contains duplicate keys
+    """
+    index: Dict[K, V] = {}
+    iterator = iter(data)
+    for key, value in iterator:
+        if key in index:
+            break
+        index[key] = value
+    else:
+        return index
+
+    _raise_dups(
+        name=name, seen=index.keys(), item=key, rest=(other for other, _ in iterator)
+    )
+
+
+def _raise_dups(
+    name: str, seen: Iterable[Any], item: Any, rest: Iterator[Any]
+) -> NoReturn:
+    """Report every duplicate element of a collection.
+
+    Args:
+        name: name of collection
+        seen: unique elements before the first duplicate
+        item: the first duplicate
+        rest: elements after the first duplicate
+
+    Raises:
+        ValueError: always
+    """
+    # Count every element, in order of first appearance, to report them all
+    counts = Counter(seen)
+    counts[item] += 1
+    counts.update(rest)
+    dups = [item for item, count in counts.items() if count > 1]
+    raise ValueError(f"{name} contains duplicate values: " + ", ".join(dups))
 
 
 def import_model_class(model_name: str, module_name: str, class_name: str) -> Any:
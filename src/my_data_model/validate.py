@@ -0,0 +1,493 @@
+"""Batch validation of model files."""
+
+import logging
+import math
+import os
+import time
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import compress
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Sequence
+from typing import Union
+
+import yaml
+
+from my_data_model.cache import INCLUDE_CACHE
+from my_data_model.io import DEFAULT_PACKAGE
+from my_data_model.io import get_loader_class
+from my_data_model.io import preload
+from my_data_model.tags import TAG_PREFIX
+from my_data_model.tags import get_tag_registry
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+class Issue(NamedTuple):
+    """A problem found while validating a file."""
+
+    path: str
+    """Path to the file in which the problem was found."""
+
+    line: Optional[int]
+    """Line number, counting from 1, if known."""
+
+    column: Optional[int]
+    """Column number, counting from 1, if known."""
+
+    message: str
+    """Description of the problem."""
+
+    def __str__(self) -> str:
+        """Format the issue as ``path:line:column: message``."""
+        location = ":".join(
+            str(part) for part in [self.path, self.line, self.column] if part
+        )
+        return f"{location}: {self.message}"
+
+
+BOUNDS = {"width": (1, "width is not positive"), "size": (0, "size is negative")}
+"""Integer attributes of the model classes which are checked in batch, with
+the minimum value of each and the message reported if it is less."""
+
+UNIQUE_NAMES = {"inputs": "input value names", "commands": "command names"}
+"""Attributes of the model classes whose members must have unique names, with
+the description of the names used in the message reported if they do not."""
+
+_INT_TAG = "tag:yaml.org,2002:int"
+
+_INCLUDE_TAG = "!include"
+
+_SAFE_CONSTRUCTOR = yaml.constructor.SafeConstructor()
+
+
+class FileResult(NamedTuple):
+    """Result of validating one file."""
+
+    path: str
+    """Path to the file."""
+
+    nodes: int
+    """Number of YAML nodes in the file, excluding the nodes of the files
+    which it includes."""
+
+    issues: List[Issue]
+    """Problems found in the file."""
+
+
+class Report(NamedTuple):
+    """Aggregated result of validating many files."""
+
+    files: List[FileResult]
+    """Results for each file, in input order."""
+
+    elapsed: float
+    """Wall-clock time taken, in seconds."""
+
+    @property
+    def issues(self) -> List[Issue]:
+        """Problems found in all files."""
+        return [issue for result in self.files for issue in result.issues]
+
+    @property
+    def nodes(self) -> int:
+        """Total number of YAML nodes in all files, excluding included files."""
+        return sum(result.nodes for result in self.files)
+
+    @property
+    def files_per_second(self) -> float:
+        """Throughput in files per second."""
+        return len(self.files) / self.elapsed if self.elapsed else math.inf
+
+    @property
+    def nodes_per_second(self) -> float:
+        """Throughput in YAML nodes per second.
+
+        Only the nodes of the validated files themselves are counted, although
+        the time spent loading the files which they include is not excluded.
+        """
+        return self.nodes / self.elapsed if self.elapsed else math.inf
+
+
+def count_nodes(node: Optional[yaml.Node]) -> int:
+    """Count the nodes in a YAML node graph.
+
+    Args:
+        node: root node
+
+    Returns:
+        Number of nodes, counting aliased nodes once
+    """
+    seen = set()
+    stack = [node] if node is not None else []
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        if isinstance(node, yaml.MappingNode):
+            for key_node, value_node in node.value:
+                stack.append(key_node)
+                stack.append(value_node)
+        elif isinstance(node, yaml.SequenceNode):
+            stack.extend(node.value)
+    return len(seen)
+
+
+class NodeColumns:
+    """Attributes of the model objects in a YAML node graph, in columns.
+
+    Each kind of check is then made in a single pass over a column, rather
+    than by one call per object as the models do.
+    """
+
+    def __init__(self) -> None:
+        """Create empty columns."""
+        self.tags: Dict[str, List[yaml.Mark]] = {}
+        """Marks of the model nodes, by tag."""
+
+        self.values: Dict[str, "array[int]"] = {name: array("q") for name in BOUNDS}
+        """Values of each bounded attribute."""
+
+        self.value_marks: Dict[str, List[yaml.Mark]] = {name: [] for name in BOUNDS}
+        """Marks of the values of each bounded attribute."""
+
+        self.non_integers: List[yaml.Node] = []
+        """Nodes of bounded attributes whose values are not integers."""
+
+        self.names: Dict[str, List[str]] = {name: [] for name in UNIQUE_NAMES}
+        """Names of the members of each attribute with unique names."""
+
+        self.name_groups: Dict[str, "array[int]"] = {
+            name: array("q") for name in UNIQUE_NAMES
+        }
+        """Identity of the container of each member."""
+
+        self.name_marks: Dict[str, List[yaml.Mark]] = {
+            name: [] for name in UNIQUE_NAMES
+        }
+        """Marks of the names of the members."""
+
+    def add(self, node: yaml.MappingNode) -> None:
+        """Add the attributes of a model node."""
+        self.tags.setdefault(node.tag, []).append(node.start_mark)
+        for key_node, value_node in node.value:
+            key = key_node.value
+            if key in BOUNDS and isinstance(value_node, yaml.ScalarNode):
+                if value_node.tag != _INT_TAG:
+                    self.non_integers.append(key_node)
+                    continue
+                self.values[key].append(
+                    _SAFE_CONSTRUCTOR.construct_yaml_int(value_node)
+                )
+                self.value_marks[key].append(value_node.start_mark)
+            elif key in UNIQUE_NAMES:
+                if isinstance(value_node, yaml.MappingNode):
+                    members = [member for _key, member in value_node.value]
+                elif isinstance(value_node, yaml.SequenceNode):
+                    members = value_node.value
+                else:
+                    continue
+                for member in members:
+                    name_node = _name_node(member)
+                    if name_node is not None:
+                        self.names[key].append(name_node.value)
+                        self.name_groups[key].append(id(value_node))
+                        self.name_marks[key].append(name_node.start_mark)
+
+    def check(self, path: str, package: str) -> List[Issue]:
+        """Check all attributes.
+
+        Args:
+            path: path to the file, used if a mark does not name a file
+            package: package from which models are loaded
+
+        Returns:
+            Problems found, in order of their position in the file
+        """
+        issues: List[Issue] = []
+
+        tags = get_tag_registry(package)
+        for tag, marks in self.tags.items():
+            try:
+                tags.resolve(tag)
+            except Exception as exc:
+                issues.extend(
+                    _marked_issue(path, mark, f"unknown tag {tag!r}: {exc}")
+                    for mark in marks
+                )
+
+        issues.extend(
+            _marked_issue(path, node.start_mark, f"{node.value!r} must be an integer")
+            for node in self.non_integers
+        )
+
+        for name, (minimum, message) in BOUNDS.items():
+            failed = map(minimum.__gt__, self.values[name])
+            issues.extend(
+                _marked_issue(path, mark, message)
+                for mark in compress(self.value_marks[name], failed)
+            )
+
+        for name, label in UNIQUE_NAMES.items():
+            keys = list(zip(self.name_groups[name], self.names[name]))  # noqa: B905
+            counts = Counter(keys)
+            if len(counts) == len(keys):
+                continue
+            # Report each container once, listing its duplicated names in
+            # order of first appearance, at the first repetition
+            dups: Dict[int, List[str]] = {}
+            repeats: Dict[int, yaml.Mark] = {}
+            for key, mark in zip(keys, self.name_marks[name]):  # noqa: B905
+                (group, member) = key
+                if counts[key] > 1:
+                    if member in dups.setdefault(group, []):
+                        repeats.setdefault(group, mark)
+                    else:
+                        dups[group].append(member)
+            issues.extend(
+                _marked_issue(
+                    path,
+                    repeats[group],
+                    f"{label} contains duplicate values: " + ", ".join(members),
+                )
+                for group, members in dups.items()
+            )
+
+        return sorted(issues, key=lambda issue: (issue.line, issue.column))
+
+
+def _name_node(node: yaml.Node) -> Optional[yaml.ScalarNode]:
+    """Get the node of the name of a model node, if it has one."""
+    if isinstance(node, yaml.MappingNode):
+        for key_node, value_node in node.value:
+            if key_node.value == "name" and isinstance(value_node, yaml.ScalarNode):
+                return value_node
+    return None
+
+
+def collect(node: Optional[yaml.Node]) -> NodeColumns:
+    """Gather the attributes of the model objects in a YAML node graph.
+
+    Args:
+        node: root node
+
+    Returns:
+        Columns of attributes, gathering aliased nodes once
+    """
+    columns = NodeColumns()
+    seen = set()
+    stack = [node] if node is not None else []
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        if isinstance(node, yaml.MappingNode):
+            if node.tag.startswith(TAG_PREFIX) and node.tag != _INCLUDE_TAG:
+                columns.add(node)
+            for _key_node, value_node in node.value:
+                stack.append(value_node)
+        elif isinstance(node, yaml.SequenceNode):
+            stack.extend(node.value)
+    return columns
+
+
+def check_document(
+    node: Optional[yaml.Node], path: str, package: Optional[str] = None
+) -> List[Issue]:
+    """Check the constraints of the models on a composed document, in batch.
+
+    Checks model tags, bounded integer attributes such as widths and sizes,
+    and the uniqueness of names, over the whole document before any object
+    is constructed, so that every failure is reported rather than only the
+    first. Included files are not followed.
+
+    Args:
+        node: root node of the document
+        path: path to the file, used if a mark does not name a file
+        package: package from which models are loaded, defaults to
+                 :const:`~my_data_model.io.DEFAULT_PACKAGE`
+
+    Returns:
+        Problems found, in order of their position in the file
+    """
+    return collect(node).check(path=path, package=package or DEFAULT_PACKAGE)
+
+
+def _marked_issue(path: str, mark: yaml.Mark, message: str) -> Issue:
+    """Create an issue at a YAML mark."""
+    return Issue(
+        path=mark.name if os.path.isfile(mark.name) else path,
+        line=mark.line + 1,
+        column=mark.column + 1,
+        message=message,
+    )
+
+
+def _issue(path: str, exc: Exception) -> Issue:
+    """Convert an exception to an issue, using the YAML mark if there is one."""
+    if isinstance(exc, yaml.MarkedYAMLError):
+        mark = exc.problem_mark or exc.context_mark
+        message = str(exc.problem or exc.context)
+        if mark is not None:
+            return _marked_issue(path=path, mark=mark, message=message)
+        return Issue(path=path, line=None, column=None, message=message)
+    return Issue(path=path, line=None, column=None, message=f"{exc}")
+
+
+def validate_file(
+    path: Union[str, "os.PathLike[str]"],
+    package: Optional[str] = None,
+    backend: Optional[str] = None,
+    batch: bool = False,
+) -> FileResult:
+    """Validate one file, which may contain many documents.
+
+    Included files are loaded via the process-wide include cache.
+
+    Args:
+        path: path to the file
+        package: package from which models are loaded, defaults to
+                 :const:`~my_data_model.io.DEFAULT_PACKAGE`
+        backend: YAML parser backend, one of :const:`~my_data_model.io.BACKENDS`,
+                 defaults to :const:`~my_data_model.io.DEFAULT_BACKEND`
+        batch: check each document with :func:`check_document` before
+               constructing it, so that all of the problems which it detects
+               are reported; documents with such problems are not constructed
+
+    Returns:
+        Result of validation
+    """
+    loader_cls = get_loader_class(package=package, backend=backend)
+    nodes = 0
+    issues: List[Issue] = []
+
+    try:
+        with open(path) as stream:
+            loader = loader_cls(stream=stream, include_cache=INCLUDE_CACHE)
+            try:
+                # Validate one document at a time, so that files holding many
+                # documents are validated in bounded memory
+                while loader.check_node():  # type: ignore [attr-defined]
+                    loader.dependencies = []
+                    node = loader.get_node()  # type: ignore [attr-defined]
+                    nodes += count_nodes(node)
+                    if batch:
+                        found = check_document(
+                            node=node, path=str(path), package=package
+                        )
+                        if found:
+                            issues.extend(found)
+                            continue
+                    loader.construct_document(node)
+                    del node
+            finally:
+                loader.dispose()  # type: ignore [attr-defined]
+    except Exception as exc:
+        issues.append(_issue(path=str(path), exc=exc))
+
+    return FileResult(path=str(path), nodes=nodes, issues=issues)
+
+
+def _init_worker(
+    warm: Sequence[str], package: Optional[str], backend: Optional[str]
+) -> None:
+    """Initialize a worker process by pre-warming its include cache.
+
+    Files are validated without interning, so the cache is warmed for loads
+    which do not intern, else no include would hit. A file which cannot be
+    loaded is not warmed, and a warning is logged; its errors are reported as
+    issues of the files which include it.
+    """
+    for path in warm:
+        try:
+            preload(paths=[path], package=package, backend=backend, intern=False)
+        except Exception as exc:
+            LOGGER.warning(f"cannot warm the include cache with {path}: {exc}")
+
+
+def _validate_shard(
+    paths: Sequence[str], package: Optional[str], backend: Optional[str], batch: bool
+) -> List[FileResult]:
+    """Validate a shard of files in a worker process."""
+    return [
+        validate_file(path=path, package=package, backend=backend, batch=batch)
+        for path in paths
+    ]
+
+
+def validate(
+    paths: Iterable[Union[str, "os.PathLike[str]"]],
+    package: Optional[str] = None,
+    backend: Optional[str] = None,
+    jobs: Optional[int] = None,
+    warm: Iterable[Union[str, "os.PathLike[str]"]] = (),
+    batch: bool = False,
+) -> Report:
+    """Validate many files, sharded across worker processes.
+
+    Args:
+        paths: paths to the files
+        package: package from which models are loaded, defaults to
+                 :const:`~my_data_model.io.DEFAULT_PACKAGE`
+        backend: YAML parser backend, one of :const:`~my_data_model.io.BACKENDS`,
+                 defaults to :const:`~my_data_model.io.DEFAULT_BACKEND`
+        jobs: number of worker processes, defaults to the number of CPUs; if
+              1, files are validated in the calling process
+        warm: paths to files which are commonly included, with which the
+              include cache of each worker is populated before validation;
+              files which cannot be loaded are skipped
+        batch: check each document in batch before constructing it, see
+               :func:`validate_file`
+
+    Returns:
+        Aggregated result of validation
+    """
+    my_paths = [str(path) for path in paths]
+    my_warm = [str(path) for path in warm]
+    my_jobs = jobs or os.cpu_count() or 1
+
+    start = time.perf_counter()
+
+    if my_jobs == 1:
+        _init_worker(warm=my_warm, package=package, backend=backend)
+        results = _validate_shard(
+            paths=my_paths, package=package, backend=backend, batch=batch
+        )
+    else:
+        # Several shards per worker, so that workers finishing early pick up
+        # the remaining work
+        shard_size = max(1, math.ceil(len(my_paths) / (my_jobs * 4)))
+        shards = [
+            my_paths[index : index + shard_size]
+            for index in range(0, len(my_paths), shard_size)
+        ]
+        with ProcessPoolExecutor(
+            max_workers=my_jobs,
+            initializer=_init_worker,
+            initargs=(my_warm, package, backend),
+        ) as pool:
+            results = [
+                result
+                for shard_results in pool.map(
+                    _validate_shard,
+                    shards,
+                    [package] * len(shards),
+                    [backend] * len(shards),
+                    [batch] * len(shards),
+                )
+                for result in shard_results
+            ]
+
+    elapsed = time.perf_counter() - start
+
+    LOGGER.debug(f"validate files={len(results)} jobs={my_jobs} elapsed={elapsed}")
+
+    return Report(files=results, elapsed=elapsed)
@@ -0,0 +1,229 @@
+"""Watching data files for changes."""
+
+import abc
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import Union
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+DEFAULT_INTERVAL = 0.5
+"""Default polling interval, in seconds."""
+
+_SETTLE_TIME = 0.05
+"""Time to wait for further events after a change, so that the several events
+generated by an editor saving a file are reported together."""
+
+
+class Watcher(abc.ABC):
+    """Base class for watchers, which report changes to YAML files in a tree."""
+
+    def __init__(self, directory: Union[str, "os.PathLike[str]"]):
+        """Create watcher.
+
+        Args:
+            directory: root of the tree to watch
+        """
+        self.directory = Path(directory).resolve()
+
+    def __enter__(self) -> "Watcher":
+        """Enter context."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Exit context."""
+        self.close()
+
+    def close(self) -> None:  # noqa: B027
+        """Release resources held by the watcher."""
+
+    @abc.abstractmethod
+    def wait(self, timeout: Optional[float] = None) -> Set[str]:
+        """Wait for changes.
+
+        Args:
+            timeout: maximum time to wait in seconds, or None to wait forever
+
+        Returns:
+            Paths of YAML files which were created, modified or deleted, which
+            is empty if the timeout expired
+        """
+
+
+class PollingWatcher(Watcher):
+    """Watcher which periodically compares file modification times and sizes."""
+
+    def __init__(
+        self,
+        directory: Union[str, "os.PathLike[str]"],
+        interval: float = DEFAULT_INTERVAL,
+    ):
+        """Create polling watcher.
+
+        Args:
+            directory: root of the tree to watch
+            interval: polling interval, in seconds
+        """
+        super().__init__(directory=directory)
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        """Get the modification time and size of every YAML file in the tree."""
+        snapshot = {}
+        for path in self.directory.glob("**/*.yaml"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            snapshot[str(path)] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def wait(self, timeout: Optional[float] = None) -> Set[str]:
+        """Wait for changes."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            snapshot = self._scan()
+            changed = {
+                path
+                for path in snapshot.keys() | self._snapshot.keys()
+                if snapshot.get(path) != self._snapshot.get(path)
+            }
+            self._snapshot = snapshot
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+            time.sleep(self.interval)
+
+
+class InotifyWatcher(Watcher):
+    """Watcher which uses the Linux inotify API, via ctypes."""
+
+    _IN_MODIFY = 0x00000002
+    _IN_CLOSE_WRITE = 0x00000008
+    _IN_MOVED_FROM = 0x00000040
+    _IN_MOVED_TO = 0x00000080
+    _IN_CREATE = 0x00000100
+    _IN_DELETE = 0x00000200
+    _IN_ISDIR = 0x40000000
+    _MASK = (
+        _IN_MODIFY
+        | _IN_CLOSE_WRITE
+        | _IN_MOVED_FROM
+        | _IN_MOVED_TO
+        | _IN_CREATE
+        | _IN_DELETE
+    )
+
+    _EVENT = struct.Struct("iIII")
+    """Fixed-size part of struct inotify_event."""
+
+    def __init__(self, directory: Union[str, "os.PathLike[str]"]):
+        """Create inotify watcher.
+
+        Args:
+            directory: root of the tree to watch
+
+        Raises:
+            OSError: if inotify is not available
+        """
+        super().__init__(directory=directory)
+
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        self._dirs: Dict[int, Path] = {}
+        for path in [self.directory, *self.directory.glob("**/")]:
+            self._add_watch(path)
+
+    def _add_watch(self, path: Path) -> None:
+        """Watch a directory."""
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), self._MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch {path} failed")
+        self._dirs[wd] = path
+
+    def close(self) -> None:
+        """Close the inotify file descriptor."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def _read(self, timeout: Optional[float]) -> Set[str]:
+        """Read and decode pending events."""
+        (ready, _, _) = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        changed = set()
+        buffer = os.read(self._fd, 65536)
+        offset = 0
+        while offset < len(buffer):
+            (wd, mask, _cookie, length) = self._EVENT.unpack_from(buffer, offset)
+            offset += self._EVENT.size
+            name = os.fsdecode(buffer[offset : offset + length].rstrip(b"\0"))
+            offset += length
+
+            path = self._dirs.get(wd, self.directory) / name
+            if mask & self._IN_ISDIR:
+                if mask & self._IN_CREATE:
+                    self._add_watch(path)
+            elif path.suffix == ".yaml":
+                changed.add(str(path))
+        return changed
+
+    def wait(self, timeout: Optional[float] = None) -> Set[str]:
+        """Wait for changes."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return set()
+            changed = self._read(timeout=remaining)
+            if changed:
+                # Gather further events generated by the same save
+                while True:
+                    more = self._read(timeout=_SETTLE_TIME)
+                    if not more:
+                        return changed
+                    changed |= more
+
+
+def make_watcher(
+    directory: Union[str, "os.PathLike[str]"],
+    interval: float = DEFAULT_INTERVAL,
+) -> Watcher:
+    """Create the best available watcher.
+
+    Args:
+        directory: root of the tree to watch
+        interval: polling interval, in seconds, if inotify is not available
+
+    Returns:
+        An inotify watcher on Linux, otherwise a polling watcher
+    """
+    try:
+        return InotifyWatcher(directory=directory)
+    except (OSError, AttributeError) as exc:
+        LOGGER.debug(f"inotify not available ({exc}), falling back to polling")
+        return PollingWatcher(directory=directory, interval=interval)
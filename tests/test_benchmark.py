@@ -0,0 +1,133 @@
+"""Test cases for the benchmark module."""
+
+import functools
+import json
+from io import StringIO
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from my_data_model import benchmark
+from my_data_model import io
+from my_data_model.benchmark import Result
+
+
+def test_result_statistics() -> None:
+    """Test statistics computed from samples."""
+    result = Result(name="test", samples=[i * 1_000_000_000 for i in range(1, 21)])
+    assert result.mean == 10.5
+    assert result.min == 1.0
+    assert result.median == 10.5
+    assert result.p95 == 19.0
+    assert result.stddev == pytest.approx(5.916, abs=1e-3)
+    assert Result(name="test", samples=[1]).stddev == 0.0
+
+
+def test_measure() -> None:
+    """Test that warmup calls are not timed."""
+    calls: List[None] = []
+    samples = benchmark.measure(lambda: calls.append(None), repeats=3, warmup=2)
+    assert len(samples) == 3
+    assert len(calls) == 5
+    assert all(sample >= 0 for sample in samples)
+
+
+@pytest.mark.parametrize("isolate", [False, True])
+def test_run(isolate: bool) -> None:
+    """Test running a benchmark, optionally in a separate process."""
+    func = functools.partial(sum, [1, 2, 3])
+    result = benchmark.run(name="sum", func=func, repeats=2, isolate=isolate)
+    assert result.name == "sum"
+    assert len(result.samples) == 2
+
+
+def test_write_json(tmp_path: Path) -> None:
+    """Test writing results as JSON."""
+    path = tmp_path / "results.json"
+    benchmark.write_json(
+        path=path,
+        results=[Result(name="a", samples=[1, 2, 3])],
+        parameters={"repeats": 3},
+    )
+    data = json.loads(path.read_text())
+    assert data["version"] == benchmark.RESULTS_VERSION
+    assert data["parameters"] == {"repeats": 3}
+    assert data["results"]["a"]["samples_ns"] == [1, 2, 3]
+    assert data["results"]["a"]["median"] == 2e-9
+
+
+def test_compare(tmp_path: Path) -> None:
+    """Test comparison of results with a baseline read from JSON."""
+    path = tmp_path / "baseline.json"
+    benchmark.write_json(
+        path=path,
+        results=[Result(name="a", samples=[100]), Result(name="b", samples=[100])],
+        parameters={},
+    )
+    baseline = benchmark.read_json(path)
+    comparisons = benchmark.compare(
+        baseline=baseline,
+        results=[Result(name="a", samples=[150]), Result(name="c", samples=[1])],
+    )
+    assert [comparison.name for comparison in comparisons] == ["a"]
+    assert comparisons[0].change == pytest.approx(0.5)
+    assert benchmark.read_parameters(path) == {}
+
+    path.write_text('{"version": 0}')
+    with pytest.raises(ValueError, match="not a version 1 results file"):
+        benchmark.read_json(path)
+    with pytest.raises(ValueError, match="not a version 1 results file"):
+        benchmark.read_parameters(path)
+
+
+def test_log_spaced() -> None:
+    """Test logarithmically spaced sizes."""
+    assert benchmark.log_spaced(10, 10000, 4) == [10, 100, 1000, 10000]
+    assert benchmark.log_spaced(1, 2, 5) == [1, 2]
+    assert benchmark.log_spaced(5, 50, 1) == [5]
+    with pytest.raises(ValueError):
+        benchmark.log_spaced(0, 10, 3)
+
+
+def test_fit_power_law() -> None:
+    """Test fitting of cost curves."""
+    (coefficient, exponent) = benchmark.fit_power_law(
+        sizes=[10, 100, 1000], times=[2e-3, 2e-1, 2e1]
+    )
+    assert coefficient == pytest.approx(2e-5)
+    assert exponent == pytest.approx(2.0)
+    with pytest.raises(ValueError):
+        benchmark.fit_power_law(sizes=[10, 10], times=[1, 2])
+
+
+def test_measure_memory() -> None:
+    """Test that retained memory counts the result but not temporaries."""
+    result = benchmark.measure_memory(
+        name="test", func=lambda: [bytearray(1_000_000), bytes(1_000_000)][0]
+    )
+    assert result.name == "test"
+    assert result.peak >= 2_000_000
+    assert 1_000_000 <= result.retained < 2_000_000
+
+
+def test_instance_sizes() -> None:
+    """Test that instances are found throughout a graph, and counted once."""
+    source = """
+    - &address !types.Address
+      name: Address
+      description: An address
+      width: 64
+    - !types.Array
+      name: Array
+      description: An array
+      size: 4
+      type: *address
+    - {x: *address}
+    """
+    data = io.load(stream=StringIO(source), package="my_data_model.models_attrs")
+    sizes = benchmark.instance_sizes(data=data, package="my_data_model.models_attrs")
+    assert set(sizes) == {"types.Address", "types.Array"}
+    assert sizes["types.Address"].instances == 1
+    assert sizes["types.Array"].instances == 1
+    assert sizes["types.Array"].mean > 0
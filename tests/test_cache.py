@@ -0,0 +1,62 @@
+"""Test cases for the cache module."""
+
+import os
+from pathlib import Path
+
+from my_data_model.cache import CacheEntry
+from my_data_model.cache import IncludeCache
+from my_data_model.cache import file_stamp
+
+
+def make_entry(path: Path, value: str) -> CacheEntry:
+    """Write a file and make a cache entry for it."""
+    path.write_text(value)
+    return CacheEntry(dependencies=(file_stamp(path),), value=value)
+
+
+def test_hit_miss(tmp_path: Path) -> None:
+    """Test hit and miss counters."""
+    cache = IncludeCache()
+    assert cache.get("a") is None
+    cache.put("a", make_entry(tmp_path / "a.yaml", "a"))
+    entry = cache.get("a")
+    assert entry is not None
+    assert entry.value == "a"
+    assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+
+    cache.clear()
+    assert (cache.hits, cache.misses, len(cache)) == (0, 0, 0)
+
+
+def test_eviction(tmp_path: Path) -> None:
+    """Test that the least recently used entry is evicted."""
+    cache = IncludeCache(maxsize=2)
+    for name in ["a", "b"]:
+        cache.put(name, make_entry(tmp_path / name, name))
+    assert cache.get("a") is not None
+    cache.put("c", make_entry(tmp_path / "c", "c"))
+    assert cache.evictions == 1
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+
+def test_invalidation(tmp_path: Path) -> None:
+    """Test that entries are invalidated when a dependency changes."""
+    cache = IncludeCache()
+    path = tmp_path / "a"
+    dep_path = tmp_path / "b"
+    dep_path.write_text("b")
+    entry = make_entry(path, "a")
+    cache.put(
+        "a", entry._replace(dependencies=(*entry.dependencies, file_stamp(dep_path)))
+    )
+    assert cache.get("a") is not None
+
+    dep_path.write_text("bb")
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+    cache.put("a", make_entry(path, "a"))
+    os.remove(path)
+    assert cache.get("a") is None
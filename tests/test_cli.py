@@ -1,5 +1,11 @@
 """Test cases for the cli module."""
 
+import json
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
 from typing import List
 
 import pytest
@@ -8,6 +14,10 @@ from click.testing import CliRunner
 from my_data_model import cli
 
 
+DATA_DIR = Path(os.path.dirname(cli.__file__)).parent / "data"
+"""Path to the example data."""
+
+
 @pytest.fixture
 def runner() -> CliRunner:
     """Fixture for invoking command-line interfaces."""
@@ -16,9 +26,203 @@ def runner() -> CliRunner:
 
 @pytest.mark.parametrize(
     "args",
-    [[], ["dump"], ["dump", "--verbose"], ["perf", "--repeats", "1"]],
+    [
+        [],
+        ["dump"],
+        ["dump", "--verbose"],
+        ["dump", "--backend", "python"],
+        ["dump", "--data", str(DATA_DIR), "--jobs", "2"],
+        ["dump", "--data", str(DATA_DIR / "**" / "*.yaml"), "--executor", "process"],
+        ["dump", "--profile"],
+        ["dump", "--model", "columnar", "--data", str(DATA_DIR)],
+        ["dump", "--data", str(DATA_DIR), "--profile"],
+        ["perf", "--repeats", "1"],
+        ["perf", "--repeats", "1", "--warmup", "0", "--commands", "2", "--isolate"],
+        ["perf", "--repeats", "1", "--commands", "2", "--profile"],
+        ["perf", "--repeats", "1", "--commands", "2", "--micro"],
+        ["perf", "--repeats", "1", "--interfaces", "2", "--duplication", "0.5"],
+        ["validate", "--jobs", "1"],
+        ["validate", "--jobs", "1", "--batch"],
+        ["validate", "--data", str(DATA_DIR), "--warm", str(DATA_DIR / "types")],
+    ],
 )
 def test_main_succeeds(runner: CliRunner, args: List[str]) -> None:
     """It exits with a status code of zero."""
     result = runner.invoke(cli=cli.main, args=args)
     assert result.exit_code == 0
+
+
+def test_dump_errors(runner: CliRunner, tmp_path: Path) -> None:
+    """It exits with a non-zero status code if any file fails to load."""
+    (tmp_path / "good.yaml").write_text("foo: bar\n")
+    (tmp_path / "bad.yaml").write_text("!types.Bits\nname: foo\n")
+    result = runner.invoke(cli=cli.main, args=["dump", "--data", str(tmp_path)])
+    assert result.exit_code == 1
+    assert "1 of 2 files failed to load" in result.output
+
+
+def test_validate_errors(runner: CliRunner, tmp_path: Path) -> None:
+    """It exits with a non-zero status code if any file is invalid."""
+    (tmp_path / "bad.yaml").write_text("!types.Bits\nname: foo\n")
+    result = runner.invoke(
+        cli=cli.main, args=["validate", "--data", str(tmp_path), "--jobs", "1"]
+    )
+    assert result.exit_code == 1
+    assert f"{tmp_path / 'bad.yaml'}:1:1: failed to create" in result.output
+    assert "1 issues found" in result.output
+
+
+def test_compile(runner: CliRunner, tmp_path: Path) -> None:
+    """It compiles the model to a cache file which dump then uses."""
+    compiled = str(tmp_path / "model.cache")
+    result = runner.invoke(cli=cli.main, args=["compile", "--output", compiled])
+    assert result.exit_code == 0
+    assert (tmp_path / "model.cache").exists()
+    result = runner.invoke(cli=cli.main, args=["dump", "--compiled", compiled])
+    assert result.exit_code == 0
+    assert "Iface1" in result.output
+
+
+def test_watch(runner: CliRunner, tmp_path: Path) -> None:
+    """It reloads the model when a file changes."""
+    shutil.copytree(DATA_DIR, tmp_path / "data")
+    path = tmp_path / "data" / "types" / "Address.yaml"
+
+    def modify() -> None:
+        time.sleep(0.5)
+        path.write_text(path.read_text().replace("64", "32"))
+
+    thread = threading.Thread(target=modify)
+    thread.start()
+    result = runner.invoke(
+        cli=cli.main,
+        args=[
+            "watch",
+            "--data",
+            str(tmp_path / "data" / "model.yaml"),
+            "--interval",
+            "0.05",
+            "--max-reloads",
+            "1",
+        ],
+    )
+    thread.join()
+    assert result.exit_code == 0
+    assert "Loaded 5 files" in result.output
+    assert "Reloaded 3 files" in result.output
+
+
+def test_perf_json(runner: CliRunner, tmp_path: Path) -> None:
+    """It writes benchmark results as JSON."""
+    path = tmp_path / "results.json"
+    result = runner.invoke(
+        cli=cli.main,
+        args=[
+            "perf",
+            "--repeats",
+            "2",
+            "--commands",
+            "2",
+            "--memory",
+            "--json",
+            str(path),
+        ],
+    )
+    assert result.exit_code == 0
+    data = json.loads(path.read_text())
+    assert data["parameters"]["repeats"] == 2
+    assert len(data["results"]["attrs/python"]["samples_ns"]) == 2
+    assert data["memory"]["attrs/libyaml"]["peak"] > 0
+
+
+def test_perf_sweep(runner: CliRunner, tmp_path: Path) -> None:
+    """It sweeps a parameter and fits cost curves."""
+    path = tmp_path / "results.json"
+    result = runner.invoke(
+        cli=cli.main,
+        args=[
+            "perf",
+            "--repeats",
+            "1",
+            "--commands",
+            "2",
+            "--sweep",
+            "inputs",
+            "--sweep-range",
+            "1",
+            "4",
+            "--sweep-points",
+            "3",
+            "--json",
+            str(path),
+        ],
+    )
+    assert result.exit_code == 0
+    assert "Cost curves" in result.output
+    data = json.loads(path.read_text())
+    assert data["parameters"]["sweep_sizes"] == [1, 2, 4]
+    assert "attrs/libyaml/inputs=4" in data["results"]
+
+
+@pytest.mark.parametrize(
+    "sweep_args", [["--sweep-range", "2", "2"], ["--sweep-points", "1"]]
+)
+def test_perf_sweep_too_few(runner: CliRunner, sweep_args: List[str]) -> None:
+    """It fails before benchmarking if a sweep has too few values to fit."""
+    result = runner.invoke(
+        cli=cli.main, args=["perf", "--sweep", "inputs", *sweep_args]
+    )
+    assert result.exit_code == 2
+    assert "at least two distinct values" in result.output
+    assert "Times in seconds" not in result.output
+
+
+@pytest.mark.parametrize(
+    "args", [["--repeats", "0"], ["--warmup", "-1"], ["--sweep-points", "-1"]]
+)
+def test_perf_counts(runner: CliRunner, args: List[str]) -> None:
+    """It rejects counts out of range."""
+    result = runner.invoke(cli=cli.main, args=["perf", *args])
+    assert result.exit_code == 2
+    assert "is not in the range" in result.output
+
+
+def test_perf_compare(runner: CliRunner, tmp_path: Path) -> None:
+    """It fails if any benchmark regresses compared with a baseline."""
+    path = tmp_path / "baseline.json"
+    args = ["perf", "--repeats", "1", "--commands", "2"]
+    result = runner.invoke(cli=cli.main, args=[*args, "--json", str(path)])
+    assert result.exit_code == 0
+
+    # Make every baseline time impossibly fast
+    data = json.loads(path.read_text())
+    for value in data["results"].values():
+        value["samples_ns"] = [1]
+    path.write_text(json.dumps(data))
+
+    result = runner.invoke(cli=cli.main, args=[*args, "--compare", str(path)])
+    assert result.exit_code == 1
+    assert "regressed by more than 10%" in result.output
+
+    # A baseline run with different parameters is not compared
+    result = runner.invoke(
+        cli=cli.main,
+        args=[*args, "--inputs", "3", "--compare", str(path)],
+    )
+    assert result.exit_code == 1
+    assert "baseline was run with different parameters: inputs" in result.output
+    assert "REGRESSED" not in result.output
+
+    # Other than the number of repeats, which is only warned about
+    result = runner.invoke(
+        cli=cli.main,
+        args=[*args, "--repeats", "2", "--compare", str(path)],
+    )
+    assert "Baseline has repeats=1, current run has repeats=2" in result.output
+    assert "regressed by more than 10%" in result.output
+
+    result = runner.invoke(
+        cli=cli.main, args=[*args, "--compare", str(tmp_path / "missing.json")]
+    )
+    assert result.exit_code == 1
+    assert "cannot read baseline" in result.output
@@ -0,0 +1,60 @@
+"""Test cases for the corpus module."""
+
+from io import StringIO
+from pathlib import Path
+
+import pytest
+import yaml
+
+from my_data_model import io
+from my_data_model.cache import IncludeCache
+from my_data_model.corpus import CorpusSpec
+from my_data_model.corpus import make_source
+from my_data_model.corpus import write_corpus
+
+
+SPEC = CorpusSpec(interfaces=2, commands=3, inputs=4, depth=2, duplication=0.5)
+"""Shape of the corpus used by tests."""
+
+
+@pytest.mark.parametrize("model", ["attrs", "columnar", "pydantic_bm", "pydantic_dc"])
+def test_tree_equals_source(tmp_path: Path, model: str) -> None:
+    """Test that the same data is loaded from a tree and a single document."""
+    package = f"my_data_model.models_{model}"
+
+    with StringIO(make_source(spec=SPEC)) as stream:
+        expected = io.load(stream=stream, package=package)
+    assert [iface.name for iface in expected] == ["Iface0", "Iface1"]
+    assert len(expected[1].commands) == 3
+    assert len(expected[1].commands[2].inputs) == 4
+
+    corpus = write_corpus(directory=tmp_path, spec=SPEC)
+    assert corpus.files == 2 + 2 * 3 + SPEC.shared_types + 1
+    with open(corpus.root) as stream:
+        data = io.load(stream=stream, package=package, include_cache=IncludeCache())
+    assert data == expected
+
+
+def test_untagged_source() -> None:
+    """Test that untagged source has the same shape as tagged source."""
+    spec = SPEC._replace(interfaces=1)
+    data = yaml.safe_load(make_source(spec=spec, tag=False))
+    assert data["name"] == "Iface0"
+    assert len(data["commands"]) == 3
+
+
+def test_shapes() -> None:
+    """Test that depth and duplication control the types generated."""
+    flat = make_source(spec=SPEC._replace(depth=0))
+    assert "!types.Array" not in flat
+    assert "*T" in flat
+
+    deep = make_source(spec=SPEC._replace(depth=3, duplication=0.0))
+    assert "type: !types.Array\n" in deep
+    assert "*T" not in deep
+
+
+def test_reproducible() -> None:
+    """Test that corpora depend only on their spec."""
+    assert make_source(spec=SPEC) == make_source(spec=SPEC)
+    assert make_source(spec=SPEC) != make_source(spec=SPEC._replace(seed=1))
@@ -0,0 +1,107 @@
+"""Test cases for the incremental module."""
+
+from pathlib import Path
+
+from my_data_model.incremental import IncrementalLoader
+
+
+def write_tree(tmp_path: Path) -> None:
+    """Write a tree of files, in which two commands include different types."""
+    (tmp_path / "model.yaml").write_text("""\
+!interfaces.Interface
+name: Iface1
+commands:
+  - !include Cmd1.yaml
+  - !include Cmd2.yaml
+""")
+    for index, type_name in [(1, "Address"), (2, "Bits64")]:
+        (tmp_path / f"Cmd{index}.yaml").write_text(f"""\
+!commands.Command
+name: Cmd{index}
+description: Command {index}
+inputs:
+  X0: !commands.CommandValue
+    name: in
+    description: Input
+    type: !include {type_name}.yaml
+""")
+    (tmp_path / "Address.yaml").write_text(
+        "!types.Address\nname: Address\ndescription: An address\nwidth: 64\n"
+    )
+    (tmp_path / "Bits64.yaml").write_text(
+        "!types.Bits\nname: Bits64\ndescription: A bitfield\nwidth: 64\n"
+    )
+
+
+def test_reload(tmp_path: Path) -> None:
+    """Test that only changed files and their ancestors are re-parsed."""
+    write_tree(tmp_path)
+    loader = IncrementalLoader(path=tmp_path / "model.yaml")
+
+    data = loader.load()
+    assert [cmd.name for cmd in data.commands] == ["Cmd1", "Cmd2"]
+    assert loader.reloaded == {
+        str(tmp_path / name)
+        for name in [
+            "model.yaml",
+            "Cmd1.yaml",
+            "Cmd2.yaml",
+            "Address.yaml",
+            "Bits64.yaml",
+        ]
+    }
+    assert loader.graph.ancestors([str(tmp_path / "Address.yaml")]) == {
+        str(tmp_path / name) for name in ["model.yaml", "Cmd1.yaml", "Address.yaml"]
+    }
+
+    (tmp_path / "Address.yaml").write_text(
+        "!types.Address\nname: Address\ndescription: An address\nwidth: 32\n"
+    )
+    new_data = loader.reload([tmp_path / "Address.yaml"])
+    assert new_data.commands[0].inputs["X0"].type.width == 32
+    assert new_data.commands[1] is data.commands[1]
+    assert loader.reloaded == {
+        str(tmp_path / name) for name in ["model.yaml", "Cmd1.yaml", "Address.yaml"]
+    }
+
+
+def test_reload_unrelated(tmp_path: Path) -> None:
+    """Test that changes to files outside the model are ignored."""
+    write_tree(tmp_path)
+    loader = IncrementalLoader(path=tmp_path / "model.yaml")
+    data = loader.load()
+    assert loader.reload([tmp_path / "other.yaml"]) is data
+    assert loader.reloaded == set()
+
+
+def test_reload_include_removed(tmp_path: Path) -> None:
+    """Test that edges are updated when an include is removed."""
+    write_tree(tmp_path)
+    loader = IncrementalLoader(path=tmp_path / "model.yaml")
+    loader.load()
+
+    (tmp_path / "Cmd2.yaml").write_text(
+        "!commands.Command\nname: Cmd2\ndescription: Command 2\ninputs: {}\n"
+    )
+    data = loader.reload([tmp_path / "Cmd2.yaml"])
+    assert data.commands[1].inputs == {}
+    assert str(tmp_path / "Bits64.yaml") not in loader.files()
+
+
+def test_reload_include_removed_unreported(tmp_path: Path) -> None:
+    """Test that edges are updated when a file is re-parsed unreported."""
+    write_tree(tmp_path)
+    loader = IncrementalLoader(path=tmp_path / "model.yaml")
+    loader.load()
+
+    (tmp_path / "Cmd2.yaml").write_text(
+        "!commands.Command\nname: Cmd2\ndescription: Command 2\ninputs: {}\n"
+    )
+    data = loader.reload([])
+    assert data.commands[1].inputs == {}
+    assert str(tmp_path / "Bits64.yaml") not in loader.files()
+
+    # Changes to the file which is no longer included cause no reload
+    (tmp_path / "Bits64.yaml").write_text("!types.Bits {}\n")
+    assert loader.reload([tmp_path / "Bits64.yaml"]) is data
+    assert loader.reloaded == set()
@@ -0,0 +1,60 @@
+"""Test cases for the intern module."""
+
+from typing import Any
+from typing import ClassVar
+from typing import List
+
+from my_data_model.intern import InternTable
+
+
+class Value:
+    """A class whose instances may be interned."""
+
+    internable: ClassVar[bool] = True
+
+    def __init__(self, **kwargs: Any):
+        """Create value."""
+        self.kwargs = kwargs
+
+
+def test_intern() -> None:
+    """Test that objects are created once for each distinct key."""
+    table = InternTable()
+    created: List[Value] = []
+
+    def intern(**kwargs: Any) -> Any:
+        def create() -> Value:
+            created.append(Value(**kwargs))
+            return created[-1]
+
+        return table.intern(cls=Value, mapping=kwargs, create=create)
+
+    a = intern(x=1, y="a")
+    assert intern(y="a", x=1) is a
+    assert intern(x=True, y="a") is not a
+    assert intern(x=2, y="a") is not a
+    assert len(created) == 3
+    assert (len(table), table.hits, table.misses) == (3, 1, 3)
+
+    # Internable attribute values are identified by identity
+    assert intern(x=a) is intern(x=a)
+    assert intern(x=a) is not intern(x=Value(x=1, y="a"))
+
+
+def test_not_internable() -> None:
+    """Test that objects are always created if they may not be interned."""
+    table = InternTable()
+    assert table.key(cls=object, mapping={"x": 1}) is None
+    assert table.key(cls=Value, mapping={"x": [1]}) is None
+    assert table.intern(cls=Value, mapping={"x": [1]}, create=list) == []
+    assert len(table) == 0
+
+
+def test_string() -> None:
+    """Test that equal strings are shared."""
+    table = InternTable()
+    a = "".join(["hello", " world"])
+    b = "".join(["hello ", "world"])
+    assert a is not b
+    assert table.string(a) is a
+    assert table.string(b) is a
@@ -1,15 +1,24 @@
 """Test cases for the io module."""
 
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
 from io import StringIO
+from pathlib import Path
 from typing import Any
+from typing import ClassVar
 from typing import List
 from typing import Mapping
+from typing import Optional
 
 import pytest
 import yaml
 from attrs import define
 
 from my_data_model import io
+from my_data_model.cache import IncludeCache
+from my_data_model.corpus import CorpusSpec
+from my_data_model.corpus import write_corpus
 
 
 @define(frozen=True, slots=True)
@@ -20,6 +29,16 @@ class MockObject:
     """Attributes of the object."""
 
 
+@define(frozen=True, slots=True)
+class MockType:
+    """A mock type, whose instances may be interned."""
+
+    internable: ClassVar[bool] = True
+
+    name: str
+    """Name of the type."""
+
+
 @define(frozen=True, slots=True)
 class MockCollection:
     """A mock collection."""
@@ -28,13 +47,30 @@ class MockCollection:
     """Objects in the collection."""
 
 
-def load_str(source: str) -> Any:
+DATA_PATH = Path(os.path.dirname(io.__file__)) / "data" / "model.yaml"
+"""Path to the example data."""
+
+
+@pytest.fixture(params=io.BACKENDS)
+def backend(request: pytest.FixtureRequest) -> str:
+    """Fixture which parametrizes tests over YAML parser backends."""
+    return str(request.param)
+
+
+def load_str(
+    source: str,
+    backend: Optional[str] = None,
+    package: str = __name__,
+    validate: bool = True,
+) -> Any:
     """Helper for loading data from a string."""
     with StringIO(source) as stream:
-        return io.load(stream=stream, package=__name__)
+        return io.load(
+            stream=stream, package=package, backend=backend, validate=validate
+        )
 
 
-def test_load_ok() -> None:
+def test_load_ok(backend: str) -> None:
     """Test successful load."""
     source = """
     !MockCollection
@@ -46,7 +82,7 @@ def test_load_ok() -> None:
       attrs:
         yah: gah
     """
-    data = load_str(source=source)
+    data = load_str(source=source, backend=backend)
     assert isinstance(data, MockCollection)
     assert data.objects == [
         MockObject(attrs={"foo": "bar"}),
@@ -54,7 +90,7 @@ def test_load_ok() -> None:
     ]
 
 
-def test_load_invalid_tag() -> None:
+def test_load_invalid_tag(backend: str) -> None:
     """Test load failure due to invalid tag."""
     source = """
     !InvalidTag
@@ -63,10 +99,10 @@ def test_load_invalid_tag() -> None:
     with pytest.raises(
         AttributeError, match=f"module {__name__!r} has no attribute 'InvalidTag'"
     ):
-        load_str(source=source)
+        load_str(source=source, backend=backend)
 
 
-def test_load_invalid_node_type() -> None:
+def test_load_invalid_node_type(backend: str) -> None:
     """Test load failure due to an invalid node type."""
     source = """
     !MockCollection
@@ -76,10 +112,10 @@ def test_load_invalid_node_type() -> None:
         yaml.constructor.ConstructorError,
         match="expected a mapping node, but found sequence",
     ):
-        load_str(source=source)
+        load_str(source=source, backend=backend)
 
 
-def test_load_invalid_key() -> None:
+def test_load_invalid_key(backend: str) -> None:
     """Test load failure due to an invalid key."""
     source = """
     !MockCollection
@@ -89,10 +125,10 @@ def test_load_invalid_key() -> None:
         yaml.constructor.ConstructorError,
         match="found unacceptable key ['foo']",
     ):
-        load_str(source=source)
+        load_str(source=source, backend=backend)
 
 
-def test_load_duplicate_key() -> None:
+def test_load_duplicate_key(backend: str) -> None:
     """Test load failure due to a duplicate key."""
     source = """
     !MockCollection
@@ -103,10 +139,10 @@ def test_load_duplicate_key() -> None:
         yaml.constructor.ConstructorError,
         match="found duplicate key 'foo'",
     ):
-        load_str(source=source)
+        load_str(source=source, backend=backend)
 
 
-def test_load_failed_construct() -> None:
+def test_load_failed_construct(backend: str) -> None:
     """Test load failure due to a constructor failure."""
     source = """
     !MockCollection
@@ -116,10 +152,10 @@ def test_load_failed_construct() -> None:
         yaml.constructor.ConstructorError,
         match="got an unexpected keyword argument 'foo'",
     ):
-        load_str(source=source)
+        load_str(source=source, backend=backend)
 
 
-def test_load_invalid_include() -> None:
+def test_load_invalid_include(backend: str) -> None:
     """Test load failure due to invalid usage of include directive."""
     source = """
     !include foo.yaml
@@ -128,4 +164,448 @@ def test_load_invalid_include() -> None:
         yaml.constructor.ConstructorError,
         match="'!include' tag not supported for f<file> loader",
     ):
-        load_str(source=source)
+        load_str(source=source, backend=backend)
+
+
+def test_load_data_backends_equal() -> None:
+    """Test that all backends load the example data identically."""
+
+    def load_data(backend: str) -> Any:
+        with open(DATA_PATH) as stream:
+            return io.load(stream=stream, backend=backend)
+
+    assert [load_data(backend) for backend in io.BACKENDS] == [
+        load_data("python")
+    ] * len(io.BACKENDS)
+
+
+def test_load_unknown_backend() -> None:
+    """Test load failure due to an unknown backend."""
+    with pytest.raises(ValueError, match="unknown YAML backend 'foo'"):
+        load_str(source="foo: bar", backend="foo")
+
+
+def test_load_libyaml_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the libyaml backend falls back if libyaml is not available."""
+    monkeypatch.setattr(yaml, "__with_libyaml__", False)
+    assert io._resolve_backend("libyaml") == "python"
+    assert load_str(source="foo: bar", backend="libyaml") == {"foo": "bar"}
+
+
+def test_load_include_cache(tmp_path: Path, backend: str) -> None:
+    """Test that included files are cached until they are modified."""
+    (tmp_path / "root.yaml").write_text(
+        """
+        !MockCollection
+        objects:
+        - !include a.yaml
+        - !include a.yaml
+        """
+    )
+    (tmp_path / "a.yaml").write_text("!include b.yaml")
+    (tmp_path / "b.yaml").write_text("!MockObject\nattrs: {foo: bar}")
+
+    cache = IncludeCache()
+
+    def load_root() -> Any:
+        with open(tmp_path / "root.yaml") as stream:
+            return io.load(
+                stream=stream, package=__name__, backend=backend, include_cache=cache
+            )
+
+    data = load_root()
+    assert data.objects == [MockObject(attrs={"foo": "bar"})] * 2
+    assert data.objects[0] is data.objects[1]
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    assert load_root() == data
+    assert (cache.hits, cache.misses) == (3, 2)
+
+    # Modifying a transitively included file invalidates the cache
+    (tmp_path / "b.yaml").write_text("!MockObject\nattrs: {foo: bazz}")
+    assert load_root().objects == [MockObject(attrs={"foo": "bazz"})] * 2
+    assert (cache.hits, cache.misses) == (4, 4)
+
+
+def test_load_include_no_cache(tmp_path: Path) -> None:
+    """Test loading without an include cache."""
+    (tmp_path / "root.yaml").write_text("[!include a.yaml, !include a.yaml]")
+    (tmp_path / "a.yaml").write_text("{foo: bar}")
+    with open(tmp_path / "root.yaml") as stream:
+        data = io.load(stream=stream, package=__name__, include_cache=None)
+    assert data == [{"foo": "bar"}] * 2
+    assert data[0] is not data[1]
+
+
+def test_load_include_default_cache(tmp_path: Path) -> None:
+    """Test that by default a load reuses included files, but loads do not."""
+    (tmp_path / "root.yaml").write_text("[!include a.yaml, !include a.yaml]")
+    (tmp_path / "a.yaml").write_text("{foo: bar}")
+
+    def load_root() -> Any:
+        with open(tmp_path / "root.yaml") as stream:
+            return io.load(stream=stream, package=__name__)
+
+    data = load_root()
+    assert data[0] is data[1]
+    data[0]["foo"] = "baz"
+    assert load_root() == [{"foo": "bar"}, {"foo": "bar"}]
+
+    (tmp_path / "stream.yaml").write_text(
+        "[!include a.yaml, !include a.yaml]\n---\n[!include a.yaml]\n"
+    )
+    with open(tmp_path / "stream.yaml") as stream:
+        (first, second) = io.iter_load(stream=stream, package=__name__)
+    assert first[0] is first[1]
+    assert second[0] is not first[0]
+
+
+def test_profile_load(tmp_path: Path, backend: str) -> None:
+    """Test that stats are recorded per phase and per class, across includes."""
+    (tmp_path / "root.yaml").write_text(
+        """
+        !MockCollection
+        objects:
+        - !include a.yaml
+        - !MockObject
+          attrs: {yah: gah}
+        """
+    )
+    (tmp_path / "a.yaml").write_text("!MockObject\nattrs: {foo: bar}")
+
+    with open(tmp_path / "root.yaml") as stream:
+        (data, stats) = io.profile_load(
+            stream=stream, package=__name__, backend=backend
+        )
+
+    assert data.objects == [
+        MockObject(attrs={"foo": "bar"}),
+        MockObject(attrs={"yah": "gah"}),
+    ]
+
+    assert stats.phases["compose"].calls == 2
+    assert stats.phases["resolve"].calls == 5
+    assert stats.phases["validate"].calls == 3
+    assert {name: s.calls for (name, s) in stats.classes.items()} == {
+        "MockCollection": 1,
+        "MockObject": 2,
+    }
+    assert stats.total_ns > 0
+
+    scanned = stats.phases["scan"].calls > 0 and stats.phases["parse"].calls > 0
+    assert scanned == (backend == "python")
+
+    # Profiling loaders are distinct from the normal ones
+    assert io.get_loader_class(
+        package=__name__, backend=backend, profile=True
+    ) is not io.get_loader_class(package=__name__, backend=backend)
+
+
+@pytest.mark.parametrize("intern", [True, False])
+def test_load_intern(backend: str, intern: bool) -> None:
+    """Test that equal internable objects and strings are shared."""
+    source = """
+    - !MockType {name: a}
+    - !MockType {name: a}
+    - !MockType {name: b}
+    - !MockObject {attrs: {foo: hello world}}
+    - !MockObject {attrs: {foo: hello world}}
+    """
+    with StringIO(source) as stream:
+        data = io.load(stream=stream, package=__name__, backend=backend, intern=intern)
+
+    assert data[0] == data[1]
+    assert (data[0] is data[1]) == intern
+    assert data[0] is not data[2]
+
+    # Objects of classes which are not internable are never shared
+    assert data[3] == data[4]
+    assert data[3] is not data[4]
+    assert (data[3].attrs["foo"] is data[4].attrs["foo"]) == intern
+
+
+@pytest.mark.parametrize("model", ["attrs", "columnar", "pydantic_bm", "pydantic_dc"])
+def test_load_trusted(model: str) -> None:
+    """Test that trusted loads create equal objects, without validation."""
+    package = f"my_data_model.models_{model}"
+    with open(DATA_PATH) as stream:
+        expected = io.load(stream=stream, package=package, include_cache=None)
+    with open(DATA_PATH) as stream:
+        data = io.load(
+            stream=stream, package=package, include_cache=None, validate=False
+        )
+    assert data == expected
+    assert type(data) is type(expected)
+
+    source = """
+    !types.Address
+    name: Address
+    description: An address
+    width: -1
+    """
+    with pytest.raises(yaml.constructor.ConstructorError, match="not positive"):
+        load_str(source=source, package=package)
+    assert load_str(source=source, package=package, validate=False).width == -1
+
+
+def test_load_trusted_fallback() -> None:
+    """Test that packages without a construct function are validated."""
+    with StringIO("!MockObject {attrs: {foo: bar}}") as stream:
+        data = io.load(stream=stream, package=__name__, validate=False)
+    assert data == MockObject(attrs={"foo": "bar"})
+
+
+def test_loader_class_per_package() -> None:
+    """Test that loader classes are created once per package."""
+    loader = io._get_loader_class(package=__name__, backend="python")
+    assert loader is io._get_loader_class(package=__name__, backend="python")
+    assert loader.package == __name__
+    assert loader is not io._get_loader_class(
+        package=io.DEFAULT_PACKAGE, backend="python"
+    )
+
+    # Constructors are registered on the derived class only
+    assert "!include" in loader.yaml_constructors  # type: ignore [attr-defined]
+    assert "!include" not in io._YamlLoader.yaml_constructors
+
+
+@pytest.mark.parametrize("executor", list(io.EXECUTORS))
+def test_load_many(tmp_path: Path, executor: str) -> None:
+    """Test loading many files concurrently."""
+    paths = []
+    for index in range(0, 8):
+        path = tmp_path / f"{index}.yaml"
+        if index == 3:
+            path.write_text("!commands.Command\nname: cmd\n")
+        else:
+            path.write_text(f"!types.Bits\nname: B{index}\ndescription: B\nwidth: 8\n")
+        paths.append(path)
+
+    results = io.load_many(paths=paths, workers=2, executor=executor)
+
+    assert [result.name for result in results if hasattr(result, "name")] == [
+        f"B{index}" for index in range(0, 8) if index != 3
+    ]
+    assert isinstance(results[3], yaml.constructor.ConstructorError)
+    assert "missing 2 required keyword-only arguments" in str(results[3])
+
+
+def test_load_many_unknown_executor() -> None:
+    """Test load_many failure due to an unknown executor."""
+    with pytest.raises(ValueError, match="unknown executor 'foo'"):
+        io.load_many(paths=[], executor="foo")
+
+
+def test_iter_load(backend: str) -> None:
+    """Test loading a stream of many documents."""
+    source = """\
+--- !MockObject
+attrs: {foo: bar}
+--- !MockObject
+attrs: {yah: gah}
+--- !MockObject
+foo: bar
+"""
+    with StringIO(source) as stream:
+        documents = io.iter_load(stream=stream, package=__name__, backend=backend)
+        assert next(documents) == MockObject(attrs={"foo": "bar"})
+        assert next(documents) == MockObject(attrs={"yah": "gah"})
+        with pytest.raises(
+            yaml.constructor.ConstructorError,
+            match="got an unexpected keyword argument 'foo'",
+        ):
+            next(documents)
+
+
+def test_iter_load_includes(tmp_path: Path) -> None:
+    """Test that the dependencies of each document are released with it."""
+    (tmp_path / "a.yaml").write_text("{foo: bar}")
+    (tmp_path / "root.yaml").write_text("--- !include a.yaml\n" * 3)
+    with open(tmp_path / "root.yaml") as stream:
+        documents = io.iter_load(stream=stream, package=__name__)
+        for document in documents:
+            assert document == {"foo": "bar"}
+            loader = documents.gi_frame.f_locals["loader"]  # type: ignore
+            assert len(loader.dependencies) == 1
+
+
+def test_iter_load_empty() -> None:
+    """Test loading an empty stream."""
+    with StringIO("") as stream:
+        assert list(io.iter_load(stream=stream, package=__name__)) == []
+
+
+def test_load_compiled(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test loading via a compiled model cache."""
+    (tmp_path / "root.yaml").write_text("!MockCollection\nobjects: [!include a.yaml]")
+    (tmp_path / "a.yaml").write_text("!MockObject\nattrs: {foo: bar}")
+    compiled = tmp_path / "root.cache"
+
+    def load_root() -> Any:
+        with open(tmp_path / "root.yaml") as stream:
+            return io.load(stream=stream, package=__name__, compiled=compiled)
+
+    # Cold load compiles the cache
+    data = load_root()
+    assert data == MockCollection(objects=[MockObject(attrs={"foo": "bar"})])
+    assert compiled.exists()
+
+    # Warm load revives the cache without constructing any objects
+    with monkeypatch.context() as context:
+        context.setattr(io._YamlLoaderMixin, "construct_mapping", None)
+        assert load_root() == data
+
+    # Modifying an included file invalidates the cache
+    (tmp_path / "a.yaml").write_text("!MockObject\nattrs: {foo: baz}")
+    assert load_root() == MockCollection(objects=[MockObject(attrs={"foo": "baz"})])
+
+    # A cache for a different package is not used
+    with open(tmp_path / "root.yaml") as stream:
+        with pytest.raises(AttributeError, match="has no attribute 'Mock"):
+            io.load(stream=stream, compiled=compiled)
+
+    # A corrupt cache is ignored
+    compiled.write_bytes(b"foo")
+    assert load_root() == MockCollection(objects=[MockObject(attrs={"foo": "baz"})])
+
+
+def test_load_compiled_options(tmp_path: Path) -> None:
+    """Test that a compiled cache is only used by loads with the same options."""
+    path = tmp_path / "root.yaml"
+    path.write_text(
+        "- !types.Bits {name: B, description: Bad, width: -5}\n"
+        "- !types.Bits {name: B, description: Bad, width: -5}\n"
+    )
+    compiled = tmp_path / "root.cache"
+
+    def load_root(**kwargs: Any) -> Any:
+        with open(path) as stream:
+            return io.load(stream=stream, compiled=compiled, **kwargs)
+
+    # Unvalidated data is not revived for a load which validates
+    assert load_root(validate=False)[0].width == -5
+    with pytest.raises(yaml.constructor.ConstructorError, match="width"):
+        load_root()
+
+    # Interned data is not revived for a load which does not intern
+    path.write_text(path.read_text().replace("-5", "8"))
+    data = load_root()
+    assert data[0] is data[1]
+    data = load_root(intern=False)
+    assert data[0] == data[1]
+    assert data[0] is not data[1]
+
+
+def test_load_compiled_unnamed_stream(tmp_path: Path) -> None:
+    """Test load failure due to a compiled cache for an unnamed stream."""
+    with pytest.raises(ValueError, match="not supported for <file>"):
+        with StringIO("foo: bar") as stream:
+            io.load(stream=stream, compiled=tmp_path / "cache")
+
+
+@pytest.mark.parametrize("executor", [None, *io.EXECUTORS])
+@pytest.mark.parametrize("model", ["attrs", "columnar", "pydantic_bm", "pydantic_dc"])
+def test_aload(tmp_path: Path, model: str, executor: Optional[str]) -> None:
+    """Test that loading asynchronously creates the same data as loading."""
+    package = f"my_data_model.models_{model}"
+    corpus = write_corpus(
+        directory=tmp_path, spec=CorpusSpec(commands=8, inputs=2, duplication=0.5)
+    )
+    with open(corpus.root) as stream:
+        expected = io.load(stream=stream, package=package, include_cache=None)
+
+    async def aload() -> Any:
+        if executor is None:
+            return await io.aload(path=corpus.root, package=package)
+        with io.EXECUTORS[executor](max_workers=2) as pool:
+            return await io.aload(
+                path=corpus.root, package=package, executor=pool, concurrency=2
+            )
+
+    assert asyncio.run(aload()) == expected
+
+
+def test_aload_concurrent(tmp_path: Path, backend: str) -> None:
+    """Test that the event loop runs other tasks while loading."""
+    corpus = write_corpus(directory=tmp_path, spec=CorpusSpec(commands=20))
+    with open(DATA_PATH) as stream:
+        expected = io.load(stream=stream, include_cache=None)
+
+    async def main() -> Any:
+        ticks = 0
+
+        async def tick() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        ticker = asyncio.ensure_future(tick())
+        results = await asyncio.gather(
+            io.aload(path=corpus.root, backend=backend),
+            io.aload(path=DATA_PATH, backend=backend),
+        )
+        ticker.cancel()
+        assert ticks > 1
+        return results[1]
+
+    assert asyncio.run(main()) == expected
+
+
+def test_aload_cancel(tmp_path: Path) -> None:
+    """Test that no further work is started once a load is cancelled."""
+    corpus = write_corpus(directory=tmp_path, spec=CorpusSpec(commands=50))
+
+    class CountingExecutor(ThreadPoolExecutor):
+        submitted = 0
+
+        def submit(self, *args: Any, **kwargs: Any) -> Any:
+            self.submitted += 1
+            return super().submit(*args, **kwargs)
+
+    async def main(executor: CountingExecutor) -> None:
+        task = asyncio.ensure_future(
+            io.aload(path=corpus.root, executor=executor, concurrency=1)
+        )
+        while executor.submitted < 10:
+            await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    with CountingExecutor(max_workers=1) as executor:
+        asyncio.run(main(executor))
+        submitted = executor.submitted
+    # Each command file is parsed and constructed
+    assert submitted < 50
+
+
+def test_aload_errors(tmp_path: Path) -> None:
+    """Test failure to load asynchronously."""
+    (tmp_path / "a.yaml").write_text("[!include b.yaml, !include c.yaml]\n")
+    (tmp_path / "b.yaml").write_text("[!include a.yaml]\n")
+    (tmp_path / "c.yaml").write_text("[!include missing.yaml]\n")
+    (tmp_path / "d.yaml").write_text("!types.Bits {name: B, width: 8}\n")
+
+    with pytest.raises(yaml.constructor.ConstructorError, match="includes itself"):
+        asyncio.run(io.aload(path=tmp_path / "a.yaml"))
+    with pytest.raises(FileNotFoundError):
+        asyncio.run(io.aload(path=tmp_path / "c.yaml"))
+    with pytest.raises(yaml.constructor.ConstructorError, match="description"):
+        asyncio.run(io.aload(path=tmp_path / "d.yaml"))
+
+
+@pytest.mark.parametrize("backend", io.BACKENDS)
+def test_aload_error_marks(tmp_path: Path, backend: str) -> None:
+    """Test that errors in loading asynchronously are marked with the path."""
+    parse_path = tmp_path / "parse.yaml"
+    parse_path.write_text("[!include construct.yaml,\n")
+    construct_path = tmp_path / "construct.yaml"
+    construct_path.write_text("!types.Bits {name: B, width: 8}\n")
+
+    for path in [parse_path, construct_path]:
+        with pytest.raises(yaml.MarkedYAMLError) as exc_info:
+            asyncio.run(io.aload(path=path, backend=backend))
+        mark = exc_info.value.problem_mark
+        assert mark is not None
+        assert mark.name == str(path)
@@ -0,0 +1,140 @@
+"""Test cases for the lazy module."""
+
+import textwrap
+from io import StringIO
+from pathlib import Path
+from typing import Any
+
+import pytest
+import yaml
+
+from my_data_model import io
+from my_data_model.corpus import CorpusSpec
+from my_data_model.corpus import write_corpus
+from my_data_model.lazy import LazyInclude
+from my_data_model.lazy import LazyModel
+from my_data_model.lazy import force
+from my_data_model.models_attrs.commands import Command
+from my_data_model.models_attrs.interfaces import Interface
+from tests.test_io import DATA_PATH
+
+
+SOURCE = """\
+!interfaces.Interface
+name: iface
+commands:
+- !commands.Command
+  name: good
+  description: Good command
+  inputs:
+    X0: !commands.CommandValue
+      name: in
+      description: Input
+      type: &bits !types.Bits {name: Bits8, description: A byte, width: 8}
+- !commands.Command
+  name: bad
+  description: Bad command
+  inputs:
+    X0: !commands.CommandValue
+      name: in
+      description: Input
+      type: !types.Bits {name: Bits0, description: Nothing, width: 0}
+"""
+"""Source of an interface with one invalid command."""
+
+
+def lazy_load(source: str, backend: str) -> Any:
+    """Load data lazily from a string."""
+    with StringIO(source) as stream:
+        return io.load(stream=stream, backend=backend, lazy=True)
+
+
+@pytest.mark.parametrize("backend", io.BACKENDS)
+def test_lazy_attributes(backend: str) -> None:
+    """Test that nested objects are constructed and validated when read."""
+    iface = lazy_load(SOURCE, backend=backend)
+    assert isinstance(iface, LazyModel)
+    assert iface.tag == "!interfaces.Interface"
+    assert iface.name == "iface"
+    assert repr(iface) == "LazyModel(!interfaces.Interface at <file>:1)"
+    with pytest.raises(yaml.constructor.ConstructorError, match="not positive"):
+        iface.commands
+    assert not iface.forced
+    with pytest.raises(yaml.constructor.ConstructorError, match="not positive"):
+        force(iface)
+
+    iface = lazy_load(SOURCE.replace("width: 0", "width: 1"), backend=backend)
+    commands = iface.commands
+    assert [type(command) for command in commands] == [Command, Command]
+    assert commands[1].inputs["X0"].type.width == 1
+    assert not iface.forced
+
+    # Objects constructed when read are reused when the root is forced
+    forced = iface.force()
+    assert isinstance(forced, Interface)
+    assert iface.forced
+    assert forced.commands[0] is commands[0]
+    assert iface.commands == forced.commands
+
+
+def test_force() -> None:
+    """Test that forcing constructs the same data as an eager load."""
+    source = SOURCE.replace("width: 0", "width: 1")
+    data = lazy_load("- " + textwrap.indent(source, "  ").lstrip(), backend="python")
+    assert isinstance(data, list)
+    good = data[0].commands[0]
+    assert isinstance(good, Command)
+    iface = force(data)[0]
+    assert isinstance(iface, Interface)
+    with StringIO(source) as stream:
+        assert iface == io.load(stream=stream)
+
+    # Objects forced earlier are reused by the objects which contain them
+    assert iface.commands[0] is good
+    assert force({"a": [1, "b"]}) == {"a": [1, "b"]}
+
+
+def test_lazy_includes() -> None:
+    """Test that included files are loaded when they are accessed."""
+    with open(DATA_PATH) as stream:
+        iface = io.load(stream=stream, lazy=True, include_cache=None)
+    assert iface.name == "Iface1"
+    commands = iface.commands
+    assert [type(command) for command in commands] == [LazyInclude, LazyInclude]
+    assert repr(commands[1]) == "LazyInclude(commands/Cmd2.yaml)"
+
+    assert commands[1].name == "cmd2"
+    assert [command.loaded for command in commands] == [False, True]
+    assert isinstance(commands[1].value, LazyModel)
+    # Placeholders for the same node share the data
+    assert iface.commands[1].loaded
+
+    with open(DATA_PATH) as stream:
+        expected = io.load(stream=stream, include_cache=None)
+    assert commands[0].force() == expected.commands[0]
+    forced = force(iface)
+    assert forced == expected
+    # Data already loaded from included files is reused
+    assert forced.commands[1] is commands[1].force()
+
+
+def test_lazy_include_tree(tmp_path: Path) -> None:
+    """Test that reading one command of a tree only loads its file."""
+    corpus = write_corpus(directory=tmp_path, spec=CorpusSpec(commands=20, inputs=2))
+    with open(corpus.root) as stream:
+        root = io.load(stream=stream, lazy=True, include_cache=None)
+    assert isinstance(root, LazyInclude)
+
+    commands = root.commands
+    assert len(commands) == 20
+    assert commands[7].inputs["X1"].name == "in1"
+    assert [command.loaded for command in commands].count(True) == 1
+    assert force(commands[7]).name == "Cmd7"
+    assert force(["x", {"y": commands[7]}])[1]["y"] == force(commands[7])
+
+
+def test_lazy_compiled(tmp_path: Path) -> None:
+    """Test that lazy loads cannot use a compiled model cache."""
+    with open(DATA_PATH) as stream:
+        with pytest.raises(ValueError, match="not supported for lazy loads"):
+            io.load(stream=stream, lazy=True, compiled=tmp_path / "model.cache")
@@ -82,6 +82,9 @@ def construct_invalid_type_data(model_name: str) -> List[Any]:
                 },
                 {
                     "attrs": "missing 1 required keyword-only argument: 'description'",
+                    "columnar": (
+                        "missing 1 required keyword-only argument: 'description'"
+                    ),
                     "pydantic_bm": [("missing", tuple(["description"]))],
                     "pydantic_dc": [("missing", tuple(["description"]))],
                 },
@@ -95,6 +98,7 @@ def construct_invalid_type_data(model_name: str) -> List[Any]:
                 },
                 {
                     "attrs": "missing 1 required keyword-only argument: 'name'",
+                    "columnar": "missing 1 required keyword-only argument: 'name'",
                     "pydantic_bm": [("missing", tuple(["name"]))],
                     "pydantic_dc": [("missing", tuple(["name"]))],
                 },
@@ -108,6 +112,7 @@ def construct_invalid_type_data(model_name: str) -> List[Any]:
                 },
                 {
                     "attrs": "missing 1 required keyword-only argument: 'type'",
+                    "columnar": "missing 1 required keyword-only argument: 'type'",
                     "pydantic_bm": [("missing", tuple(["type"]))],
                     "pydantic_dc": [("missing", tuple(["type"]))],
                 },
@@ -122,6 +127,7 @@ def construct_invalid_type_data(model_name: str) -> List[Any]:
                 },
                 {
                     "attrs": "'description' must be",
+                    "columnar": "'description' must be",
                     "pydantic_bm": [("string_type", tuple(["description"]))],
                     "pydantic_dc": [("string_type", tuple(["description"]))],
                 },
@@ -136,6 +142,7 @@ def construct_invalid_type_data(model_name: str) -> List[Any]:
                 },
                 {
                     "attrs": "'name' must be",
+                    "columnar": "'name' must be",
                     "pydantic_bm": [("string_type", tuple(["name"]))],
                     "pydantic_dc": [("string_type", tuple(["name"]))],
                 },
@@ -150,6 +157,7 @@ def construct_invalid_type_data(model_name: str) -> List[Any]:
                 },
                 {
                     "attrs": "'type' must be",
+                    "columnar": "'type' must be",
                     "pydantic_bm": [
                         ("dict_type", tuple(["type", "Address"])),
                         ("dict_type", tuple(["type", "Array"])),
@@ -171,6 +179,9 @@ def construct_invalid_type_data(model_name: str) -> List[Any]:
                 },
                 {
                     "attrs": "missing 1 required keyword-only argument: 'description'",
+                    "columnar": (
+                        "missing 1 required keyword-only argument: 'description'"
+                    ),
                     "pydantic_bm": [("missing", tuple(["description"]))],
                     "pydantic_dc": [("missing", tuple(["description"]))],
                 },
@@ -184,6 +195,7 @@ def construct_invalid_type_data(model_name: str) -> List[Any]:
                 },
                 {
                     "attrs": "missing 1 required keyword-only argument: 'inputs'",
+                    "columnar": "missing 1 required keyword-only argument: 'inputs'",
                     "pydantic_bm": [("missing", tuple(["inputs"]))],
                     "pydantic_dc": [("missing", tuple(["inputs"]))],
                 },
@@ -197,6 +209,7 @@ def construct_invalid_type_data(model_name: str) -> List[Any]:
                 },
                 {
                     "attrs": "missing 1 required keyword-only argument: 'name'",
+                    "columnar": "missing 1 required keyword-only argument: 'name'",
                     "pydantic_bm": [("missing", tuple(["name"]))],
                     "pydantic_dc": [("missing", tuple(["name"]))],
                 },
@@ -211,6 +224,7 @@ def construct_invalid_type_data(model_name: str) -> List[Any]:
                 },
                 {
                     "attrs": "'description' must be",
+                    "columnar": "'description' must be",
                     "pydantic_bm": [("string_type", tuple(["description"]))],
                     "pydantic_dc": [("string_type", tuple(["description"]))],
                 },
@@ -232,6 +246,7 @@ def construct_invalid_type_data(model_name: str) -> List[Any]:
                 },
                 {
                     "attrs": "'inputs' must be",
+                    "columnar": "'inputs' must be",
                     "pydantic_bm": [("dict_type", tuple(["inputs", "X1"]))],
                     "pydantic_dc": [("dataclass_type", tuple(["inputs", "X1"]))],
                 },
@@ -246,6 +261,7 @@ def construct_invalid_type_data(model_name: str) -> List[Any]:
                 },
                 {
                     "attrs": "'name' must be",
+                    "columnar": "'name' must be",
                     "pydantic_bm": [("string_type", tuple(["name"]))],
                     "pydantic_dc": [("string_type", tuple(["name"]))],
                 },
@@ -261,6 +277,7 @@ def construct_invalid_type_data(model_name: str) -> List[Any]:
                 },
                 {
                     "attrs": "got an unexpected keyword argument 'foo'",
+                    "columnar": "got an unexpected keyword argument 'foo'",
                     "pydantic_bm": [("extra_forbidden", tuple(["foo"]))],
                     "pydantic_dc": [("unexpected_keyword_argument", tuple(["foo"]))],
                 },
@@ -273,6 +290,7 @@ def construct_invalid_type_data(model_name: str) -> List[Any]:
                 },
                 {
                     "attrs": "missing 1 required keyword-only argument: 'name'",
+                    "columnar": "missing 1 required keyword-only argument: 'name'",
                     "pydantic_bm": [("missing", tuple(["name"]))],
                     "pydantic_dc": [("missing", tuple(["name"]))],
                 },
@@ -286,6 +304,7 @@ def construct_invalid_type_data(model_name: str) -> List[Any]:
                 },
                 {
                     "attrs": "'name' must be <class 'str'>",
+                    "columnar": "'name' must be <class 'str'>",
                     "pydantic_bm": [("string_type", tuple(["name"]))],
                     "pydantic_dc": [("string_type", tuple(["name"]))],
                 },
@@ -298,6 +317,7 @@ def construct_invalid_type_data(model_name: str) -> List[Any]:
                 },
                 {
                     "attrs": "missing 1 required keyword-only argument: 'commands'",
+                    "columnar": "missing 1 required keyword-only argument: 'commands'",
                     "pydantic_bm": [("missing", tuple(["commands"]))],
                     "pydantic_dc": [("missing", tuple(["commands"]))],
                 },
@@ -316,6 +336,7 @@ def construct_invalid_type_data(model_name: str) -> List[Any]:
                 },
                 {
                     "attrs": "'commands' must be",
+                    "columnar": "'commands' must be",
                     "pydantic_bm": [("dict_type", tuple(["commands", 1]))],
                     "pydantic_dc": [("dataclass_type", tuple(["commands", 1]))],
                 },
@@ -330,6 +351,7 @@ def construct_invalid_type_data(model_name: str) -> List[Any]:
                 },
                 {
                     "attrs": "got an unexpected keyword argument 'foo'",
+                    "columnar": "got an unexpected keyword argument 'foo'",
                     "pydantic_bm": [("extra_forbidden", tuple(["foo"]))],
                     "pydantic_dc": [("unexpected_keyword_argument", tuple(["foo"]))],
                 },
@@ -0,0 +1,161 @@
+"""Test cases for the models_columnar module."""
+
+import inspect
+import pickle  # nosec B403
+from io import StringIO
+from typing import Any
+from typing import Mapping
+
+import pytest
+import yaml
+
+from my_data_model import io
+from my_data_model.models_columnar.commands import Command
+from my_data_model.models_columnar.commands import CommandValue
+from my_data_model.models_columnar.common import View
+from my_data_model.models_columnar.interfaces import Interface
+from my_data_model.models_columnar.store import current_store
+from my_data_model.models_columnar.types import Array
+from my_data_model.models_columnar.types import Bits
+from tests.test_models import construct_good_data
+from tests.test_models import construct_invalid_type_data
+from tests.test_models import construct_invalid_value_data
+
+
+TestBits64 = Bits(name="Bits64", description="A 64-bit field", width=64)
+"""An address used for test purposes."""
+
+COMMAND_SOURCE = """\
+!commands.Command
+name: Cmd
+{description}
+inputs:
+  X0: !commands.CommandValue
+    name: in0
+    description: Input
+    type: !types.Bits {{name: Bits8, description: Octet, width: 8}}
+"""
+"""Source of a command, which is not the root of a model."""
+
+
+@pytest.mark.parametrize("cls, kwargs", construct_good_data("columnar"))
+def test_construct_good(cls: type, kwargs: Mapping[str, Any]) -> None:
+    """Test successful construction of models.
+
+    Args:
+        cls: type of model to construct
+        kwargs: dictionary of kwargs passed to constructor
+    """
+    cls(**kwargs)
+
+
+@pytest.mark.parametrize("cls, kwargs, errors", construct_invalid_type_data("columnar"))
+def test_construct_invalid_type(
+    cls: type, kwargs: Mapping[str, Any], errors: str
+) -> None:
+    """Test failed construction of models due to invalid argument type(s).
+
+    Args:
+        cls: type of model to construct
+        kwargs: dictionary of kwargs passed to constructor
+        errors: expected error message
+    """
+    with pytest.raises(TypeError, match=errors):
+        cls(**kwargs)
+
+
+@pytest.mark.parametrize(
+    "cls, kwargs, errors", construct_invalid_value_data("columnar")
+)
+def test_construct_invalid_value(
+    cls: type, kwargs: Mapping[str, Any], errors: str
+) -> None:
+    """Test failed construction of models due to invalid argument value(s).
+
+    Args:
+        cls: type of model to construct
+        kwargs: dictionary of kwargs passed to constructor
+        errors: expected error message
+    """
+    with pytest.raises(ValueError, match=errors):
+        cls(**kwargs)
+
+
+def test_array_width() -> None:
+    """Test Array::width."""
+
+    def make_array(size: int) -> Array:
+        return Array(description="Array", name="array", size=size, type=TestBits64)
+
+    assert make_array(size=0).width == 0
+    assert make_array(size=1).width == 64
+    assert make_array(size=2).width == 128
+
+
+def test_views() -> None:
+    """Test that objects are views of rows of one store per interface."""
+    value = CommandValue(description="Input", name="in0", type=TestBits64)
+    command = Command(description="Command", inputs={"X0": value}, name="cmd")
+    iface = Interface(commands=[command], name="iface")
+
+    assert iface.commands[0] == command
+    assert iface.commands[0].inputs["X0"].type.width == 64
+    assert iface._store is command._store
+    with pytest.raises(AttributeError, match="immutable"):
+        iface.name = "other"  # type: ignore [misc]
+
+    # Objects from the sealed store of an interface are copied into the next
+    other = Interface(commands=[command], name="other")
+    assert other._store is not iface._store
+    assert other.commands == iface.commands
+    assert len(iface._store.command_name) == 1
+    assert inspect.isabstract(View)
+
+
+@pytest.mark.parametrize("validate", [True, False])
+def test_load_store_scope(validate: bool) -> None:
+    """Test that each loaded document has its own store, even if it fails."""
+    store = current_store()
+    rows = (len(store.type_kind), len(store.value_name), len(store.command_name))
+
+    commands = [
+        io.load(
+            stream=StringIO(COMMAND_SOURCE.format(description="description: C")),
+            package="my_data_model.models_columnar",
+            validate=validate,
+        )
+        for _ in range(2)
+    ]
+    assert commands[0] == commands[1]
+    assert commands[0]._store is not commands[1]._store
+    assert len(commands[0]._store.command_name) == 1
+
+    if validate:
+        with pytest.raises(yaml.YAMLError, match="missing 1 required"):
+            io.load(
+                stream=StringIO(COMMAND_SOURCE.format(description="")),
+                package="my_data_model.models_columnar",
+            )
+
+    # Nothing was added to the store which was current before the loads
+    assert current_store() is store
+    assert (
+        len(store.type_kind),
+        len(store.value_name),
+        len(store.command_name),
+    ) == rows
+
+
+def test_pickle() -> None:
+    """Test that views are pickled with their store."""
+    array = Array(description="Array", name="array", size=2, type=TestBits64)
+    command = Command(
+        description="Command",
+        inputs={"X0": CommandValue(description="Input", name="in0", type=array)},
+        name="cmd",
+    )
+    iface = Interface(commands=[command], name="iface")
+
+    copy = pickle.loads(pickle.dumps(iface))  # nosec B301
+    assert copy == iface
+    assert copy.commands[0].inputs["X0"].type.width == 128
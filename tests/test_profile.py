@@ -0,0 +1,49 @@
+"""Test cases for the profile module."""
+
+import time
+
+from my_data_model.profile import PHASES
+from my_data_model.profile import LoadStats
+
+
+def test_phases_exclusive() -> None:
+    """Test that time in a nested phase is not counted in the enclosing phase."""
+    stats = LoadStats()
+    with stats.phase("compose"):
+        with stats.phase("parse"):
+            time.sleep(0.02)
+        with stats.phase("parse"):
+            pass
+
+    assert stats.phases["compose"].calls == 1
+    assert stats.phases["parse"].calls == 2
+    assert stats.phases["parse"].time_ns >= 20_000_000
+    assert stats.phases["compose"].time_ns < stats.phases["parse"].time_ns
+    assert stats.total_ns == sum(s.time_ns for s in stats.phases.values())
+
+
+def test_model_class() -> None:
+    """Test that validation time is recorded per class."""
+    stats = LoadStats()
+    with stats.phase("construct"):
+        with stats.model_class("types.Address"):
+            pass
+        with stats.model_class("types.Address"):
+            pass
+        with stats.model_class("types.Bits"):
+            pass
+
+    assert stats.phases["validate"].calls == 3
+    assert stats.classes["types.Address"].calls == 2
+    assert stats.classes["types.Bits"].calls == 1
+
+
+def test_report() -> None:
+    """Test that the report has a row for each phase and class."""
+    stats = LoadStats()
+    with stats.model_class("types.Address"):
+        pass
+    report = "\n".join(stats.report())
+    for phase in PHASES:
+        assert phase in report
+    assert "types.Address" in report
@@ -0,0 +1,117 @@
+"""Test cases for the query module, and the command indexes of interfaces."""
+
+import dataclasses
+import pickle
+from io import StringIO
+from typing import Any
+from typing import Callable
+from typing import Dict
+
+import attrs
+import pydantic
+import pytest
+
+from my_data_model import io
+from my_data_model.corpus import CorpusSpec
+from my_data_model.corpus import write_source
+from my_data_model.query import ModelIndex
+from my_data_model.utils import import_model_class
+from tests.test_io import DATA_PATH
+
+
+MODELS = ["attrs", "columnar", "pydantic_bm", "pydantic_dc"]
+
+
+@pytest.mark.parametrize("validate", [True, False])
+@pytest.mark.parametrize("model", MODELS)
+def test_interface_command(model: str, validate: bool) -> None:
+    """Test that commands of an interface are found by name."""
+    with open(DATA_PATH) as stream:
+        iface = io.load(
+            stream=stream,
+            package=f"my_data_model.models_{model}",
+            include_cache=None,
+            validate=validate,
+        )
+    assert iface.command("cmd2") == iface.commands[1]
+    assert list(iface.commands_by_name) == ["Cmd1", "cmd2"]
+    assert iface.commands_by_name["Cmd1"] == iface.commands[0]
+    with pytest.raises(KeyError):
+        iface.command("Cmd2")
+    with pytest.raises(TypeError):
+        iface.commands_by_name["Cmd3"] = iface.commands[0]
+
+    unpickled = pickle.loads(pickle.dumps(iface))  # noqa: S301
+    assert unpickled == iface
+    assert unpickled.command("Cmd1") == iface.commands[0]
+
+
+@pytest.mark.parametrize("model", MODELS)
+def test_interface_command_dups(model: str) -> None:
+    """Test that interfaces with duplicate command names are rejected."""
+    command = import_model_class(model, "commands", "Command")(
+        description="Command", inputs={}, name="cmd"
+    )
+    interface_cls = import_model_class(model, "interfaces", "Interface")
+    with pytest.raises(ValueError, match="command names contains duplicate") as info:
+        interface_cls(commands=[command, command], name="iface")
+    if isinstance(info.value, pydantic.ValidationError):
+        assert [error["loc"] for error in info.value.errors()] == [("commands",)]
+
+
+@pytest.mark.parametrize(
+    "model, asdict",
+    [
+        ("attrs", attrs.asdict),
+        ("pydantic_bm", lambda obj: obj.model_dump()),
+        ("pydantic_dc", dataclasses.asdict),
+    ],
+)
+def test_interface_command_index_private(
+    model: str, asdict: Callable[[Any], Dict[str, Any]]
+) -> None:
+    """Test that the command index of an interface is not serialized."""
+    with open(DATA_PATH) as stream:
+        iface = io.load(stream=stream, package=f"my_data_model.models_{model}")
+    assert iface.command("Cmd1") == iface.commands[0]
+    assert list(asdict(iface)) == ["commands", "name"]
+
+
+@pytest.mark.parametrize("model", MODELS)
+def test_model_index(model: str) -> None:
+    """Test queries across interfaces."""
+    spec = CorpusSpec(
+        interfaces=2, commands=3, inputs=2, duplication=0.5, shared_types=2
+    )
+    with StringIO() as stream:
+        write_source(stream=stream, spec=spec)
+        source = stream.getvalue()
+    with StringIO(source) as stream:
+        interfaces = io.load(stream=stream, package=f"my_data_model.models_{model}")
+    index = ModelIndex(interfaces)
+
+    assert index.command("Iface1", "Cmd2") == interfaces[1].commands[2]
+    with pytest.raises(KeyError):
+        index.command("Iface2", "Cmd0")
+    assert [ref.interface.name for ref in index.commands_named("Cmd1")] == [
+        "Iface0",
+        "Iface1",
+    ]
+    assert index.commands_named("Cmd3") == ()
+
+    # Commands using a type directly, or as the element type of an array,
+    # are each found once
+    assert [
+        (ref.interface.name, ref.command.name)
+        for ref in index.commands_using_type("Bits64")
+    ] == [
+        ("Iface0", "Cmd2"),
+        ("Iface1", "Cmd0"),
+        ("Iface1", "Cmd1"),
+        ("Iface1", "Cmd2"),
+    ]
+    assert index.commands_using_type("Bits7") == ()
+    assert "Array2_Bits64" in index.type_names()
+
+    with pytest.raises(ValueError, match="interface names contains duplicate"):
+        ModelIndex([interfaces[0], interfaces[0]])
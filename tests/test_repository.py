@@ -0,0 +1,130 @@
+"""Test cases for the repository module."""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from my_data_model import io
+from my_data_model.corpus import CorpusSpec
+from my_data_model.corpus import write_corpus
+from my_data_model.repository import DEFAULT_INDEX_NAME
+from my_data_model.repository import IndexEntry
+from my_data_model.repository import ModelRepository
+
+
+ALIAS_SOURCE = """\
+# Types é
+- !types.Bits &bits {name: Bits8, description: Octet é, width: 8}
+- !commands.CommandValue
+  name: in0
+  description: Input
+  type: *bits
+"""
+"""Source in which an object refers to an anchor outside its node, and which
+has non-ASCII characters before the objects."""
+
+BAD_TAG_SOURCE = """\
+- !types.Bits {name: Bits8, description: Octet, width: 8}
+- !commands.Foo {name: Foo, description: Misspelt}
+"""
+"""Source in which an object has a tag which names no class."""
+
+
+@pytest.mark.parametrize("backend", io.BACKENDS)
+def test_repository(tmp_path: Path, backend: str) -> None:
+    """Test that objects are found and loaded individually."""
+    corpus = write_corpus(
+        directory=tmp_path, spec=CorpusSpec(commands=5, inputs=2, depth=2)
+    )
+    with open(corpus.root) as stream:
+        expected = io.load(stream=stream, include_cache=None)
+
+    repository = ModelRepository(tmp_path, backend=backend, include_cache=None)
+    assert (tmp_path / DEFAULT_INDEX_NAME).is_file()
+    assert len(repository) == len(list(repository))
+
+    (entry,) = repository.find("Cmd3")
+    assert entry == IndexEntry(
+        tag="!commands.Command",
+        name="Cmd3",
+        path=entry.path,
+        start=0,
+        end=os.path.getsize(tmp_path / entry.path),
+    )
+    assert repository.get("Cmd3") == expected.commands[3]
+    assert repository.get("Iface0", tag="!interfaces.Interface") == expected
+
+    # Nested objects are loaded from the text of their node
+    array = expected.commands[0].inputs["X1"].type.type
+    (entry,) = repository.find(array.name, tag="!types.Array")
+    assert repository.load(entry) == array
+    assert repository.find(array.name, tag="!types.Bits") == []
+
+    with pytest.raises(KeyError):
+        repository.get("Cmd9")
+    with pytest.raises(ValueError, match="'in0' is ambiguous"):
+        repository.get("in0")
+
+
+def test_repository_refresh(tmp_path: Path) -> None:
+    """Test that only changed files are scanned again."""
+    write_corpus(directory=tmp_path, spec=CorpusSpec(commands=3, inputs=1))
+    index_path = tmp_path / "index.json"
+    repository = ModelRepository(tmp_path, index_path=index_path)
+    assert repository.refresh() == set()
+
+    # The index is read from disk, and is used while it is current
+    assert ModelRepository(tmp_path, index_path=index_path).refresh() == set()
+    with open(index_path) as stream:
+        assert set(json.load(stream)["files"]) == {
+            path.relative_to(tmp_path).as_posix() for path in tmp_path.glob("**/*.yaml")
+        }
+
+    (entry,) = repository.find("Cmd1")
+    with open(tmp_path / entry.path) as stream:
+        source = stream.read()
+    with open(tmp_path / entry.path, "w") as stream:
+        stream.write(source.replace("Cmd1", "Renamed"))
+    os.remove(tmp_path / repository.find("Cmd2")[0].path)
+
+    repository = ModelRepository(tmp_path, index_path=index_path)
+    assert repository.find("Cmd1") == []
+    assert repository.find("Cmd2") == []
+    assert repository.get("Renamed").name == "Renamed"
+
+    # An index for another package is rebuilt
+    package = "my_data_model.models_columnar"
+    repository = ModelRepository(tmp_path, package=package, index_path=index_path)
+    with open(index_path) as stream:
+        assert json.load(stream)["package"] == package
+    assert repository.get("Renamed").name == "Renamed"
+
+
+@pytest.mark.parametrize("backend", io.BACKENDS)
+def test_repository_alias(tmp_path: Path, backend: str) -> None:
+    """Test loading an object which refers to an anchor outside its node."""
+    with open(tmp_path / "model.yaml", "w", encoding="utf-8") as stream:
+        stream.write(ALIAS_SOURCE)
+    with open(tmp_path / "model.yaml", encoding="utf-8") as stream:
+        expected = io.load(stream=stream)
+
+    repository = ModelRepository(tmp_path, backend=backend)
+    assert [entry.name for entry in repository] == ["Bits8", "in0"]
+    assert repository.get("Bits8") == expected[0]
+    assert repository.get("in0") == expected[1]
+
+
+def test_repository_bad_tag(tmp_path: Path) -> None:
+    """Test that a file with a tag which names no class is indexed."""
+    (tmp_path / "model.yaml").write_text(BAD_TAG_SOURCE)
+
+    repository = ModelRepository(tmp_path)
+    assert [(entry.tag, entry.name) for entry in repository] == [
+        ("!types.Bits", "Bits8"),
+        ("!commands.Foo", "Foo"),
+    ]
+    assert repository.get("Bits8").width == 8
+    with pytest.raises(AttributeError, match="Foo"):
+        repository.get("Foo")
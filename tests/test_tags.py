@@ -0,0 +1,57 @@
+"""Test cases for the tags module."""
+
+import pytest
+
+from my_data_model.models_attrs.commands import Command
+from my_data_model.models_attrs.commands import CommandValue
+from my_data_model.tags import TagRegistry
+from my_data_model.tags import get_tag_registry
+
+
+PACKAGE = "my_data_model.models_attrs"
+"""Package used for test purposes."""
+
+
+def test_resolve() -> None:
+    """Test resolution of tags to classes."""
+    registry = TagRegistry(PACKAGE)
+    assert registry.resolve("!commands.Command") is Command
+    assert registry.resolve("!commands.Command") is Command
+    assert registry.resolve("tag:yaml.org,2002:map") is None
+
+
+def test_register() -> None:
+    """Test explicit registration of a tag."""
+    registry = TagRegistry(PACKAGE)
+    registry.register("!Alias", Command)
+    assert registry.resolve("!Alias") is Command
+
+
+def test_register_module() -> None:
+    """Test registration of all classes in a module."""
+    registry = TagRegistry(PACKAGE)
+    registry.register_module("commands")
+    registry.freeze()
+    assert registry.resolve("!commands.Command") is Command
+    assert registry.resolve("!commands.CommandValue") is CommandValue
+    with pytest.raises(ValueError, match="'!commands.GeneralType' is not registered"):
+        registry.resolve("!commands.GeneralType")
+
+
+def test_freeze() -> None:
+    """Test that a frozen registry rejects new tags."""
+    registry = TagRegistry(PACKAGE)
+    assert registry.resolve("!commands.Command") is Command
+    registry.freeze()
+    assert registry.frozen
+    assert registry.resolve("!commands.Command") is Command
+    with pytest.raises(ValueError, match="'!types.Address' is not registered"):
+        registry.resolve("!types.Address")
+    with pytest.raises(RuntimeError, match="is frozen"):
+        registry.register("!types.Address", Command)
+
+
+def test_get_tag_registry() -> None:
+    """Test that registries are shared per package."""
+    assert get_tag_registry(PACKAGE) is get_tag_registry(PACKAGE)
+    assert get_tag_registry(PACKAGE) is not get_tag_registry(f"{PACKAGE}.foo")
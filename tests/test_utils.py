@@ -0,0 +1,37 @@
+"""Test cases for the utils module."""
+
+import pytest
+
+from my_data_model.utils import check_iterable_no_dups
+from my_data_model.utils import index_no_dups
+
+
+def test_check_iterable_no_dups() -> None:
+    """Test that duplicates are found in any iterable."""
+    check_iterable_no_dups(name="names", data=[])
+    check_iterable_no_dups(name="names", data=(name for name in "abc"))
+
+
+@pytest.mark.parametrize(
+    "data, dups",
+    [
+        ("aab", "a"),
+        ("abcbda", "a, b"),
+        ("xyzzyq", "y, z"),
+        ("abcdeffedx", "d, e, f"),
+    ],
+)
+def test_check_iterable_no_dups_fails(data: str, dups: str) -> None:
+    """Test that every duplicate is reported, in order of first appearance."""
+    with pytest.raises(ValueError, match=f"^names contains duplicate values: {dups}$"):
+        check_iterable_no_dups(name="names", data=(name for name in data))
+
+
+def test_index_no_dups() -> None:
+    """Test that values are indexed by unique keys."""
+    assert index_no_dups(name="names", data=[]) == {}
+    assert index_no_dups(
+        name="names", data=((name, index) for index, name in enumerate("abc"))
+    ) == {"a": 0, "b": 1, "c": 2}
+    with pytest.raises(ValueError, match="^names contains duplicate values: b, c$"):
+        index_no_dups(name="names", data=((name, None) for name in "abcbcd"))
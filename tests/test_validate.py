@@ -0,0 +1,173 @@
+"""Test cases for the validate module."""
+
+from pathlib import Path
+from typing import List
+
+import pytest
+import yaml
+
+from my_data_model.cache import INCLUDE_CACHE
+from my_data_model.validate import Issue
+from my_data_model.validate import check_document
+from my_data_model.validate import count_nodes
+from my_data_model.validate import validate
+
+
+def make_corpus(tmp_path: Path) -> List[Path]:
+    """Write a corpus of files, one of which is invalid."""
+    (tmp_path / "Bits8.yaml").write_text(
+        "!types.Bits\nname: Bits8\ndescription: A byte\nwidth: 8\n"
+    )
+    paths = []
+    for index in range(0, 6):
+        path = tmp_path / f"Cmd{index}.yaml"
+        path.write_text(
+            f"""\
+!commands.Command
+name: Cmd{index}
+description: Command {index}
+inputs:
+  X0: !commands.CommandValue
+    name: in
+    description: Input
+    type: !include Bits8.yaml
+"""
+        )
+        paths.append(path)
+    (tmp_path / "Cmd3.yaml").write_text("!commands.Command\nname: Cmd3\n")
+    return paths
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_validate(tmp_path: Path, jobs: int) -> None:
+    """Test validation of a corpus of files."""
+    paths = make_corpus(tmp_path)
+    INCLUDE_CACHE.clear()
+    report = validate(paths=paths, jobs=jobs, warm=[tmp_path / "Bits8.yaml"])
+
+    assert [result.path for result in report.files] == [str(path) for path in paths]
+    assert report.nodes == 5 * 15 + 3
+    assert report.files_per_second > 0
+    assert report.nodes_per_second > 0
+
+    [issue] = report.issues
+    assert issue.path == str(tmp_path / "Cmd3.yaml")
+    assert issue.line == 1
+    assert issue.column == 1
+    assert issue.message.startswith("failed to create")
+
+    # Every include hits the pre-warmed cache; workers have their own caches
+    if jobs == 1:
+        assert INCLUDE_CACHE.hits > 0
+        assert INCLUDE_CACHE.misses == 1
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_validate_bad_warm(
+    tmp_path: Path, jobs: int, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test that a file which cannot be warmed does not stop validation."""
+    paths = make_corpus(tmp_path)
+    (tmp_path / "Bits8.yaml").write_text("!types.Bits\nname: Bits8\nwidth: 0\n")
+    report = validate(paths=paths, jobs=jobs, warm=[tmp_path / "Bits8.yaml"])
+
+    # Each file which includes it fails, as does the file which was invalid
+    assert len(report.issues) == len(paths)
+    if jobs == 1:
+        assert "cannot warm the include cache" in caplog.text
+
+
+def test_validate_unmarked_error(tmp_path: Path) -> None:
+    """Test validation of a file which fails without a YAML mark."""
+    path = tmp_path / "bad.yaml"
+    path.write_text("!commands.Foo\nname: foo\n")
+    [issue] = validate(paths=[path], jobs=1).issues
+    assert str(issue) == f"{path}: module 'my_data_model.models_attrs.commands'" + (
+        " has no attribute 'Foo'"
+    )
+
+
+def test_count_nodes() -> None:
+    """Test counting of nodes."""
+    assert count_nodes(None) == 0
+    assert count_nodes(yaml.compose("[&a {x: 1}, *a]")) == 4
+
+
+def test_issue_str() -> None:
+    """Test formatting of issues."""
+    assert str(Issue(path="a", line=2, column=3, message="m")) == "a:2:3: m"
+    assert str(Issue(path="a", line=None, column=None, message="m")) == "a: m"
+
+
+def test_validate_many_documents(tmp_path: Path) -> None:
+    """Test validation of a file containing many documents."""
+    path = tmp_path / "types.yaml"
+    path.write_text(
+        "".join(
+            f"--- !types.Bits\nname: B{index}\ndescription: B\nwidth: {3 - index}\n"
+            for index in range(0, 4)
+        )
+    )
+    report = validate(paths=[path], jobs=1)
+    assert report.nodes == 4 * 7
+    [issue] = report.issues
+    assert (issue.line, issue.column) == (13, 5)
+    assert "width is not positive" in issue.message
+
+
+BATCH_SOURCE = """\
+!interfaces.Interface
+name: iface
+commands:
+- !commands.Command
+  name: cmd
+  description: Command
+  inputs:
+    X0: !commands.CommandValue
+      name: in
+      description: Input
+      type: !types.Bits {name: B0, description: B, width: 0}
+    X1: !commands.CommandValue
+      name: in
+      description: Input
+      type: !types.Array
+        name: A
+        description: A
+        size: -1
+        type: !types.Foo {name: B8, description: B, width: 8}
+- !commands.Command {name: cmd, description: Command, inputs: {}}
+- !types.Address {name: A, description: A, width: "8"}
+"""
+"""Source with a problem of every kind found by batch checks."""
+
+
+def test_check_document() -> None:
+    """Test that batch checks report every problem, at its mark."""
+    issues = check_document(node=yaml.compose(BATCH_SOURCE), path="source.yaml")
+    assert [(issue.line, issue.column, issue.message) for issue in issues] == [
+        (11, 59, "width is not positive"),
+        (13, 13, "input value names contains duplicate values: in"),
+        (18, 15, "size is negative"),
+        (
+            19,
+            15,
+            "unknown tag '!types.Foo': module 'my_data_model.models_attrs.types'"
+            " has no attribute 'Foo'",
+        ),
+        (20, 28, "command names contains duplicate values: cmd"),
+        (21, 44, "'width' must be an integer"),
+    ]
+    assert {issue.path for issue in issues} == {"source.yaml"}
+    assert check_document(node=None, path="source.yaml") == []
+
+
+def test_validate_batch(tmp_path: Path) -> None:
+    """Test that batch validation reports all problems in each document."""
+    path = tmp_path / "bad.yaml"
+    path.write_text(BATCH_SOURCE + "--- !types.Bits {name: B, description: B}\n")
+    assert len(validate(paths=[path], jobs=1).issues) == 1
+
+    issues = validate(paths=[path], jobs=1, batch=True).issues
+    assert len(issues) == 7
+    assert {issue.path for issue in issues} == {str(path)}
+    assert issues[-1].message.startswith("failed to create")
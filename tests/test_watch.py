@@ -0,0 +1,74 @@
+"""Test cases for the watch module."""
+
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any
+from typing import Callable
+
+import pytest
+
+from my_data_model.watch import InotifyWatcher
+from my_data_model.watch import PollingWatcher
+from my_data_model.watch import Watcher
+from my_data_model.watch import make_watcher
+
+
+LINUX = sys.platform.startswith("linux")
+"""Whether inotify is available."""
+
+
+def later(func: Callable[[], Any]) -> threading.Thread:
+    """Call a function in a background thread, after a short delay."""
+
+    def target() -> None:
+        time.sleep(0.2)
+        func()
+
+    thread = threading.Thread(target=target)
+    thread.start()
+    return thread
+
+
+@pytest.mark.parametrize(
+    "make",
+    [
+        lambda path: PollingWatcher(path, interval=0.05),
+        pytest.param(
+            InotifyWatcher,
+            marks=pytest.mark.skipif(not LINUX, reason="inotify requires Linux"),
+        ),
+    ],
+)
+def test_watcher(tmp_path: Path, make: Callable[[Path], Watcher]) -> None:
+    """Test that watchers report created, modified and deleted YAML files."""
+    (tmp_path / "a.yaml").write_text("a")
+    with make(tmp_path) as watcher:
+        assert watcher.wait(timeout=0.1) == set()
+
+        thread = later(lambda: (tmp_path / "sub").mkdir())
+        assert watcher.wait(timeout=0.5) == set()
+        thread.join()
+
+        thread = later(lambda: (tmp_path / "sub" / "b.yaml").write_text("b"))
+        assert watcher.wait(timeout=5) == {str(tmp_path / "sub" / "b.yaml")}
+        thread.join()
+
+        thread = later(lambda: (tmp_path / "a.yaml").write_text("aa"))
+        assert watcher.wait(timeout=5) == {str(tmp_path / "a.yaml")}
+        thread.join()
+
+        thread = later(lambda: (tmp_path / "a.yaml").unlink())
+        assert watcher.wait(timeout=5) == {str(tmp_path / "a.yaml")}
+        thread.join()
+
+
+def test_make_watcher_fallback(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test fallback to polling if inotify is not available."""
+    expected = InotifyWatcher if LINUX else PollingWatcher
+    assert isinstance(make_watcher(tmp_path), expected)
+    monkeypatch.setattr(sys, "platform", "darwin")
+    assert isinstance(make_watcher(tmp_path), PollingWatcher)